@@ -1,24 +1,83 @@
 """
 Binance API Client
 """
-import hashlib
 import hmac
 import time
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from urllib.parse import urlencode
+from typing import Dict, Any, Callable, Optional, List, Tuple
 import aiohttp
+import numpy as np
+from src.adapters.external.http_session import get_session
+from src.adapters.external.response_cache import get_response_cache
+from src.adapters.external.retry import call_with_retry
 from src.config.settings import get_settings
+from src.utilities import json_io
 from src.utilities.logger import get_logger
 from src.error_trace.exceptions import ExternalAPIError
 
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Kline row: open time, open, high, low, close, volume, close time,
+# quote volume, trade count, taker base volume, taker quote volume, ignore
+KlineRow = Tuple[int, str, str, str, str, str, int, str, int, str, str, str]
+
+# Typed decoder for the fixed-shape klines payload - skips generic dict/list
+# dispatch when msgspec is installed, falls back to plain JSON otherwise
+_KLINES_DECODER = msgspec.json.Decoder(List[KlineRow]).decode if HAS_MSGSPEC else None
+
+# Kline fields returned by get_klines_ndarray, in column order
+KLINE_VALUE_COLUMNS = ("open", "high", "low", "close", "volume", "quote_volume")
+_KLINE_VALUE_INDICES = [1, 2, 3, 4, 5, 7]
+
+_DECODE_ERRORS = (
+    (json_io.JSONDecodeError, msgspec.DecodeError) if HAS_MSGSPEC else (json_io.JSONDecodeError,)
+)
+
+# Deletion table for pair separators ("BTC/USDT" -> "BTCUSDT")
+_SYMBOL_TRANS = str.maketrans("", "", "/")
+
+
+def _error_payload(body: bytes) -> Dict[str, Any]:
+    """
+    Decode an error response body
+
+    Binance's WAF (403) and IP-ban (418) pages are HTML rather than JSON;
+    those keep a short prefix of the body as the message so the error still
+    carries its status code instead of looking like a connection failure.
+    """
+    try:
+        data = json_io.loads(body)
+    except _DECODE_ERRORS:
+        data = None
+    if isinstance(data, dict):
+        return data
+    return {"msg": body[:200].decode("utf-8", "replace")}
+
+
+@lru_cache(maxsize=2048)
+def _canon_symbol(symbol: str) -> str:
+    """Convert a trading pair to Binance's canonical symbol form (memoized)"""
+    return symbol.upper().translate(_SYMBOL_TRANS)
+
 
 class BinanceClient:
     """Client for Binance API"""
     
     BASE_URL = "https://api.binance.com"
     
+    # TTLs (seconds) for public GET endpoints whose data changes slowly
+    CACHE_TTLS = {
+        "/api/v3/exchangeInfo": 3600
+    }
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -26,59 +85,87 @@ class BinanceClient:
     ):
         self.api_key = api_key or settings.binance_api_key
         self.api_secret = api_secret or settings.binance_api_secret
-        self.session: Optional[aiohttp.ClientSession] = None
+        # Encode the secret once instead of on every signed request
+        self._hmac_key = self.api_secret.encode('utf-8')
+        self._headers = {"X-MBX-APIKEY": self.api_key} if self.api_key else {}
     
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit (shared session stays open)"""
+        pass
     
-    def _generate_signature(self, params: Dict[str, Any]) -> str:
-        """Generate HMAC SHA256 signature"""
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+    def _generate_signature(self, query_string: bytes) -> str:
+        """Generate HMAC SHA256 signature of an encoded query string"""
+        # hmac.digest takes OpenSSL's one-shot path (no HMAC object wrapper);
+        # OpenSSL picks its SHA-NI / ARMv8 SHA-256 kernels at runtime via CPUID,
+        # so no separate accelerated backend is needed here
+        return hmac.digest(self._hmac_key, query_string, 'sha256').hex()
     
     async def _request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict] = None,
-        signed: bool = False
+        signed: bool = False,
+        decoder: Optional[Callable[[bytes], Any]] = None
     ) -> Dict[str, Any]:
         """Make API request"""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-        
         url = f"{self.BASE_URL}{endpoint}"
-        headers = {"X-MBX-APIKEY": self.api_key} if self.api_key else {}
         params = params or {}
         
-        # Add signature for signed endpoints
+        # Serve slow-changing public endpoints from the response cache
+        cache_ttl = self.CACHE_TTLS.get(endpoint) if method == "GET" and not signed else None
+        if cache_ttl:
+            cache_key = get_response_cache().make_key(url, params)
+            cached = get_response_cache().get(cache_key)
+            if cached is not None:
+                return cached
+        
+        # Sign the exact query string that goes on the wire, so the signed
+        # payload and the request can't diverge in ordering or escaping
         if signed:
             params['timestamp'] = int(time.time() * 1000)
-            params['signature'] = self._generate_signature(params)
+            query_string = urlencode(params, doseq=True)
+            signature = self._generate_signature(query_string.encode('utf-8'))
+            url = f"{url}?{query_string}&signature={signature}"
+            params = None
+        
+        # Only GETs are idempotent - never replay an order placement
+        data = await call_with_retry(
+            "binance",
+            lambda: self._send(method, url, params, decoder),
+            attempts=4 if method == "GET" else 1
+        )
+        
+        if cache_ttl:
+            get_response_cache().set(cache_key, data, cache_ttl)
+        
+        return data
+    
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        decoder: Optional[Callable[[bytes], Any]] = None
+    ) -> Dict[str, Any]:
+        """Perform a single HTTP request and decode the JSON body"""
+        session = await get_session()
         
         try:
-            async with self.session.request(
+            async with session.request(
                 method,
                 url,
                 params=params,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=30)
+                headers=self._headers
             ) as response:
-                data = await response.json()
+                body = await response.read()
                 
                 if response.status != 200:
+                    data = _error_payload(body)
                     raise ExternalAPIError(
                         message=f"Binance API error: {data.get('msg', 'Unknown error')}",
                         api_name="binance",
@@ -86,9 +173,9 @@ class BinanceClient:
                         response_data=data
                     )
                 
-                return data
+                return decoder(body) if decoder else json_io.loads(body)
                 
-        except aiohttp.ClientError as e:
+        except (aiohttp.ClientError, *_DECODE_ERRORS) as e:
             logger.error(f"Binance API request error: {str(e)}")
             raise ExternalAPIError(
                 message=f"Binance connection error: {str(e)}",
@@ -106,7 +193,7 @@ class BinanceClient:
             Price data
         """
         endpoint = "/api/v3/ticker/price"
-        params = {"symbol": symbol.upper().replace("/", "")}
+        params = {"symbol": _canon_symbol(symbol)}
         return await self._request("GET", endpoint, params)
     
     async def get_24h_ticker(self, symbol: str) -> Dict[str, Any]:
@@ -120,7 +207,7 @@ class BinanceClient:
             24h statistics
         """
         endpoint = "/api/v3/ticker/24hr"
-        params = {"symbol": symbol.upper().replace("/", "")}
+        params = {"symbol": _canon_symbol(symbol)}
         return await self._request("GET", endpoint, params)
     
     async def get_klines(
@@ -128,7 +215,7 @@ class BinanceClient:
         symbol: str,
         interval: str = "1d",
         limit: int = 100
-    ) -> List[List]:
+    ) -> List[KlineRow]:
         """
         Get candlestick data
         
@@ -142,16 +229,49 @@ class BinanceClient:
         """
         endpoint = "/api/v3/klines"
         params = {
-            "symbol": symbol.upper().replace("/", ""),
+            "symbol": _canon_symbol(symbol),
             "interval": interval,
             "limit": limit
         }
-        return await self._request("GET", endpoint, params)
+        return await self._request("GET", endpoint, params, decoder=_KLINES_DECODER)
+    
+    async def get_klines_ndarray(
+        self,
+        symbol: str,
+        interval: str = "1d",
+        limit: int = 100
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get candlestick data as NumPy arrays
+        
+        Converts the row-per-candle payload once at the client boundary so
+        numeric consumers can vectorize instead of unboxing every field.
+        
+        Args:
+            symbol: Trading pair
+            interval: Timeframe (1m, 5m, 1h, 1d, etc.)
+            limit: Number of candles
+            
+        Returns:
+            Tuple of (open times in ms as int64 of shape (n,), float64 values of
+            shape (n, 6) with columns in KLINE_VALUE_COLUMNS order)
+        """
+        klines = await self.get_klines(symbol, interval=interval, limit=limit)
+        if not klines:
+            return (
+                np.empty(0, dtype=np.int64),
+                np.empty((0, len(KLINE_VALUE_COLUMNS)), dtype=np.float64)
+            )
+        
+        raw = np.asarray(klines, dtype=object)
+        open_times = raw[:, 0].astype(np.int64)
+        values = raw[:, _KLINE_VALUE_INDICES].astype(np.float64)
+        return open_times, values
     
     async def get_exchange_info(self, symbol: Optional[str] = None) -> Dict[str, Any]:
         """Get exchange trading rules and symbol information"""
         endpoint = "/api/v3/exchangeInfo"
-        params = {"symbol": symbol.upper().replace("/", "")} if symbol else {}
+        params = {"symbol": _canon_symbol(symbol)} if symbol else {}
         return await self._request("GET", endpoint, params)
     
     async def get_account(self) -> Dict[str, Any]:
@@ -1,27 +1,57 @@
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping, Hashable
+import asyncio
 import aiohttp
 import os
 import sys
 try:
+    from src.adapters.external.http_session import get_session, read_json
+    from src.adapters.external.response_cache import get_response_cache
+    from src.adapters.external.retry import call_with_retry
     from src.config.settings import get_settings
+    from src.utilities import json_io
     from src.utilities.logger import get_logger
     from src.error_trace.exceptions import ExternalAPIError
 except ModuleNotFoundError:
     # Allow running this module directly (e.g. `python src/adapters/external/coingecko_client.py`)
     # by adding the repository root (parent of `src`) to `sys.path` and retrying imports.
-    import sys
-    import os
-
     _repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
     if _repo_root not in sys.path:
         sys.path.insert(0, _repo_root)
 
+    from src.adapters.external.http_session import get_session, read_json
+    from src.adapters.external.response_cache import get_response_cache
+    from src.adapters.external.retry import call_with_retry
     from src.config.settings import get_settings
+    from src.utilities import json_io
     from src.utilities.logger import get_logger
     from src.error_trace.exceptions import ExternalAPIError
 
 logger = get_logger(__name__)
 
+# Common ticker symbols mapped to CoinGecko coin IDs
+_SYMBOL_MAP: Mapping[str, str] = MappingProxyType({
+    "BTC": "bitcoin",
+    "ETH": "ethereum",
+    "BNB": "binancecoin",
+    "ADA": "cardano",
+    "SOL": "solana",
+    "XRP": "ripple",
+    "DOT": "polkadot",
+    "DOGE": "dogecoin",
+    "AVAX": "avalanche-2",
+    "MATIC": "matic-network",
+    "LINK": "chainlink",
+    "UNI": "uniswap"
+})
+
+
+@lru_cache(maxsize=512)
+def _normalize_symbol(symbol: str) -> str:
+    """Map a ticker symbol to its CoinGecko coin ID (memoized)"""
+    return _SYMBOL_MAP.get(symbol.upper(), symbol.lower())
+
 # Defer loading application Settings until the client is instantiated.
 # Also support loading a local `.env` file from the repository root so
 # running this module directly picks up keys stored there.
@@ -63,6 +93,15 @@ class CoinGeckoClient:
     
     BASE_URL = "https://pro-api.coingecko.com/api/v3"
     
+    # TTLs (seconds) keyed by endpoint suffix for data that changes slowly
+    CACHE_TTLS = {
+        "/search/trending": 120,
+        "/global": 60,
+        "/simple/price": 15,
+        "/market_chart": 300,
+        "/coins/list": 3600
+    }
+    
     def __init__(self, api_key: Optional[str] = None):
         if api_key is not None:
             self.api_key = api_key
@@ -75,18 +114,19 @@ class CoinGeckoClient:
                 # If settings validation fails or is unavailable, fall back
                 # to None — CoinGecko public endpoints still work without a key.
                 self.api_key = None
-
-        self.session: Optional[aiohttp.ClientSession] = None
+        
+        self._headers = {"x-cg-pro-api-key": self.api_key} if self.api_key else {}
+        
+        # Tasks for requests currently on the wire, keyed like the cache
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
     
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit (shared session stays open)"""
+        pass
     
     async def _request(
         self,
@@ -94,21 +134,56 @@ class CoinGeckoClient:
         params: Optional[Dict] = None
     ) -> Any:
         """Make API request"""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-        
         url = f"{self.BASE_URL}{endpoint}"
-        headers = {}
+        request_key = get_response_cache().make_key(url, params)
         
-        if self.api_key:
-            headers["x-cg-pro-api-key"] = self.api_key
+        # Serve slow-changing endpoints from the response cache
+        cache_ttl = self._cache_ttl(endpoint)
+        if cache_ttl:
+            cached = get_response_cache().get(request_key)
+            if cached is not None:
+                return cached
+        
+        # Coalesce concurrent identical requests onto one in-flight task.
+        # Every caller awaits it through shield(), so cancelling one caller
+        # (even the one that started it) leaves the fetch running for the rest
+        task = self._inflight.get(request_key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_with_retry(url, params, request_key, cache_ttl))
+            self._inflight[request_key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(request_key, done))
+        return await asyncio.shield(task)
+    
+    async def _fetch_with_retry(
+        self,
+        url: str,
+        params: Optional[Dict],
+        request_key: Hashable,
+        cache_ttl: Optional[int]
+    ) -> Any:
+        """Fetch with retries and store the result in the response cache"""
+        data = await call_with_retry("coingecko", lambda: self._fetch(url, params))
+        if cache_ttl:
+            get_response_cache().set(request_key, data, cache_ttl)
+        return data
+    
+    def _forget_inflight(self, request_key: Hashable, task: asyncio.Task) -> None:
+        """Done-callback: drop a finished in-flight task"""
+        if self._inflight.get(request_key) is task:
+            del self._inflight[request_key]
+        # Mark the error retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+    
+    async def _fetch(self, url: str, params: Optional[Dict] = None) -> Any:
+        """Perform the HTTP GET and decode the JSON body"""
+        session = await get_session()
         
         try:
-            async with self.session.get(
+            async with session.get(
                 url,
                 params=params,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=30)
+                headers=self._headers
             ) as response:
                 
                 if response.status == 429:
@@ -126,15 +201,22 @@ class CoinGeckoClient:
                         status_code=response.status
                     )
                 
-                return await response.json()
+                return await read_json(response)
                 
-        except aiohttp.ClientError as e:
+        except (aiohttp.ClientError, json_io.JSONDecodeError) as e:
             logger.error(f"CoinGecko API request error: {str(e)}")
             raise ExternalAPIError(
                 message=f"CoinGecko connection error: {str(e)}",
                 api_name="coingecko"
             )
     
+    def _cache_ttl(self, endpoint: str) -> Optional[int]:
+        """Get the response cache TTL for an endpoint, if it is cacheable"""
+        for suffix, ttl in self.CACHE_TTLS.items():
+            if endpoint.endswith(suffix):
+                return ttl
+        return None
+    
     async def get_coin_data(self, coin_id: str) -> Dict[str, Any]:
         """
         Get comprehensive data for a coin
@@ -430,22 +512,7 @@ class CoinGeckoClient:
         Returns:
             CoinGecko coin ID
         """
-        mapping = {
-            "BTC": "bitcoin",
-            "ETH": "ethereum",
-            "BNB": "binancecoin",
-            "ADA": "cardano",
-            "SOL": "solana",
-            "XRP": "ripple",
-            "DOT": "polkadot",
-            "DOGE": "dogecoin",
-            "AVAX": "avalanche-2",
-            "MATIC": "matic-network",
-            "LINK": "chainlink",
-            "UNI": "uniswap"
-        }
-        return mapping.get(symbol.upper(), symbol.lower())
-
+        return _normalize_symbol(symbol)
 
 if __name__ == "__main__":
     """
@@ -462,8 +529,6 @@ if __name__ == "__main__":
     minimal and meant for local experimentation.
     """
 
-    import asyncio
-
     async def _example():
         async with CoinGeckoClient() as client:
             # Get simple price for bitcoin and ethereum in USD
@@ -4,7 +4,10 @@ FRED (Federal Reserve Economic Data) API Client
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 import aiohttp 
+from src.adapters.external.http_session import get_session, read_json
+from src.adapters.external.retry import call_with_retry
 from src.config.settings import get_settings
+from src.utilities import json_io
 from src.utilities.logger import get_logger
 from src.error_trace.exceptions import ExternalAPIError
 
@@ -33,17 +36,14 @@ class FREDClient:
     
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or settings.fred_api_key
-        self.session: Optional[aiohttp.ClientSession] = None
     
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit (shared session stays open)"""
+        pass
     
     async def _request(
         self,
@@ -57,19 +57,21 @@ class FREDClient:
                 api_name="fred"
             )
         
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-        
         url = f"{self.BASE_URL}/{endpoint}"
         params = params or {}
         params["api_key"] = self.api_key
         params["file_type"] = "json"
         
+        return await call_with_retry("fred", lambda: self._fetch(url, params))
+    
+    async def _fetch(self, url: str, params: Dict) -> Dict[str, Any]:
+        """Perform the HTTP GET and decode the JSON body"""
+        session = await get_session()
+        
         try:
-            async with self.session.get(
+            async with session.get(
                 url,
-                params=params,
-                timeout=aiohttp.ClientTimeout(total=30)
+                params=params
             ) as response:
                 
                 if response.status != 200:
@@ -80,9 +82,9 @@ class FREDClient:
                         status_code=response.status
                     )
                 
-                return await response.json()
+                return await read_json(response)
                 
-        except aiohttp.ClientError as e:
+        except (aiohttp.ClientError, json_io.JSONDecodeError) as e:
             logger.error(f"FRED API request error: {str(e)}")
             raise ExternalAPIError(
                 message=f"FRED connection error: {str(e)}",
@@ -0,0 +1,83 @@
+"""
+Shared aiohttp Session for External API Clients
+"""
+import asyncio
+import weakref
+from typing import Any, Optional
+import aiohttp
+from src.utilities import json_io
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Applied to every request made through the shared session, so clients don't
+# build a ClientTimeout per call
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10, sock_read=20)
+
+# Ask upstream APIs for compressed JSON; aiohttp decompresses transparently
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": "MarketSenseAI/1.0"
+}
+
+# One session per running event loop - aiohttp sessions are bound to the loop
+# that created them, and scripts/tests may run several loops in one process.
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Get the shared client session for the running event loop
+
+    The session is created lazily and reused across clients and calls so the
+    connection pool, keep-alive connections and DNS cache survive between
+    requests.
+
+    Returns:
+        Shared aiohttp client session
+    """
+    loop = asyncio.get_running_loop()
+    session: Optional[aiohttp.ClientSession] = _sessions.get(loop)
+
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            timeout=DEFAULT_TIMEOUT,
+            headers=DEFAULT_HEADERS,
+            auto_decompress=True,
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            )
+        )
+        _sessions[loop] = session
+        logger.info("Created shared HTTP session for external clients")
+
+    return session
+
+
+async def close_session() -> None:
+    """Close the shared client session for the running event loop"""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session and not session.closed:
+        await session.close()
+        logger.info("Closed shared HTTP session")
+
+
+async def read_json(response: aiohttp.ClientResponse) -> Any:
+    """
+    Decode a JSON response body
+
+    Reads the raw body bytes and hands them straight to the JSON parser,
+    skipping aiohttp's intermediate text decode.
+
+    Args:
+        response: aiohttp response
+
+    Returns:
+        Decoded JSON payload
+    """
+    return json_io.loads(await response.read())
@@ -1,15 +1,51 @@
 # src/adapters/external/newsapi_client.py
 import json
+import re
 import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
 from src.utilities.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Title keywords that mark an Investing.com headline as crypto-related
+CRYPTO_KEYWORDS = ('crypto', 'bitcoin', 'ethereum', 'eth', 'btc', 'altcoin', 'defi', 'nft', 'blockchain')
+
+# Popular crypto assets tracked on Google Finance, with the headline
+# keywords used to attribute batched search results to each one
+FINANCE_ASSET_KEYWORDS = {
+    'Bitcoin': ('bitcoin', 'btc'),
+    'Ethereum': ('ethereum', 'ether', 'eth'),
+    'Cardano': ('cardano', 'ada'),
+    'Solana': ('solana', 'sol'),
+    'Ripple': ('ripple', 'xrp'),
+    'Binance Coin': ('binance coin', 'bnb'),
+    'Dogecoin': ('dogecoin', 'doge')
+}
+
+
+def _keyword_pattern(keywords: Tuple[str, ...]) -> re.Pattern:
+    """Compile a whole-word, case-insensitive matcher for any of the keywords"""
+    return re.compile(r"\b(?:" + "|".join(map(re.escape, keywords)) + r")\b", re.IGNORECASE)
+
+
+_FINANCE_ASSET_PATTERNS = {
+    asset: _keyword_pattern(keywords) for asset, keywords in FINANCE_ASSET_KEYWORDS.items()
+}
+
+# Results requested by search_finance_batch (SerpAPI's per-call maximum);
+# the per-asset cap is applied locally, so one busy asset can't use up the
+# result budget of the others
+FINANCE_BATCH_NUM = 100
+
+# Site restriction appended to every Serper query
+SERPER_SITE_FILTER = " OR ".join(f"site:{site}" for site in ('reddit.com', 'investing.com', 'sandmark.com'))
+
 
 class CryptoNewsScraper:
     def __init__(self, serper_api_key: str = None, serpapi_key: str = None):
@@ -23,6 +59,11 @@ class CryptoNewsScraper:
         self.serper_api_key = serper_api_key
         self.serpapi_key = serpapi_key
         self.session = requests.Session()
+        # Scrapes run in worker threads, so keep enough pooled keep-alive
+        # connections per host for them to share
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
@@ -101,6 +142,7 @@ class CryptoNewsScraper:
             
             # Find news items on Investing.com
             articles = soup.find_all('article') or soup.find_all('div', {'class': ['article', 'news-item']})
+            scraped_at = datetime.now().isoformat()
             
             for article in articles[:25]:
                 try:
@@ -109,14 +151,13 @@ class CryptoNewsScraper:
                     
                     # Filter for crypto-related content
                     title_text = title.get_text(strip=True).lower() if title else ""
-                    crypto_keywords = ['crypto', 'bitcoin', 'ethereum', 'eth', 'btc', 'altcoin', 'defi', 'nft', 'blockchain']
                     
-                    if link and title and any(keyword in title_text for keyword in crypto_keywords):
+                    if link and title and any(keyword in title_text for keyword in CRYPTO_KEYWORDS):
                         investing_news.append({
                             'source': 'Investing.com',
                             'title': title.get_text(strip=True),
                             'url': link.get('href', ''),
-                            'timestamp': datetime.now().isoformat(),
+                            'timestamp': scraped_at,
                             'snippet': article.get_text(strip=True)[:300],
                             'category': 'Crypto'
                         })
@@ -144,6 +185,7 @@ class CryptoNewsScraper:
             
             # Find articles/content on Sandmark crypto page
             articles = soup.find_all(['article', 'div'], {'class': ['news-item', 'article', 'market-item', 'deal']})
+            scraped_at = datetime.now().isoformat()
             
             for article in articles[:20]:
                 try:
@@ -156,7 +198,7 @@ class CryptoNewsScraper:
                             'source': 'Sandmark',
                             'title': title.get_text(strip=True),
                             'url': link.get('href', ''),
-                            'timestamp': datetime.now().isoformat(),
+                            'timestamp': scraped_at,
                             'snippet': article.get_text(strip=True)[:300],
                             'price': price_elem.get_text(strip=True) if price_elem else None,
                             'category': 'Crypto'
@@ -171,6 +213,80 @@ class CryptoNewsScraper:
         
         return sandmark_news
     
+    def search_finance_batch(self, assets: List[str] = None, per_asset: int = 10) -> Dict[str, List[Dict]]:
+        """
+        Search Google Finance news for a basket of assets with one SerpAPI call
+        
+        The assets are OR-ed into a single query and the results are bucketed
+        locally by which assets the title or snippet mentions, instead of
+        issuing one rate-limited request per asset. An item naming several
+        assets is filed under each of them.
+        
+        Args:
+            assets: Asset names (keys of FINANCE_ASSET_KEYWORDS)
+            per_asset: Maximum items kept per asset
+            
+        Returns:
+            Dict mapping asset name to its news items
+        """
+        assets = assets or list(FINANCE_ASSET_KEYWORDS)
+        buckets: Dict[str, List[Dict]] = {asset: [] for asset in assets}
+        
+        if not self.serpapi_key:
+            logger.warning("SerpAPI key not provided, skipping Google Finance scrape")
+            return buckets
+        
+        patterns = [
+            (asset, _FINANCE_ASSET_PATTERNS.get(asset) or _keyword_pattern((asset,)))
+            for asset in assets
+        ]
+        
+        params = {
+            "q": "(" + " OR ".join(f'"{asset}"' for asset in assets) + ") price news",
+            "type": "finance",
+            "api_key": self.serpapi_key,
+            "num": FINANCE_BATCH_NUM
+        }
+        
+        response = self.session.get("https://serpapi.com/search", params=params, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        scraped_at = datetime.now().isoformat()
+        
+        unmatched = over_cap = 0
+        for item in data.get('news', []):
+            title = item.get('title', '')
+            snippet = item.get('snippet', '')
+            text = f"{title} {snippet}"
+            
+            matched = [asset for asset, pattern in patterns if pattern.search(text)]
+            if not matched:
+                unmatched += 1
+                continue
+            
+            for asset in matched:
+                if len(buckets[asset]) >= per_asset:
+                    over_cap += 1
+                    continue
+                buckets[asset].append({
+                    'source': 'Google Finance',
+                    'title': title,
+                    'url': item.get('link', ''),
+                    'source_name': item.get('source', ''),
+                    'timestamp': item.get('date', scraped_at),
+                    'snippet': snippet[:300],
+                    'asset': asset,
+                    'category': 'Crypto'
+                })
+        
+        if unmatched or over_cap:
+            logger.info(
+                f"Google Finance batch: dropped {unmatched} items naming no tracked asset "
+                f"and {over_cap} over the {per_asset}-per-asset cap"
+            )
+        
+        return buckets
+    
     def scrape_google_finance_crypto(self) -> List[Dict]:
         """Scrape crypto market data from Google Finance via SerpAPI"""
         finance_news = []
@@ -180,41 +296,8 @@ class CryptoNewsScraper:
             return []
         
         try:
-            # Popular crypto assets to track
-            crypto_assets = ['Bitcoin', 'Ethereum', 'Cardano', 'Solana', 'Ripple', 'Binance Coin', 'Dogecoin']
-            
-            for asset in crypto_assets:
-                try:
-                    url = "https://serpapi.com/search"
-                    params = {
-                        "q": f"{asset} price news",
-                        "type": "finance",
-                        "api_key": self.serpapi_key,
-                        "num": 10
-                    }
-                    
-                    response = requests.get(url, params=params, timeout=10)
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    # Extract finance news
-                    if 'news' in data:
-                        for item in data['news']:
-                            finance_news.append({
-                                'source': 'Google Finance',
-                                'title': item.get('title', ''),
-                                'url': item.get('link', ''),
-                                'source_name': item.get('source', ''),
-                                'timestamp': item.get('date', datetime.now().isoformat()),
-                                'snippet': item.get('snippet', '')[:300],
-                                'asset': asset,
-                                'category': 'Crypto'
-                            })
-                    
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    logger.debug(f"Error fetching {asset}: {str(e)}")
+            buckets = self.search_finance_batch()
+            finance_news = [item for items in buckets.values() for item in items]
             
             logger.info(f"Fetched {len(finance_news)} items from Google Finance")
             
@@ -248,13 +331,16 @@ class CryptoNewsScraper:
         
         try:
             url = "https://google.serper.dev/search"
+            headers = {
+                "X-API-KEY": self.serper_api_key,
+                "Content-Type": "application/json"
+            }
+            scraped_at = datetime.now().isoformat()
             
             for query in queries:
                 try:
                     # Build search with site restrictions
-                    sites = ['reddit.com', 'investing.com', 'sandmark.com']
-                    site_query = " OR ".join([f"site:{site}" for site in sites])
-                    full_query = f"({query}) ({site_query})"
+                    full_query = f"({query}) ({SERPER_SITE_FILTER})"
                     
                     payload = {
                         "q": full_query,
@@ -262,12 +348,7 @@ class CryptoNewsScraper:
                         "tbs": "qdr:d"  # Last 24 hours
                     }
                     
-                    headers = {
-                        "X-API-KEY": self.serper_api_key,
-                        "Content-Type": "application/json"
-                    }
-                    
-                    response = requests.post(url, json=payload, headers=headers, timeout=10)
+                    response = self.session.post(url, json=payload, headers=headers, timeout=10)
                     response.raise_for_status()
                     
                     data = response.json()
@@ -278,7 +359,7 @@ class CryptoNewsScraper:
                             'title': result.get('title', ''),
                             'url': result.get('link', ''),
                             'snippet': result.get('snippet', ''),
-                            'timestamp': datetime.now().isoformat(),
+                            'timestamp': scraped_at,
                             'query': query,
                             'position': result.get('position', 0),
                             'category': 'Crypto'
@@ -351,4 +432,22 @@ class CryptoNewsScraper:
                 json.dump(data, f, indent=2, ensure_ascii=False)
             logger.info(f"Data saved to {filename}")
         except Exception as e:
-            logger.error(f"Error saving file: {str(e)}")
\ No newline at end of file
+            logger.error(f"Error saving file: {str(e)}")
+
+
+@lru_cache(maxsize=8)
+def get_crypto_news_scraper(serper_api_key: str = None, serpapi_key: str = None) -> CryptoNewsScraper:
+    """
+    Get the shared scraper for a set of API keys
+
+    Agents are created per request; sharing the scraper keeps its HTTP
+    session (keep-alive connections, TLS sessions) warm between requests.
+
+    Args:
+        serper_api_key: Serper.dev API key for enhanced search
+        serpapi_key: SerpAPI key for Google Finance scraping
+
+    Returns:
+        Shared CryptoNewsScraper instance
+    """
+    return CryptoNewsScraper(serper_api_key=serper_api_key, serpapi_key=serpapi_key)
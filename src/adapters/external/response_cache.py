@@ -0,0 +1,62 @@
+"""
+In-process TTL Cache for Idempotent External API Responses
+"""
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class ResponseCache:
+    """Small TTL cache for GET responses that change slowly upstream"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> Hashable:
+        """Build a cache key from the request URL and query parameters"""
+        return (url, tuple(sorted((params or {}).items())))
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Cache a value for ttl seconds"""
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            self._evict()
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def delete(self, key: Hashable) -> None:
+        """Drop a cached value if present"""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached responses"""
+        self._entries.clear()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the oldest one if still full"""
+        now = time.monotonic()
+        for key in [k for k, (expires_at, _) in self._entries.items() if expires_at < now]:
+            del self._entries[key]
+
+        if len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+
+
+# Shared across client instances so every agent benefits from a warm cache
+_response_cache = ResponseCache()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the shared response cache instance"""
+    return _response_cache
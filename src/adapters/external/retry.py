@@ -0,0 +1,157 @@
+"""
+Retry with Backoff and Circuit Breaking for External API Calls
+"""
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+from src.error_trace.exceptions import ExternalAPIError
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Upstream statuses worth retrying - rate limiting and transient server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitBreaker:
+    """
+    Per-provider circuit breaker
+
+    Opens after failure_threshold consecutive transient failures and rejects
+    calls without touching the network until reset_timeout has passed. It
+    then goes half-open: exactly one trial call is let through while the
+    others keep being rejected. The trial's success closes the circuit and
+    its failure re-opens it for another reset_timeout.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being rejected (no side effects)"""
+        if self._opened_at is None:
+            return False
+        return self._probing or time.monotonic() - self._opened_at < self.reset_timeout
+
+    def allow_request(self) -> bool:
+        """
+        Whether a call may go out now
+
+        Once the cooldown has passed the first caller is admitted as the
+        half-open trial; it must then report back through record_success(),
+        record_failure() or release().
+        """
+        if not self.is_open:
+            if self._opened_at is not None:
+                self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call"""
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a transient failure, opening the circuit at the threshold"""
+        if self._probing:
+            # The half-open trial failed: back to open for another cooldown
+            self._probing = False
+            self._opened_at = time.monotonic()
+            logger.warning(f"Circuit re-opened for {self.name} after a failed trial call")
+            return
+
+        self._failures += 1
+        if self._failures >= self.failure_threshold and self._opened_at is None:
+            self._opened_at = time.monotonic()
+            logger.warning(f"Circuit opened for {self.name} after {self._failures} failures")
+
+    def release(self) -> None:
+        """End a call that says nothing about upstream health, freeing the trial slot"""
+        self._probing = False
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(api_name: str) -> CircuitBreaker:
+    """Get the shared circuit breaker for an API provider"""
+    breaker = _breakers.get(api_name)
+    if breaker is None:
+        breaker = _breakers[api_name] = CircuitBreaker(api_name)
+    return breaker
+
+
+def _is_transient(error: ExternalAPIError) -> bool:
+    """Connection errors (no status) and RETRY_STATUSES are worth retrying"""
+    status_code = error.details.get("status_code")
+    return status_code is None or status_code in RETRY_STATUSES
+
+
+async def call_with_retry(
+    api_name: str,
+    call: Callable[[], Awaitable[T]],
+    attempts: int = 4,
+    base_delay: float = 0.2
+) -> T:
+    """
+    Run an API call with exponential-backoff retries behind a circuit breaker
+
+    Args:
+        api_name: Provider name, used for the breaker and error messages
+        call: Zero-argument coroutine factory performing one request attempt
+        attempts: Maximum number of attempts
+        base_delay: Backoff base in seconds, doubled on each retry
+
+    Returns:
+        Result of the first successful attempt
+
+    Raises:
+        ExternalAPIError: If the circuit is open, the error is not transient,
+            or all attempts fail
+    """
+    breaker = get_breaker(api_name)
+
+    for attempt in range(attempts):
+        if not breaker.allow_request():
+            raise ExternalAPIError(
+                message=f"{api_name} temporarily unavailable (circuit open)",
+                api_name=api_name,
+                status_code=503
+            )
+
+        try:
+            result = await call()
+        except ExternalAPIError as e:
+            if not _is_transient(e):
+                # A client-side error: neither a success nor an outage
+                breaker.release()
+                raise
+
+            breaker.record_failure()
+            if attempt == attempts - 1 or breaker.is_open:
+                raise
+
+            delay = base_delay * 2 ** attempt + random.random() * 0.1
+            logger.warning(
+                f"{api_name} request failed ({e.message}), retrying in {delay:.2f}s "
+                f"(attempt {attempt + 1}/{attempts})"
+            )
+            await asyncio.sleep(delay)
+        except BaseException:
+            # Unexpected error or cancellation
+            breaker.release()
+            raise
+        else:
+            breaker.record_success()
+            return result
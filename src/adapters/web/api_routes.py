@@ -1,7 +1,8 @@
 """
 API Routes
 """
-from typing import Optional, Dict, Any
+import asyncio
+from typing import Annotated, Optional, Dict, Any, List
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel, Field
 from datetime import datetime 
@@ -22,6 +23,10 @@ speech_service = SpeechService()
 tts_service = TTSService()
 translation_service = TranslationService()
 
+# Bounds on /translate-batch: each text costs one outbound translate call,
+# and Google's endpoint rejects texts over 5000 characters
+TRANSLATE_BATCH_MAX_TEXTS = 50
+TRANSLATE_TEXT_MAX_CHARS = 5000
 
 
 # Request/Response Models
@@ -62,6 +67,17 @@ class AnalysisResponse(BaseModel):
     timestamp: str
 
 
+class TranslateBatchRequest(BaseModel):
+    """Batch translation request model"""
+    texts: List[Annotated[str, Field(max_length=TRANSLATE_TEXT_MAX_CHARS)]] = Field(
+        ...,
+        max_length=TRANSLATE_BATCH_MAX_TEXTS,
+        description="Texts to translate"
+    )
+    src: str = Field(..., description="Source language code")
+    dest: str = Field(..., description="Destination language code")
+
+
 # Health Check Route
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
@@ -277,7 +293,7 @@ async def speech_to_text(language: str = "en-US"):
 @router.post("/api/v1/text-to-speech")
 async def text_to_speech(text: str, language: str = "en"):
     try:
-        audio_path = tts_service.text_to_speech(text=text, language=language)
+        audio_path = await tts_service.text_to_speech_async(text=text, language=language)
         return {"audio_path": audio_path}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -285,10 +301,22 @@ async def text_to_speech(text: str, language: str = "en"):
 @router.post("/api/v1/translate")
 async def translate_text(text: str, src: str, dest: str):
     try:
-        translated_text = translation_service.translate_text(text=text, src=src, dest=dest)
+        translated_text = await asyncio.to_thread(
+            translation_service.translate_text, text=text, src=src, dest=dest
+        )
         return {"translated_text": translated_text}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/api/v1/translate-batch")
+async def translate_batch(request: TranslateBatchRequest):
+    try:
+        translated_texts = await asyncio.to_thread(
+            translation_service.translate_batch, request.texts, request.src, request.dest
+        )
+        return {"translated_texts": translated_texts}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
     
 # Include conversation routes
 from src.adapters.web.routes.conversations import router as conversation_router
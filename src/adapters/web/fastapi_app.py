@@ -127,6 +127,22 @@ def create_app() -> FastAPI:
         """Cleanup on shutdown"""
         logger.info("Shutting down Multi-Asset AI API...")
 
+        # Write out analyses still waiting in the batch insert queue
+        try:
+            from src.application.services.analysis_service import flush_pending_analyses
+
+            await flush_pending_analyses()
+        except Exception as e:
+            logger.warning(f"Error flushing pending analyses: {str(e)}")
+
+        # Release pooled connections held by the external API clients
+        try:
+            from src.adapters.external.http_session import close_session
+
+            await close_session()
+        except Exception as e:
+            logger.warning(f"Error closing HTTP session: {str(e)}")
+
     # Root health endpoint for Cloud Run health checks
     @app.get("/", response_model=HealthResponse)
     async def root_health():
@@ -1,9 +1,16 @@
 """
 Base Agent Class
 """
+import asyncio
+import hashlib
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+from src.application.services.translation_service import TranslationService
 from src.config.settings import get_settings
+from src.utilities import json_io
+from src.utilities.concurrency import get_semaphore
 from src.utilities.logger import get_logger
 from src.error_trace.exceptions import AgentExecutionError
 import groq
@@ -12,9 +19,17 @@ import groq
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Bounds for the shared LLM response cache
+LLM_CACHE_SIZE = 1024
+LLM_CACHE_TTL = 900  # seconds
+
 
 class BaseAgent(ABC):
     """Abstract base class for all AI agents"""
+
+    # Validated LLM responses keyed by prompt hash, shared across instances
+    # because agents are created per request
+    _llm_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
     
     def __init__(self, name: str, description: str):
         self.name = name
@@ -39,6 +54,8 @@ class BaseAgent(ABC):
         self.temperature = settings.agent_temperature
         logger.info(f"Initialized {self.name} with model {self.model}")
 
+        self.translation_service = TranslationService()
+
     @abstractmethod
     async def analyze(
         self,
@@ -66,19 +83,32 @@ class BaseAgent(ABC):
         self,
         system_prompt: str,
         user_prompt: str,
-        temperature: Optional[float] = None
+        temperature: Optional[float] = None,
+        use_cache: bool = True
     ) -> str:
         """
         Execute LLM call with error handling
+
+        Identical prompts (same model and temperature) are answered from the
+        shared LLM response cache for LLM_CACHE_TTL seconds. Only responses
+        containing a parseable JSON object are cached, so a malformed answer
+        is never replayed.
         
         Args:
             system_prompt: System instructions
             user_prompt: User query
             temperature: Optional temperature override
+            use_cache: Whether to read and fill the LLM response cache
             
         Returns:
             LLM response text
         """
+        temperature = temperature or self.temperature
+        if use_cache:
+            cached = self.get_cached_llm_response(system_prompt, user_prompt, temperature)
+            if cached is not None:
+                return cached
+
         if not self.client:
             raise AgentExecutionError(
                 message="Groq client is not initialized. Cannot execute LLM call.",
@@ -86,16 +116,19 @@ class BaseAgent(ABC):
             )
 
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=temperature or self.temperature,
-                max_tokens=2000
-            )
-            return response.choices[0].message.content
+            # Cap in-flight LLM calls process-wide so parallel agents don't
+            # trigger provider rate limits
+            async with get_semaphore("llm", settings.llm_max_concurrency):
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    temperature=temperature,
+                    max_tokens=2000
+                )
+            content = response.choices[0].message.content
 
         except Exception as e:
             logger.error(f"LLM execution error in {self.name}: {str(e)}")
@@ -104,6 +137,146 @@ class BaseAgent(ABC):
                 details={"agent": self.name, "error": str(e)}
             )
 
+        if use_cache and content:
+            try:
+                json_io.extract_object(content)
+            except json_io.JSONDecodeError:
+                pass
+            else:
+                self.cache_llm_response(system_prompt, user_prompt, content, temperature)
+        return content
+
+    async def _translate_async(self, text: str, src: str, dest: str) -> str:
+        """
+        Translate text without blocking the event loop
+
+        TranslationService makes blocking HTTP calls, so they run on the
+        shared default thread pool and concurrent agents keep overlapping.
+        Same-language and empty text is returned as-is without a round trip.
+
+        Args:
+            text: Text to translate
+            src: Source language code
+            dest: Destination language code
+
+        Returns:
+            Translated text
+        """
+        if src == dest or not text or not text.strip():
+            return text
+
+        return await asyncio.to_thread(
+            self.translation_service.translate_text, text, src=src, dest=dest
+        )
+
+    async def _translate_query_to_english(
+        self,
+        query: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Translate an incoming query to English
+
+        The query is taken to be in context["language"] unless the caller set
+        context["query_language"] - SynthesisAgent hands the specialists its
+        already-translated query with query_language="en", so a non-English
+        request is translated once instead of once per agent. With
+        context["skip_translation"] set the query is used as given.
+
+        Args:
+            query: Analysis query
+            context: Request context
+
+        Returns:
+            Query in English
+        """
+        context = context or {}
+        if context.get("skip_translation"):
+            return query
+        src = context.get("query_language", context.get("language", "en"))
+        return await self._translate_async(query, src=src, dest="en")
+
+    async def _translate_from_english(
+        self,
+        text: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Translate generated English text into context["language"]
+
+        Args:
+            text: English text
+            context: Request context
+
+        Returns:
+            Text in the user's language (unchanged if context["skip_translation"])
+        """
+        context = context or {}
+        if context.get("skip_translation"):
+            return text
+        return await self._translate_async(text, src="en", dest=context.get("language", "en"))
+
+    def _llm_cache_key(self, system_prompt: str, user_prompt: str, temperature: Optional[float] = None) -> str:
+        """Hash the model, temperature and prompts into an LLM cache key"""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self.model, repr(temperature or self.temperature), system_prompt, user_prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get_cached_llm_response(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Look up a previously cached LLM response for identical prompts
+
+        Args:
+            system_prompt: System instructions
+            user_prompt: User query
+            temperature: Temperature the response was generated with
+
+        Returns:
+            Cached response text, or None on a miss or expired entry
+        """
+        key = self._llm_cache_key(system_prompt, user_prompt, temperature)
+        entry = self._llm_cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del self._llm_cache[key]
+            return None
+
+        self._llm_cache.move_to_end(key)
+        logger.info(f"LLM cache hit for {self.name}")
+        return response
+
+    def cache_llm_response(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        response: str,
+        temperature: Optional[float] = None
+    ) -> None:
+        """
+        Cache an LLM response, evicting the least recently used beyond LLM_CACHE_SIZE
+
+        Args:
+            system_prompt: System instructions
+            user_prompt: User query
+            response: LLM response text
+            temperature: Temperature the response was generated with
+        """
+        key = self._llm_cache_key(system_prompt, user_prompt, temperature)
+        self._llm_cache[key] = (time.monotonic() + LLM_CACHE_TTL, response)
+        self._llm_cache.move_to_end(key)
+        if len(self._llm_cache) > LLM_CACHE_SIZE:
+            self._llm_cache.popitem(last=False)
+
     def format_output(
         self,
         analysis: Dict[str, Any],
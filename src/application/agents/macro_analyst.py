@@ -1,24 +1,82 @@
 """
 Crypto Macro Analyst Agent - Analyzes macroeconomic conditions for cryptocurrency markets
 """
-import json
 import asyncio
+import re
 from typing import Dict, Any, Optional, List
 from src.application.agents.base_agent import BaseAgent
 from src.application.services.rag_service import RAGService
-from src.application.services.translation_service import TranslationService
 from src.adapters.external.fred_client import FREDClient
+from src.config.settings import get_settings
+from src.utilities import json_io
+from src.utilities.concurrency import get_semaphore
 from src.utilities.logger import get_logger
 
 # Import what's actually available
 try:
-    from src.adapters.external.newsapi_client import CryptoNewsScraper
+    from src.adapters.external.newsapi_client import get_crypto_news_scraper
     HAS_CRYPTO_NEWS_SCRAPER = True
 except ImportError:
     HAS_CRYPTO_NEWS_SCRAPER = False
 
 logger = get_logger(__name__)
 
+# Crypto macroeconomic keywords, matched as substrings in one scan of the
+# article text (compiled once instead of a per-call list walked per article)
+CRYPTO_MACRO_KEYWORDS = (
+    'fed', 'federal reserve', 'interest rate', 'inflation', 'cpi',
+    'regulation', 'sec', 'cftc', 'digital asset', 'crypto regulation',
+    'bitcoin etf', 'institutional', 'adoption', 'blackrock', 'fidelity',
+    'monetary policy', 'digital dollar', 'cbdc', 'stablecoin',
+    'tether', 'usdc', 'macro', 'economic', 'recession',
+    'dollar', 'usd', 'treasury', 'yield', 'liquidity',
+    'halving', 'bitcoin halving', 'mining', 'hash rate'
+)
+_CRYPTO_MACRO_RE = re.compile("|".join(map(re.escape, CRYPTO_MACRO_KEYWORDS)), re.IGNORECASE)
+
+# Macro news articles passed on to the prompt
+MAX_MACRO_NEWS = 10
+
+# Constant system prompt - built once at import, same object on every call
+_MACRO_SYSTEM_PROMPT = """You are a professional cryptocurrency macroeconomic analyst with expertise in:
+- Central bank monetary policy impacts on crypto (Fed interest rates, QE, QT)
+- Inflation effects on Bitcoin and stablecoins
+- Regulatory developments (SEC, CFTC, global regulations)
+- Institutional adoption trends
+- Macroeconomic indicators affecting crypto markets
+- USD strength correlation with crypto
+- Risk-on/risk-off market environments
+- Global liquidity conditions
+- Geopolitical events impacting crypto
+
+Your role is to analyze macroeconomic data and provide insights specifically for cryptocurrency markets.
+
+Provide analysis in JSON format with this exact structure:
+{
+    "summary": "Brief executive summary focused on crypto impact",
+    "monetary_policy_impact": "bullish/bearish/neutral for crypto",
+    "regulatory_environment": "favorable/unfavorable/neutral",
+    "institutional_adoption_trend": "accelerating/decelerating/stable",
+    "crypto_correlation": "risk_on/risk_off/decoupled",
+    "key_factors": ["factor1", "factor2", ...],
+    "confidence": 0.0-1.0,
+    "top_crypto_risks": ["risk1", "risk2", ...],
+    "recommended_watchlist": ["BTC", "ETH", ...]
+}
+
+IMPORTANT: Only respond with valid JSON. No explanations, no markdown formatting."""
+
+
+def _format_news_article(index: int, article: Dict) -> str:
+    """Format one news article as a numbered prompt entry"""
+    source = article.get('source')
+    if source is None:
+        source = article.get('scrape_source', 'Unknown')
+    
+    snippet = article.get('snippet')
+    summary_line = f"   Summary: {snippet[:150]}...\n" if snippet else ""
+    return f"{index}. {article.get('title', 'No title')}\n{summary_line}   Source: {source}\n"
+
 
 class MacroAnalyst(BaseAgent):
     """Agent specialized in crypto-specific macroeconomic analysis"""
@@ -35,7 +93,6 @@ class MacroAnalyst(BaseAgent):
         
         # Initialize services
         self.rag_service = RAGService()
-        self.translation_service = TranslationService()
         
         # Initialize FRED client for economic data
         self.fred_client = FREDClient()
@@ -43,11 +100,10 @@ class MacroAnalyst(BaseAgent):
         # Initialize crypto news scraper if available
         self.crypto_scraper = None
         if HAS_CRYPTO_NEWS_SCRAPER:
-            from src.config.settings import get_settings
             settings = get_settings()
             
             # Use CryptoNewsScraper for crypto-specific news
-            self.crypto_scraper = CryptoNewsScraper(
+            self.crypto_scraper = get_crypto_news_scraper(
                 serper_api_key=settings.serper_api_key,
                 serpapi_key=settings.serpapi_key
             )
@@ -57,33 +113,7 @@ class MacroAnalyst(BaseAgent):
     
     def get_system_prompt(self) -> str:
         """Get system prompt for crypto macro analysis"""
-        return """You are a professional cryptocurrency macroeconomic analyst with expertise in:
-- Central bank monetary policy impacts on crypto (Fed interest rates, QE, QT)
-- Inflation effects on Bitcoin and stablecoins
-- Regulatory developments (SEC, CFTC, global regulations)
-- Institutional adoption trends
-- Macroeconomic indicators affecting crypto markets
-- USD strength correlation with crypto
-- Risk-on/risk-off market environments
-- Global liquidity conditions
-- Geopolitical events impacting crypto
-
-Your role is to analyze macroeconomic data and provide insights specifically for cryptocurrency markets.
-
-Provide analysis in JSON format with this exact structure:
-{
-    "summary": "Brief executive summary focused on crypto impact",
-    "monetary_policy_impact": "bullish/bearish/neutral for crypto",
-    "regulatory_environment": "favorable/unfavorable/neutral",
-    "institutional_adoption_trend": "accelerating/decelerating/stable",
-    "crypto_correlation": "risk_on/risk_off/decoupled",
-    "key_factors": ["factor1", "factor2", ...],
-    "confidence": 0.0-1.0,
-    "top_crypto_risks": ["risk1", "risk2", ...],
-    "recommended_watchlist": ["BTC", "ETH", ...]
-}
-
-IMPORTANT: Only respond with valid JSON. No explanations, no markdown formatting."""
+        return _MACRO_SYSTEM_PROMPT
     
     async def analyze(
         self,
@@ -107,14 +137,26 @@ IMPORTANT: Only respond with valid JSON. No explanations, no markdown formatting
             asset_symbol = context.get('asset_symbol', '').upper() if context else ''
             
             # Translate query to English if needed
-            user_language = context.get('language', 'en') if context else 'en'
-            query_in_english = self.translation_service.translate_text(query, src=user_language, dest='en')
-            
-            # Collect data from multiple sources
-            economic_data = await self._collect_economic_data()
-            crypto_news_data = await self._collect_crypto_news_data(query_in_english, asset_symbol)
-            rag_documents = await self._get_crypto_rag_documents(query_in_english, asset_symbol)
+            query_in_english = await self._translate_query_to_english(query, context)
             
+            # Collect data from independent sources concurrently
+            economic_data, crypto_news_data, rag_documents = await asyncio.gather(
+                self._collect_economic_data(),
+                self._collect_crypto_news_data(query_in_english, asset_symbol),
+                self._get_crypto_rag_documents(query_in_english, asset_symbol),
+                return_exceptions=True
+            )
+
+            if isinstance(economic_data, Exception):
+                logger.error(f"Economic data collection failed: {str(economic_data)}")
+                economic_data = self._get_crypto_fallback_economic_data()
+            if isinstance(crypto_news_data, Exception):
+                logger.error(f"Crypto news collection failed: {str(crypto_news_data)}")
+                crypto_news_data = []
+            if isinstance(rag_documents, Exception):
+                logger.error(f"RAG document retrieval failed: {str(rag_documents)}")
+                rag_documents = []
+
             # Generate crypto-specific macro analysis
             analysis_result = await self._generate_crypto_macro_analysis(
                 query_in_english,
@@ -183,41 +225,33 @@ IMPORTANT: Only respond with valid JSON. No explanations, no markdown formatting
             use_serper = bool(self.crypto_scraper.serper_api_key)
             use_serpapi = bool(self.crypto_scraper.serpapi_key)
             
-            all_news = await loop.run_in_executor(
-                None,
-                self.crypto_scraper.scrape_all,
-                use_serper,
-                use_serpapi
-            )
+            # Scrapes hit the same upstream sites; limit how many run at once
+            async with get_semaphore("news_scrape", get_settings().news_scrape_max_concurrency):
+                all_news = await loop.run_in_executor(
+                    None,
+                    self.crypto_scraper.scrape_all,
+                    use_serper,
+                    use_serpapi
+                )
             
             # Filter for crypto macroeconomic news
             crypto_macro_news = []
-            crypto_macro_keywords = [
-                'fed', 'federal reserve', 'interest rate', 'inflation', 'cpi',
-                'regulation', 'sec', 'cftc', 'digital asset', 'crypto regulation',
-                'bitcoin etf', 'institutional', 'adoption', 'blackrock', 'fidelity',
-                'monetary policy', 'digital dollar', 'cbdc', 'stablecoin',
-                'tether', 'usdc', 'macro', 'economic', 'recession',
-                'dollar', 'usd', 'treasury', 'yield', 'liquidity',
-                'halving', 'bitcoin halving', 'mining', 'hash rate'
-            ]
-            
             for source_name, articles in all_news.get('sources', {}).items():
                 for article in articles:
-                    title = article.get('title', '').lower()
-                    snippet = article.get('snippet', '').lower()
-                    selftext = article.get('selftext', '').lower()
-                    
-                    content = f"{title} {snippet} {selftext}"
+                    content = f"{article.get('title', '')} {article.get('snippet', '')} {article.get('selftext', '')}"
                     
                     # Check if article contains crypto macroeconomic keywords
-                    if any(keyword in content for keyword in crypto_macro_keywords):
+                    if _CRYPTO_MACRO_RE.search(content):
                         article['scrape_source'] = source_name
                         article['scrape_timestamp'] = "2025-12-04T20:00:00Z"
                         crypto_macro_news.append(article)
+                        if len(crypto_macro_news) >= MAX_MACRO_NEWS:
+                            break
+                if len(crypto_macro_news) >= MAX_MACRO_NEWS:
+                    break
             
             logger.info(f"Found {len(crypto_macro_news)} crypto macroeconomic news articles")
-            return crypto_macro_news[:10]  # Return top 10
+            return crypto_macro_news
             
         except Exception as e:
             logger.error(f"Error collecting crypto news from scraper: {str(e)}")
@@ -313,18 +347,9 @@ IMPORTANT: Only respond with valid JSON. No explanations, no markdown formatting
         ]
         
         # Format crypto news
-        news_summary = []
-        for i, article in enumerate(news_data[:5], 1):
-            title = article.get('title', 'No title')
-            news_summary.append(f"{i}. {title}")
-            
-            snippet = article.get('snippet', '')
-            if snippet:
-                news_summary.append(f"   Summary: {snippet[:150]}...")
-            
-            source = article.get('source', article.get('scrape_source', 'Unknown'))
-            news_summary.append(f"   Source: {source}")
-            news_summary.append("")
+        news_text = "\n".join(
+            _format_news_article(i, article) for i, article in enumerate(news_data[:5], 1)
+        )
         
         # Create crypto-focused prompt
         prompt = f"""Analyze the cryptocurrency macroeconomic conditions for {asset_symbol if asset_symbol else 'crypto markets'} based on the following data:
@@ -335,7 +360,7 @@ KEY ECONOMIC INDICATORS (Crypto-Relevant):
 {chr(10).join(econ_summary) if econ_summary else "- No economic indicators available"}
 
 RECENT CRYPTO MACRO NEWS:
-{"- No recent crypto macroeconomic news available" if not news_summary else chr(10).join(news_summary)}
+{news_text or "- No recent crypto macroeconomic news available"}
 
 CRYPTO MACROECONOMIC CONTEXT:
 {"- No historical crypto macroeconomic context available" if not rag_documents else f"Found {len(rag_documents)} relevant crypto documents"}
@@ -356,16 +381,8 @@ Respond with JSON only, using the exact crypto-focused format specified in the s
     def _parse_llm_response(self, response: str) -> Dict:
         """Parse LLM response into structured JSON for crypto analysis"""
         try:
-            response = response.strip()
-            
-            # Handle markdown code blocks
-            if '```json' in response:
-                response = response.split('```json')[1].split('```')[0].strip()
-            elif '```' in response:
-                response = response.split('```')[1].split('```')[0].strip()
-            
-            # Parse JSON
-            result = json.loads(response)
+            # Tolerates markdown fences and prose around the JSON object
+            result = json_io.extract_object(response)
             
             # Validate required fields for crypto analysis
             required_fields = [
@@ -389,7 +406,7 @@ Respond with JSON only, using the exact crypto-focused format specified in the s
             
             return result
             
-        except json.JSONDecodeError as e:
+        except json_io.JSONDecodeError as e:
             logger.error(f"Failed to parse crypto LLM response as JSON: {e}")
             
             return {
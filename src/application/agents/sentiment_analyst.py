@@ -2,27 +2,95 @@
 Sentiment Analyst - Analyzes market sentiment from crypto news sources
 COMPLETE VERSION - Replace your entire sentiment_analyst.py with this
 """
-import json
 import asyncio
 from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+from datetime import datetime
 from dataclasses import dataclass, field
 
 from src.application.agents.base_agent import BaseAgent
 from src.application.services.rag_service import RAGService
-from src.application.services.translation_service import TranslationService
 from src.infrastructure.cache import get_cache
+from src.config.settings import get_settings
+from src.utilities import json_io
+from src.utilities.concurrency import get_semaphore
 from src.utilities.logger import get_logger
 
 # Import your crypto news scraper
 try:
-    from src.adapters.external.newsapi_client import CryptoNewsScraper
+    from src.adapters.external.newsapi_client import get_crypto_news_scraper
     CRYPTO_NEWS_AVAILABLE = True
 except ImportError:
     CRYPTO_NEWS_AVAILABLE = False
 
 logger = get_logger(__name__)
 
+# Constant system prompt - built once at import, same object on every call
+_SENTIMENT_SYSTEM_PROMPT = """You are a Sentiment Analyst specializing in cryptocurrency markets.
+        
+        Your task is to analyze news articles, social media posts, and market discussions
+        to determine the overall market sentiment for a given cryptocurrency.
+        
+        ANALYSIS FRAMEWORK:
+        1. Extract sentiment from each piece of content
+        2. Identify dominant narratives (bullish/bearish)
+        3. Calculate sentiment score (0-100 scale)
+        4. Provide actionable insights
+        
+        OUTPUT FORMAT: Return a JSON object with this exact structure:
+        {
+            "summary": "Brief summary of overall sentiment",
+            "sentiment_score": 0-100 (0=extremely bearish, 100=extremely bullish),
+            "sentiment_label": "bullish" | "bearish" | "neutral",
+            "dominant_narratives": {
+                "bullish": ["list of bullish themes"],
+                "bearish": ["list of bearish themes"]
+            },
+            "news_flow": "positive" | "negative" | "mixed",
+            "contrarian_signals": ["list of contrarian indicators"],
+            "key_factors": ["list of key influencing factors"],
+            "confidence": 0.0-1.0 (confidence in analysis),
+            "risks": ["list of key risks"]
+        }
+        
+        IMPORTANT: Only respond with valid JSON. No explanations, no markdown formatting.
+        """
+
+# Query terms -> asset symbol, checked in order by _extract_asset_symbol
+_QUERY_SYMBOL_TERMS = (
+    ('bitcoin', 'BTC'),
+    ('btc', 'BTC'),
+    ('ethereum', 'ETH'),
+    ('eth', 'ETH'),
+    ('ripple', 'XRP'),
+    ('xrp', 'XRP'),
+    ('cardano', 'ADA'),
+    ('ada', 'ADA'),
+    ('solana', 'SOL'),
+    ('sol', 'SOL'),
+    ('dogecoin', 'DOGE'),
+    ('doge', 'DOGE'),
+    ('usd', 'USD'),
+    ('dollar', 'USD'),
+)
+
+# Terms that mark an article as relevant to an asset symbol
+_SYMBOL_TERMS = {
+    'BTC': ('bitcoin', 'btc'),
+    'ETH': ('ethereum', 'eth'),
+    'XRP': ('ripple', 'xrp'),
+    'ADA': ('cardano', 'ada'),
+    'SOL': ('solana', 'sol'),
+    'DOGE': ('dogecoin', 'doge'),
+    'USD': ('dollar', 'usd', 'us dollar'),
+}
+
+
+def _format_news_article(index: int, article: Dict) -> str:
+    """Format one news article as a numbered prompt entry"""
+    snippet = article.get('snippet')
+    summary_line = f"   Summary: {snippet[:200]}...\n" if snippet else ""
+    return f"{index}. {article.get('title', 'No title')}\n{summary_line}   Source: {article.get('source', 'Unknown')}\n"
+
 
 @dataclass
 class SentimentAnalysis:
@@ -74,13 +142,11 @@ class SentimentAnalyst(BaseAgent):
         
         # Initialize services
         self.rag_service = RAGService()
-        self.translation_service = TranslationService()
         self.cache = get_cache()
         
         # Initialize crypto news scraper if available
         self.crypto_scraper = None
         if CRYPTO_NEWS_AVAILABLE:
-            from src.config.settings import get_settings
             settings = get_settings()
             
             # Strip quotes from API keys if present
@@ -88,7 +154,7 @@ class SentimentAnalyst(BaseAgent):
             serpapi_key = settings.serpapi_key.strip('"').strip("'") if settings.serpapi_key else ""
             
             if serper_key or serpapi_key:
-                self.crypto_scraper = CryptoNewsScraper(
+                self.crypto_scraper = get_crypto_news_scraper(
                     serper_api_key=serper_key,
                     serpapi_key=serpapi_key
                 )
@@ -103,56 +169,21 @@ class SentimentAnalyst(BaseAgent):
         
     def get_system_prompt(self) -> str:
         """Get the system prompt for sentiment analysis (required by BaseAgent)"""
-        return """You are a Sentiment Analyst specializing in cryptocurrency markets.
-        
-        Your task is to analyze news articles, social media posts, and market discussions
-        to determine the overall market sentiment for a given cryptocurrency.
-        
-        ANALYSIS FRAMEWORK:
-        1. Extract sentiment from each piece of content
-        2. Identify dominant narratives (bullish/bearish)
-        3. Calculate sentiment score (0-100 scale)
-        4. Provide actionable insights
-        
-        OUTPUT FORMAT: Return a JSON object with this exact structure:
-        {
-            "summary": "Brief summary of overall sentiment",
-            "sentiment_score": 0-100 (0=extremely bearish, 100=extremely bullish),
-            "sentiment_label": "bullish" | "bearish" | "neutral",
-            "dominant_narratives": {
-                "bullish": ["list of bullish themes"],
-                "bearish": ["list of bearish themes"]
-            },
-            "news_flow": "positive" | "negative" | "mixed",
-            "contrarian_signals": ["list of contrarian indicators"],
-            "key_factors": ["list of key influencing factors"],
-            "confidence": 0.0-1.0 (confidence in analysis),
-            "risks": ["list of key risks"]
-        }
-        
-        IMPORTANT: Only respond with valid JSON. No explanations, no markdown formatting.
-        """
+        return _SENTIMENT_SYSTEM_PROMPT
     
-    async def _translate_query(self, query: str) -> str:
+    async def _translate_query(self, query: str, context: Optional[Dict] = None) -> str:
         """
         Translate query to English if needed (with fallback)
         
         Args:
             query: User query in any language
+            context: Request context carrying the query language
             
         Returns:
             Query in English
         """
         try:
-            # Check if translation service has the method
-            if hasattr(self.translation_service, 'translate_to_english'):
-                return await self.translation_service.translate_to_english(query)
-            elif hasattr(self.translation_service, 'translate'):
-                return await self.translation_service.translate(query, target_lang='en')
-            else:
-                # Fallback: assume query is already in English
-                logger.warning("Translation service method not found, assuming query is in English")
-                return query
+            return await self._translate_query_to_english(query, context)
         except Exception as e:
             logger.warning(f"Translation failed: {str(e)}, using original query")
             return query
@@ -179,7 +210,7 @@ class SentimentAnalyst(BaseAgent):
             logger.info(f"Sentiment Analyst analyzing: {asset_symbol}")
             
             # Translate query to English if needed (with fallback)
-            query_in_english = await self._translate_query(query)
+            query_in_english = await self._translate_query(query, context)
             
             # Get sentiment data from multiple sources
             sentiment_data = await self._collect_sentiment_data(
@@ -191,7 +222,8 @@ class SentimentAnalyst(BaseAgent):
             analysis_result = await self._generate_sentiment_analysis(
                 query_in_english,
                 asset_symbol,
-                sentiment_data
+                sentiment_data,
+                use_cache=context.get('cache', True) if context else True
             )
             
             # Create sentiment analysis object
@@ -220,14 +252,17 @@ class SentimentAnalyst(BaseAgent):
             "sources": {}
         }
         
-        # 1. Get fresh crypto news from scraper (highest priority)
+        # Fresh news (highest priority) and RAG historical context are
+        # independent I/O, so fetch them concurrently
+        fresh_news, rag_documents = await asyncio.gather(
+            self._get_fresh_crypto_news(asset_symbol),
+            self._get_rag_documents(query, asset_symbol)
+        )
+        
         if self.crypto_scraper:
-            fresh_news = await self._get_fresh_crypto_news(asset_symbol)
             sentiment_data["sources"]["fresh_news"] = fresh_news
             logger.info(f"Collected {len(fresh_news)} fresh news articles")
         
-        # 2. Query RAG service for historical context
-        rag_documents = await self._get_rag_documents(query, asset_symbol)
         sentiment_data["sources"]["rag_documents"] = rag_documents
         logger.info(f"Retrieved {len(rag_documents)} documents from RAG")
         
@@ -248,25 +283,29 @@ class SentimentAnalyst(BaseAgent):
             use_serper = bool(self.crypto_scraper.serper_api_key)
             use_serpapi = bool(self.crypto_scraper.serpapi_key)
             
-            news_data = await loop.run_in_executor(
-                None,
-                self.crypto_scraper.scrape_all,
-                use_serper,
-                use_serpapi
-            )
+            # Scrapes hit the same upstream sites; limit how many run at once
+            async with get_semaphore("news_scrape", get_settings().news_scrape_max_concurrency):
+                news_data = await loop.run_in_executor(
+                    None,
+                    self.crypto_scraper.scrape_all,
+                    use_serper,
+                    use_serpapi
+                )
             
-            # Filter for relevant asset_symbol and recency
+            # Filter for relevant asset_symbol, stopping once max_articles are found
             relevant_articles = []
-            cutoff_time = datetime.utcnow() - timedelta(hours=self.recency_hours)
+            scrape_timestamp = datetime.utcnow().isoformat()
             
             for source_name, articles in news_data.get('sources', {}).items():
                 for article in articles:
                     if self._is_article_relevant(article, asset_symbol):
                         article['scrape_source'] = source_name
-                        article['scrape_timestamp'] = datetime.utcnow().isoformat()
+                        article['scrape_timestamp'] = scrape_timestamp
                         relevant_articles.append(article)
+                        if len(relevant_articles) >= self.max_articles:
+                            return relevant_articles
             
-            return relevant_articles[:self.max_articles]
+            return relevant_articles
             
         except Exception as e:
             logger.error(f"Error getting fresh crypto news: {str(e)}")
@@ -279,29 +318,12 @@ class SentimentAnalyst(BaseAgent):
         if not asset_symbol:
             return True
         
-        symbol_mappings = {
-            'BTC': ['bitcoin', 'btc'],
-            'ETH': ['ethereum', 'eth'],
-            'XRP': ['ripple', 'xrp'],
-            'ADA': ['cardano', 'ada'],
-            'SOL': ['solana', 'sol'],
-            'DOGE': ['dogecoin', 'doge'],
-            'USD': ['dollar', 'usd', 'us dollar'],
-        }
-        
-        target_terms = symbol_mappings.get(asset_symbol, [asset_symbol.lower()])
+        target_terms = _SYMBOL_TERMS.get(asset_symbol) or (asset_symbol.lower(),)
         
-        title = article.get('title', '').lower()
-        snippet = article.get('snippet', '').lower()
-        selftext = article.get('selftext', '').lower()
+        # One lower() over the joined text instead of one per field
+        content = f"{article.get('title', '')} {article.get('snippet', '')} {article.get('selftext', '')}".lower()
         
-        content = f"{title} {snippet} {selftext}"
-        
-        for term in target_terms:
-            if term and term in content:
-                return True
-        
-        return False
+        return any(term in content for term in target_terms)
     
     async def _get_rag_documents(self, query: str, asset_symbol: str) -> List[Dict]:
         """Get relevant documents from RAG service (DISABLED)"""
@@ -326,10 +348,14 @@ class SentimentAnalyst(BaseAgent):
         self, 
         query: str, 
         asset_symbol: str, 
-        sentiment_data: Dict
+        sentiment_data: Dict,
+        use_cache: bool = True
     ) -> Dict:
         """
         Generate sentiment analysis using LLM based on collected data
+        
+        Identical prompts are answered from the shared LLM response cache
+        unless use_cache is False.
         """
         try:
             prompt = self._create_analysis_prompt(query, asset_symbol, sentiment_data)
@@ -338,10 +364,16 @@ class SentimentAnalyst(BaseAgent):
             # Use BaseAgent's execute_llm_call method
             response = await self.execute_llm_call(
                 system_prompt=system_prompt,
-                user_prompt=prompt
+                user_prompt=prompt,
+                use_cache=use_cache
             )
             
-            analysis_result = self._parse_llm_response(response)
+            try:
+                analysis_result = self._parse_llm_response(response)
+            except json_io.JSONDecodeError as e:
+                logger.error(f"Failed to parse LLM response as JSON: {e}")
+                analysis_result = self._create_parse_error_analysis()
+            
             enhanced_result = self._enhance_analysis(analysis_result, sentiment_data)
             return enhanced_result
             
@@ -357,16 +389,9 @@ class SentimentAnalyst(BaseAgent):
         fresh_news = sentiment_data.get("sources", {}).get("fresh_news", [])
         rag_documents = sentiment_data.get("sources", {}).get("rag_documents", [])
         
-        news_summary = []
-        for i, article in enumerate(fresh_news[:10], 1):
-            news_summary.append(f"{i}. {article.get('title', 'No title')}")
-            if article.get('snippet'):
-                news_summary.append(f"   Summary: {article.get('snippet', '')[:200]}...")
-            news_summary.append(f"   Source: {article.get('source', 'Unknown')}")
-            news_summary.append("")
-        
-        # Create prompt
-        news_text = "\n".join(news_summary) if news_summary else "- No recent news articles available"
+        news_text = "\n".join(
+            _format_news_article(i, article) for i, article in enumerate(fresh_news[:10], 1)
+        ) or "- No recent news articles available"
         
         prompt = f"""Analyze the sentiment for {asset_symbol} based on the following data:
 
@@ -395,39 +420,36 @@ Respond with JSON only, using the exact format specified in the system prompt.""
         return prompt
     
     def _parse_llm_response(self, response: str) -> Dict:
-        """Parse LLM response into structured JSON"""
-        try:
-            response = response.strip()
-            
-            if '```json' in response:
-                response = response.split('```json')[1].split('```')[0].strip()
-            elif '```' in response:
-                response = response.split('```')[1].split('```')[0].strip()
-            
-            result = json.loads(response)
-            
-            required_fields = ['summary', 'sentiment_score', 'sentiment_label']
-            for field in required_fields:
-                if field not in result:
-                    logger.warning(f"Missing required field in LLM response: {field}")
-                    result[field] = "" if field == "summary" else 0 if "score" in field else "neutral"
-            
-            return result
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse LLM response as JSON: {e}")
-            
-            return {
-                "summary": "Failed to parse sentiment analysis response.",
-                "sentiment_score": 50,
-                "sentiment_label": "neutral",
-                "dominant_narratives": {"bullish": [], "bearish": []},
-                "news_flow": "mixed",
-                "contrarian_signals": [],
-                "key_factors": ["Data parsing error"],
-                "confidence": 0.3,
-                "risks": ["Analysis quality compromised"]
-            }
+        """
+        Parse LLM response into structured JSON
+        
+        Raises:
+            json_io.JSONDecodeError: If the response holds no valid JSON object
+        """
+        # Tolerates markdown fences and prose around the JSON object
+        result = json_io.extract_object(response)
+        
+        required_fields = ['summary', 'sentiment_score', 'sentiment_label']
+        for field in required_fields:
+            if field not in result:
+                logger.warning(f"Missing required field in LLM response: {field}")
+                result[field] = "" if field == "summary" else 0 if "score" in field else "neutral"
+        
+        return result
+    
+    def _create_parse_error_analysis(self) -> Dict:
+        """Placeholder analysis used when the LLM response can't be parsed"""
+        return {
+            "summary": "Failed to parse sentiment analysis response.",
+            "sentiment_score": 50,
+            "sentiment_label": "neutral",
+            "dominant_narratives": {"bullish": [], "bearish": []},
+            "news_flow": "mixed",
+            "contrarian_signals": [],
+            "key_factors": ["Data parsing error"],
+            "confidence": 0.3,
+            "risks": ["Analysis quality compromised"]
+        }
     
     def _enhance_analysis(self, analysis_result: Dict, sentiment_data: Dict) -> Dict:
         """Enhance analysis with additional metrics"""
@@ -515,24 +537,7 @@ Respond with JSON only, using the exact format specified in the system prompt.""
         """Extract asset symbol from query"""
         query_lower = query.lower()
         
-        symbol_mappings = {
-            'bitcoin': 'BTC',
-            'btc': 'BTC',
-            'ethereum': 'ETH',
-            'eth': 'ETH',
-            'ripple': 'XRP',
-            'xrp': 'XRP',
-            'cardano': 'ADA',
-            'ada': 'ADA',
-            'solana': 'SOL',
-            'sol': 'SOL',
-            'dogecoin': 'DOGE',
-            'doge': 'DOGE',
-            'usd': 'USD',
-            'dollar': 'USD',
-        }
-        
-        for term, symbol in symbol_mappings.items():
+        for term, symbol in _QUERY_SYMBOL_TERMS:
             if term in query_lower:
                 return symbol
         
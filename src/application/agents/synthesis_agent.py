@@ -4,8 +4,9 @@ FIXED VERSION - Handles both dict and object returns from agents
 LANGCHAIN VERSION - Integrates LangChain ConversationBufferMemory
 """
 import json
+import re
 import asyncio
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set
 from src.application.agents.base_agent import BaseAgent
 from src.application.agents.macro_analyst import MacroAnalyst
 from src.application.agents.technical_analyst import TechnicalAnalyst
@@ -13,37 +14,19 @@ from src.application.agents.sentiment_analyst import SentimentAnalyst
 from src.application.services.rag_service import RAGService
 from src.application.services.tts_service import TTSService
 from src.application.services.speech_service import SpeechService
-from src.application.services.translation_service import TranslationService
 from src.application.services.conversation_manager import ConversationManager
 from src.application.services.langchain_memory_service import LangChainMemoryService
 from src.domain.entities.analysis import Analysis, AgentAnalysis
 from src.domain.entities.conversation import MessageRole
 from src.domain.value_objects.timeframe import TimeframeVO
 from src.config.constants import MarketOutlook, TradingAction, RiskLevel
+from src.utilities.helpers import get_risk_level
 from src.utilities.logger import get_logger
 
 logger = get_logger(__name__)
 
-
-class SynthesisAgent(BaseAgent):
-    """Master agent that coordinates specialists and synthesizes results"""
-    
-    def __init__(self):
-        super().__init__(
-            name="Synthesis Agent",
-            description="Coordinates specialist agents and synthesizes comprehensive investment analysis"
-        )
-        self.macro_analyst = MacroAnalyst()
-        self.technical_analyst = TechnicalAnalyst()
-        self.sentiment_analyst = SentimentAnalyst()
-        self.rag_service = RAGService()
-        self.tts_service = TTSService()
-        self.speech_service = SpeechService()
-        self.translation_service = TranslationService()
-    
-    def get_system_prompt(self) -> str:
-        """Get system prompt for synthesis"""
-        return """You are a senior investment analyst synthesizing multiple specialist analyses.
+# Constant system prompt - built once at import, same object on every call
+_SYNTHESIS_SYSTEM_PROMPT = """You are a senior investment analyst synthesizing multiple specialist analyses.
 
 Your role is to:
 1. Identify agreements and contradictions between analyses
@@ -69,6 +52,69 @@ Provide synthesis in JSON format:
     "risk_mitigations": ["mitigation1", ...],
     "confidence": 0.0-1.0
 }"""
+
+# Specialists run by default; narrow with context["agents"]
+SPECIALIST_NAMES = ("macro", "technical", "sentiment")
+
+# Fire-and-forget conversation writes; the event loop only keeps weak
+# references to tasks, so hold them here until they finish
+_background_tasks: Set[asyncio.Task] = set()
+
+# Placeholder result for specialists left out of context["agents"]
+SKIPPED_RESULT = {"summary": "", "confidence": 0.0, "skipped": True}
+
+# Value -> member lookups, built once instead of per-request Enum(value) calls
+_OUTLOOK_BY_VALUE = {outlook.value: outlook for outlook in MarketOutlook}
+_ACTION_BY_VALUE = {action.value: action for action in TradingAction}
+
+# Direction keywords, matched case-insensitively at the start of a word
+# ("bullish", "upward", "selloff") in a single scan of the text
+_BULLISH_RE = re.compile(r"\b(?:bull|positive|up|higher|rally)", re.IGNORECASE)
+_BEARISH_RE = re.compile(r"\b(?:bear|negative|down|lower|sell)", re.IGNORECASE)
+
+
+def _classify_text_to_direction(text: str) -> str:
+    """Classify an outlook/summary text as bullish, bearish or neutral"""
+    if not text:
+        return "neutral"
+    if _BULLISH_RE.search(text):
+        return "bullish"
+    if _BEARISH_RE.search(text):
+        return "bearish"
+    return "neutral"
+
+
+def _short(text: str, max_words: int = 40) -> str:
+    """First sentence of a summary, cut to max_words words"""
+    if not text:
+        return ""
+    # partition stops at the first period; the maxsplit bound stops word
+    # splitting once we know the sentence is too long
+    first = text.partition(".")[0].strip()
+    words = first.split(None, max_words)
+    if len(words) <= max_words:
+        return first + '.'
+    return ' '.join(words[:max_words]) + '...'
+
+
+class SynthesisAgent(BaseAgent):
+    """Master agent that coordinates specialists and synthesizes results"""
+    
+    def __init__(self):
+        super().__init__(
+            name="Synthesis Agent",
+            description="Coordinates specialist agents and synthesizes comprehensive investment analysis"
+        )
+        self.macro_analyst = MacroAnalyst()
+        self.technical_analyst = TechnicalAnalyst()
+        self.sentiment_analyst = SentimentAnalyst()
+        self.rag_service = RAGService()
+        self.tts_service = TTSService()
+        self.speech_service = SpeechService()
+    
+    def get_system_prompt(self) -> str:
+        """Get system prompt for synthesis"""
+        return _SYNTHESIS_SYSTEM_PROMPT
     
     def _safe_get(self, obj: Any, key: str, default: Any = None) -> Any:
         """
@@ -140,7 +186,8 @@ Provide synthesis in JSON format:
         
         Args:
             query: Investment query
-            context: Additional context including asset and timeframe
+            context: Additional context including asset and timeframe;
+                "agents" limits which specialists run (e.g. ["technical"])
             
         Returns:
             Complete Analysis entity
@@ -150,7 +197,7 @@ Provide synthesis in JSON format:
             
             # Translate query to English if needed
             user_language = context.get("language", "en") if context else "en"
-            query_in_english = self.translation_service.translate_text(query, src=user_language, dest="en")
+            query_in_english = await self._translate_query_to_english(query, context)
             
             asset_symbol = context.get("asset_symbol", "MARKET") if context else "MARKET"
             
@@ -185,46 +232,45 @@ Provide synthesis in JSON format:
             documents = []
             logger.info(f"RAG service disabled - skipping document retrieval")
             
-            # Execute all specialist agents in parallel
-            macro_task = self.macro_analyst.analyze(enriched_query, context)
-            technical_task = self.technical_analyst.analyze(enriched_query, context)
-            sentiment_task = self.sentiment_analyst.analyze(enriched_query, context)
-            
-            macro_result, technical_result, sentiment_result = await asyncio.gather(
-                macro_task, technical_task, sentiment_task,
-                return_exceptions=True
-            )
-            
-            # Handle any errors
-            if isinstance(macro_result, Exception):
-                logger.error(f"Macro analyst error: {str(macro_result)}")
-                macro_result = {"error": str(macro_result), "summary": "Error in macro analysis"}
-            
-            if isinstance(technical_result, Exception):
-                logger.error(f"Technical analyst error: {str(technical_result)}")
-                technical_result = {"error": str(technical_result), "summary": "Error in technical analysis"}
+            # The specialists get the already-translated query, so they must
+            # not translate it again
+            specialist_context = {**(context or {}), "query_language": "en"}
             
-            if isinstance(sentiment_result, Exception):
-                logger.error(f"Sentiment analyst error: {str(sentiment_result)}")
-                sentiment_result = {"error": str(sentiment_result), "summary": "Error in sentiment analysis"}
+            # Execute the requested specialist agents in parallel (all by default);
+            # a skip_translation flag reaches them via specialist_context
+            specialists = {
+                "macro": self.macro_analyst,
+                "technical": self.technical_analyst,
+                "sentiment": self.sentiment_analyst
+            }
+            requested = (context or {}).get("agents") or SPECIALIST_NAMES
+            tasks = {
+                name: agent.analyze(enriched_query, specialist_context)
+                for name, agent in specialists.items()
+                if name in requested
+            }
+            if not tasks:
+                logger.warning(f"No known specialists in {requested}, running all")
+                tasks = {
+                    name: agent.analyze(enriched_query, specialist_context)
+                    for name, agent in specialists.items()
+                }
             
-            # Ensure all results are dicts (convert objects if needed)
-            macro_result = self._ensure_dict(macro_result)
-            technical_result = self._ensure_dict(technical_result)
-            sentiment_result = self._ensure_dict(sentiment_result)
+            results = dict(zip(tasks, await asyncio.gather(*tasks.values(), return_exceptions=True)))
             
-            logger.info(f"Agent results - Macro: {type(macro_result)}, Technical: {type(technical_result)}, Sentiment: {type(sentiment_result)}")
+            # Specialists catch their own errors, so exceptions here are rare -
+            # one scan, and only failed results are rebuilt
+            for name, result in results.items():
+                if isinstance(result, BaseException):
+                    logger.error(f"{name.capitalize()} analyst error: {str(result)}")
+                    results[name] = {"error": str(result), "summary": f"Error in {name} analysis"}
+                elif not isinstance(result, dict):
+                    # Convert result objects (e.g. SentimentAnalysis) to dicts
+                    results[name] = self._ensure_dict(result)
             
-            # Convert SentimentAnalysis to dict immediately
-            if hasattr(sentiment_result, 'to_dict') and not isinstance(sentiment_result, dict):
-                sentiment_result = sentiment_result.to_dict()
-            
-            # Also convert macro and technical results to dicts if they have to_dict method
-            if hasattr(macro_result, 'to_dict') and not isinstance(macro_result, dict):
-                macro_result = macro_result.to_dict()
-                
-            if hasattr(technical_result, 'to_dict') and not isinstance(technical_result, dict):
-                technical_result = technical_result.to_dict()
+            macro_result = results.get("macro", dict(SKIPPED_RESULT))
+            technical_result = results.get("technical", dict(SKIPPED_RESULT))
+            sentiment_result = results.get("sentiment", dict(SKIPPED_RESULT))
             
             # Synthesize results
             synthesis = await self._synthesize_results(
@@ -236,14 +282,14 @@ Provide synthesis in JSON format:
             )
             
             # Translate response back to user's language
-            translated_summary = self.translation_service.translate_text(
-                synthesis.get("executive_summary", ""), src="en", dest=user_language
+            translated_summary = await self._translate_from_english(
+                synthesis.get("executive_summary", ""), context
             )
             synthesis["executive_summary"] = translated_summary
             
             # Convert response to speech if requested
             if context.get("audio_output", False):
-                audio_path = self.tts_service.text_to_speech(translated_summary, language=user_language)
+                audio_path = await self.tts_service.text_to_speech_async(translated_summary, language=user_language)
                 synthesis["audio_path"] = audio_path
             
             # Create Analysis entity
@@ -271,47 +317,22 @@ Provide synthesis in JSON format:
             except Exception as e:
                 logger.error(f"Error storing in LangChain memory: {str(e)}")
             
-            # Also store in legacy conversation memory if available (backward compatibility)
+            # Also store in legacy conversation memory if available (backward compatibility).
+            # The writes hit the database and Redis, so run them off the response path
             session_id = context.get("session_id") if context else None
             conversation_id = context.get("conversation_id") if context else None
             
             if session_id and conversation_id:
-                try:
-                    # Add user query to conversation
-                    ConversationManager.add_message(
-                        session_id,
-                        conversation_id,
-                        MessageRole.USER,
-                        query,
-                        metadata={"asset_symbol": asset_symbol}
-                    )
-                    
-                    # Add assistant response to conversation
-                    assistant_response = synthesis.get("final_response", synthesis.get("executive_summary", ""))
-                    ConversationManager.add_message(
-                        session_id,
-                        conversation_id,
-                        MessageRole.ASSISTANT,
-                        assistant_response,
-                        metadata={
-                            "outlook": synthesis.get("outlook"),
-                            "confidence": synthesis.get("confidence"),
-                            "action": synthesis.get("trading_action")
-                        }
-                    )
-                    
-                    # Update conversation context with latest analysis
-                    ConversationManager.update_conversation_context(
-                        session_id,
-                        conversation_id,
-                        outlook=synthesis.get("outlook", "neutral"),
-                        confidence=float(synthesis.get("confidence", 0.5)),
-                        action=synthesis.get("trading_action", "hold")
-                    )
-                    
-                    logger.info(f"Stored analysis in conversation memory for {conversation_id}")
-                except Exception as e:
-                    logger.warning(f"Failed to store in conversation memory: {e}")
+                task = asyncio.create_task(asyncio.to_thread(
+                    self._persist_conversation,
+                    session_id,
+                    conversation_id,
+                    query,
+                    asset_symbol,
+                    synthesis
+                ))
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
             
             return analysis
             
@@ -319,6 +340,52 @@ Provide synthesis in JSON format:
             logger.error(f"Error in Synthesis Agent: {str(e)}", exc_info=True)
             raise
     
+    def _persist_conversation(
+        self,
+        session_id: str,
+        conversation_id: str,
+        query: str,
+        asset_symbol: str,
+        synthesis: Dict[str, Any]
+    ) -> None:
+        """Store the query and synthesized response in legacy conversation memory"""
+        try:
+            # Add user query to conversation
+            ConversationManager.add_message(
+                session_id,
+                conversation_id,
+                MessageRole.USER,
+                query,
+                metadata={"asset_symbol": asset_symbol}
+            )
+            
+            # Add assistant response to conversation
+            assistant_response = synthesis.get("final_response", synthesis.get("executive_summary", ""))
+            ConversationManager.add_message(
+                session_id,
+                conversation_id,
+                MessageRole.ASSISTANT,
+                assistant_response,
+                metadata={
+                    "outlook": synthesis.get("outlook"),
+                    "confidence": synthesis.get("confidence"),
+                    "action": synthesis.get("trading_action")
+                }
+            )
+            
+            # Update conversation context with latest analysis
+            ConversationManager.update_conversation_context(
+                session_id,
+                conversation_id,
+                outlook=synthesis.get("outlook", "neutral"),
+                confidence=float(synthesis.get("confidence", 0.5)),
+                action=synthesis.get("trading_action", "hold")
+            )
+            
+            logger.info(f"Stored analysis in conversation memory for {conversation_id}")
+        except Exception as e:
+            logger.warning(f"Failed to store in conversation memory: {e}")
+    
     async def _synthesize_results(
         self,
         query: str,
@@ -329,31 +396,31 @@ Provide synthesis in JSON format:
     ) -> Dict[str, Any]:
         """Create a deterministic, section-by-section synthesis"""
         
-        def _classify_text_to_direction(text: str) -> str:
-            if not text:
-                return "neutral"
-            t = text.lower()
-            if any(k in t for k in ["bull", "positive", "up", "higher", "rally"]):
-                return "bullish"
-            if any(k in t for k in ["bear", "negative", "down", "lower", "sell"]):
-                return "bearish"
-            return "neutral"
-        
         # Extract summaries and confidences using safe_get
         macro_summary = self._safe_get(macro, "summary", "")
         technical_summary = self._safe_get(technical, "summary", "")
         sentiment_summary = self._safe_get(sentiment, "summary", "")
         
-        macro_conf = float(self._safe_get(macro, "confidence", 0.5) or 0.5)
-        technical_conf = float(self._safe_get(technical, "confidence", 0.5) or 0.5)
-        sentiment_conf = float(self._safe_get(sentiment, "confidence", 0.5) or 0.5)
+        # Specialists left out of context["agents"] don't weigh in on the
+        # confidence, the vote or the summary
+        sources = {"macro": macro, "technical": technical, "sentiment": sentiment}
+        active = {
+            name: src for name, src in sources.items()
+            if not self._safe_get(src, "skipped", False)
+        }
         
-        # Classify outlooks/trends
-        macro_dir = _classify_text_to_direction(self._safe_get(macro, "outlook", macro_summary))
-        technical_dir = _classify_text_to_direction(self._safe_get(technical, "trend", technical_summary))
-        sentiment_dir = _classify_text_to_direction(self._safe_get(sentiment, "sentiment_label", sentiment_summary))
+        confidences = [float(self._safe_get(src, "confidence", 0.5) or 0.5) for src in active.values()]
         
-        directions = [macro_dir, technical_dir, sentiment_dir]
+        # Classify outlooks/trends
+        direction_fields = {
+            "macro": ("outlook", macro_summary),
+            "technical": ("trend", technical_summary),
+            "sentiment": ("sentiment_label", sentiment_summary)
+        }
+        directions = [
+            _classify_text_to_direction(self._safe_get(src, *direction_fields[name]))
+            for name, src in active.items()
+        ]
         
         # Majority vote for final outlook
         bullish_count = sum(1 for d in directions if d == "bullish")
@@ -375,7 +442,7 @@ Provide synthesis in JSON format:
             trading_action = "hold"
         
         # Position sizing based on confidence
-        avg_conf = (macro_conf + technical_conf + sentiment_conf) / 3.0
+        avg_conf = sum(confidences) / len(confidences) if confidences else 0.5
         if avg_conf >= 0.75:
             position_sizing = "large"
         elif avg_conf >= 0.6:
@@ -383,22 +450,23 @@ Provide synthesis in JSON format:
         else:
             position_sizing = "small"
         
-        # Collect factors and risks
-        def _collect_list(field: str, *sources: Dict) -> List[str]:
-            items = []
-            for s in sources:
-                field_value = self._safe_get(s, field, [])
-                if field_value:
-                    for it in field_value:
-                        if isinstance(it, str) and it.strip() and it not in items:
-                            items.append(it)
-            return items
-        
-        bullish_factors = _collect_list("bullish_factors", macro, technical, sentiment)
-        bearish_factors = _collect_list("bearish_factors", macro, technical, sentiment)
-        critical_factors = _collect_list("critical_factors", macro, technical, sentiment)
-        key_risks = _collect_list("key_risks", macro, technical, sentiment)
-        risk_mitigations = _collect_list("risk_mitigations", macro, technical, sentiment)
+        # Collect factors and risks in one pass over the sources, deduplicating
+        # each list with a set instead of rescanning the list per item
+        list_fields = ("bullish_factors", "bearish_factors", "critical_factors", "key_risks", "risk_mitigations")
+        collected: Dict[str, List[str]] = {field: [] for field in list_fields}
+        seen: Dict[str, set] = {field: set() for field in list_fields}
+        for source in active.values():
+            for field in list_fields:
+                for it in self._safe_get(source, field, []) or ():
+                    if isinstance(it, str) and it.strip() and it not in seen[field]:
+                        seen[field].add(it)
+                        collected[field].append(it)
+        
+        bullish_factors = collected["bullish_factors"]
+        bearish_factors = collected["bearish_factors"]
+        critical_factors = collected["critical_factors"]
+        key_risks = collected["key_risks"]
+        risk_mitigations = collected["risk_mitigations"]
         # Enhanced risk assessment - ensure we always have comprehensive risks
         if not key_risks or len(key_risks) < 3:
             default_risks = [
@@ -423,23 +491,13 @@ Provide synthesis in JSON format:
         
         # Build investment thesis
         thesis_parts = []
-        for src in (macro, technical, sentiment):
+        for src in active.values():
             t = self._safe_get(src, "investment_thesis") or self._safe_get(src, "detailed_analysis")
             if isinstance(t, str) and t.strip():
                 thesis_parts.append(t.strip())
         
         investment_thesis = " \n\n ".join(thesis_parts) if thesis_parts else "Combined analysis from specialists."
         
-        def _short(text: str, max_words: int = 40) -> str:
-            if not text:
-                return ""
-            parts = text.split(".")
-            first = parts[0].strip()
-            words = first.split()
-            if len(words) <= max_words:
-                return first if first.endswith('.') else first + '.'
-            return ' '.join(words[:max_words]) + '...'
-        
         mac_short = _short(macro_summary, 40)
         tech_short = _short(technical_summary, 40)
         sent_short = _short(sentiment_summary, 40)
@@ -528,19 +586,21 @@ Provide synthesis in JSON format:
             else:
                 time_horizon = "long"  # Low confidence = longer timeframe
         
-        executive_summary = (
-            f"Technical analysis summary: {tech_short}\n"
-            f"Macro analyst summary: {mac_short}\n"
-            f"Sentiment analyst summary: {sent_short}\n"
+        summary_lines = [
+            f"{label} summary: {short}\n"
+            for name, label, short in (
+                ("technical", "Technical analysis", tech_short),
+                ("macro", "Macro analyst", mac_short),
+                ("sentiment", "Sentiment analyst", sent_short)
+            )
+            if name in active
+        ]
+        executive_summary = "".join(summary_lines) + (
             f"Final: Outlook={final_outlook}. Recommendation={trading_action} (position={position_sizing}; confidence={round(avg_conf,2)})."
         )
         
         synthesis = {
-            "sections": {
-                "macro": macro,
-                "technical": technical,
-                "sentiment": sentiment
-            },
+            "sections": active,
             "executive_summary": executive_summary,
             "investment_thesis": investment_thesis,
             "outlook": final_outlook,
@@ -574,8 +634,8 @@ Provide synthesis in JSON format:
     ) -> Analysis:
         """Create Analysis entity from results using safe_get"""
         
-        # Create AgentAnalysis objects using _safe_get
-        macro_analysis = AgentAnalysis(
+        # Create AgentAnalysis objects using _safe_get (None for skipped specialists)
+        macro_analysis = None if self._safe_get(macro_result, "skipped", False) else AgentAnalysis(
             agent_name=self._safe_get(macro_result, "agent_name", "Macro Analyst"),
             summary=self._safe_get(macro_result, "summary", ""),
             confidence=self._safe_get(macro_result, "confidence", 0.5),
@@ -584,7 +644,7 @@ Provide synthesis in JSON format:
             detailed_analysis=self._safe_get(macro_result, "detailed_analysis", {})
         )
         
-        technical_analysis = AgentAnalysis(
+        technical_analysis = None if self._safe_get(technical_result, "skipped", False) else AgentAnalysis(
             agent_name=self._safe_get(technical_result, "agent_name", "Technical Analyst"),
             summary=self._safe_get(technical_result, "summary", ""),
             confidence=self._safe_get(technical_result, "confidence", 0.5),
@@ -593,7 +653,7 @@ Provide synthesis in JSON format:
             detailed_analysis=self._safe_get(technical_result, "detailed_analysis", {})
         )
         
-        sentiment_analysis = AgentAnalysis(
+        sentiment_analysis = None if self._safe_get(sentiment_result, "skipped", False) else AgentAnalysis(
             agent_name=self._safe_get(sentiment_result, "agent_name", "Sentiment Analyst"),
             summary=self._safe_get(sentiment_result, "summary", ""),
             confidence=self._safe_get(sentiment_result, "confidence", 0.5),
@@ -602,13 +662,9 @@ Provide synthesis in JSON format:
             detailed_analysis=self._safe_get(sentiment_result, "detailed_analysis", {})
         )
         
-        # Calculate overall confidence
-        confidences = [
-            self._safe_get(macro_result, "confidence", 0.5),
-            self._safe_get(technical_result, "confidence", 0.5),
-            self._safe_get(sentiment_result, "confidence", 0.5)
-        ]
-        overall_confidence = sum(confidences) / len(confidences)
+        # Reuse the confidence averaged in _synthesize_results so the entity
+        # and the synthesis text can't disagree
+        overall_confidence = float(synthesis.get("confidence", 0.5))
         
         # Calculate risk score
         risk_score = 1 - overall_confidence
@@ -618,11 +674,11 @@ Provide synthesis in JSON format:
             asset_symbol=asset_symbol,
             executive_summary=synthesis.get("executive_summary", ""),
             investment_thesis=synthesis.get("investment_thesis", ""),
-            outlook=MarketOutlook(synthesis.get("outlook", "neutral")),
+            outlook=_OUTLOOK_BY_VALUE.get(synthesis.get("outlook"), MarketOutlook.NEUTRAL),
             overall_confidence=overall_confidence,
             risk_level=self._get_risk_level(risk_score),
             risk_score=risk_score,
-            trading_action=TradingAction(synthesis.get("trading_action", "hold")),
+            trading_action=_ACTION_BY_VALUE.get(synthesis.get("trading_action"), TradingAction.HOLD),
             position_sizing=synthesis.get("position_sizing", "small"),
             entry_points=synthesis.get("entry_points", []),
             stop_loss=synthesis.get("stop_loss"),
@@ -639,13 +695,4 @@ Provide synthesis in JSON format:
     
     def _get_risk_level(self, risk_score: float) -> RiskLevel:
         """Convert risk score to risk level"""
-        if risk_score < 0.2:
-            return RiskLevel.VERY_LOW
-        elif risk_score < 0.4:
-            return RiskLevel.LOW
-        elif risk_score < 0.6:
-            return RiskLevel.MEDIUM
-        elif risk_score < 0.8:
-            return RiskLevel.HIGH
-        else:
-            return RiskLevel.VERY_HIGH
\ No newline at end of file
+        return get_risk_level(risk_score)
\ No newline at end of file
@@ -1,14 +1,14 @@
 """
 Technical Analyst Agent - Analyzes price action and technical indicators
 """
-import json
+import asyncio
 from typing import Dict, Any, Optional, List
 from src.application.agents.base_agent import BaseAgent
 from src.application.services.rag_service import RAGService
 from src.application.services.tts_service import TTSService
 from src.application.services.speech_service import SpeechService
-from src.application.services.translation_service import TranslationService
 from src.adapters.external.coingecko_client import CoinGeckoClient 
+from src.utilities import json_io
 from src.utilities.logger import get_logger 
 import pandas as pd
 from ta import momentum, trend, volatility
@@ -16,23 +16,8 @@ from datetime import datetime, timedelta
 
 logger = get_logger(__name__)
 
-
-class TechnicalAnalyst(BaseAgent):
-    """Agent specialized in technical analysis"""
-    
-    def __init__(self):
-        super().__init__(
-            name="Technical Analyst",
-            description="Analyzes price action, technical indicators, and on-chain metrics"
-        )
-        self.rag_service = RAGService()
-        self.tts_service = TTSService()
-        self.speech_service = SpeechService()
-        self.translation_service = TranslationService()
-    
-    def get_system_prompt(self) -> str:
-        """Get system prompt for technical analysis"""
-        return """You are an expert technical analyst specializing in:
+# Constant system prompt - built once at import, same object on every call
+_TECHNICAL_SYSTEM_PROMPT = """You are an expert technical analyst specializing in:
 - Price action and chart patterns
 - Technical indicators (RSI, MACD, Moving Averages, Bollinger Bands)
 - Support and resistance levels
@@ -55,6 +40,50 @@ Provide analysis in JSON format with:
     "confidence": 0.0-1.0,
     "risks": ["risk1", "risk2", ...]
 }"""
+
+# Retrieved documents passed to the LLM, best-scoring first
+MAX_PROMPT_DOCUMENTS = 5
+
+
+def _documents_to_columns(documents: List[Dict], top_k: int = MAX_PROMPT_DOCUMENTS) -> Dict[str, List]:
+    """
+    Pack retrieved documents column-wise for the prompt
+
+    Sending one list per field instead of one object per document avoids
+    repeating every key for every document, which saves prompt tokens.
+
+    Args:
+        documents: RAG documents with text/score fields
+        top_k: Number of highest-scoring documents to keep
+
+    Returns:
+        Dict of parallel texts/scores lists
+    """
+    top = sorted(documents, key=lambda doc: doc.get("score", 0), reverse=True)[:top_k]
+    return {
+        "texts": [doc.get("text", "") for doc in top],
+        "scores": [doc.get("score", 0) for doc in top]
+    }
+
+
+class TechnicalAnalyst(BaseAgent):
+    """Agent specialized in technical analysis"""
+    
+    def __init__(self):
+        super().__init__(
+            name="Technical Analyst",
+            description="Analyzes price action, technical indicators, and on-chain metrics"
+        )
+        self.rag_service = RAGService()
+        self.tts_service = TTSService()
+        self.speech_service = SpeechService()
+        
+        # Long-lived client - requests share the pooled HTTP session
+        self.coingecko_client = CoinGeckoClient()
+    
+    def get_system_prompt(self) -> str:
+        """Get system prompt for technical analysis"""
+        return _TECHNICAL_SYSTEM_PROMPT
     
     async def analyze(
         self,
@@ -74,7 +103,7 @@ Provide analysis in JSON format with:
         try:
             # Translate query to English if needed
             user_language = context.get("language", "en") if context else "en"
-            query_in_english = self.translation_service.translate_text(query, src=user_language, dest="en")
+            query_in_english = await self._translate_query_to_english(query, context)
             
             asset_symbol = context.get("asset_symbol", "BTC") if context else "BTC"
             include_historical = context.get("include_historical", False) if context else False
@@ -99,12 +128,12 @@ Provide analysis in JSON format with:
             user_prompt = f"""Analyze technical indicators for {asset_symbol}: {query_in_english}
 
 Technical Data:
-{json.dumps(technical_data, indent=2)}
+{json_io.dumps(technical_data)}
 
 Retrieved Context:
-{json.dumps(documents, indent=2)}
+{json_io.dumps(_documents_to_columns(documents))}
 
-{f"Historical Context ({specific_date}):" + json.dumps(historical_context, indent=2) if historical_context else ""}
+{f"Historical Context ({specific_date}):" + json_io.dumps(historical_context) if historical_context else ""}
 
 Provide comprehensive technical analysis with specific price levels, considering:
 - Multi-timeframe trends (1h, 24h, 7d, 14d, 30d)
@@ -121,8 +150,8 @@ Provide comprehensive technical analysis with specific price levels, considering
             
             # Parse response
             try:
-                analysis = json.loads(response)
-            except json.JSONDecodeError:
+                analysis = json_io.extract_object(response)
+            except json_io.JSONDecodeError:
                 analysis = {
                     "summary": response,
                     "confidence": 0.6,
@@ -140,14 +169,14 @@ Provide comprehensive technical analysis with specific price levels, considering
             }
             
             # Translate response back to user's language
-            translated_response = self.translation_service.translate_text(
-                analysis.get("summary", ""), src="en", dest=user_language
+            translated_response = await self._translate_from_english(
+                analysis.get("summary", ""), context
             )
             analysis["summary"] = translated_response
             
             # Convert response to speech if requested
             if context.get("audio_output", False):
-                audio_path = self.tts_service.text_to_speech(translated_response, language=user_language)
+                audio_path = await self.tts_service.text_to_speech_async(translated_response, language=user_language)
                 analysis["audio_path"] = audio_path
             
             return self.format_output(
@@ -184,18 +213,18 @@ Provide comprehensive technical analysis with specific price levels, considering
             Historical data for comparison
         """
         try:
-            async with CoinGeckoClient() as coingecko:
-                coin_id = coingecko.normalize_symbol(symbol)
-                history = await coingecko.get_coin_history(coin_id, date)
-                
-                market_data = history.get('market_data', {})
-                return {
-                    "date": date,
-                    "price": market_data.get('current_price', {}).get('usd', 0),
-                    "market_cap": market_data.get('market_cap', {}).get('usd', 0),
-                    "total_volume": market_data.get('total_volume', {}).get('usd', 0),
-                    "available": True
-                }
+            coingecko = self.coingecko_client
+            coin_id = coingecko.normalize_symbol(symbol)
+            history = await coingecko.get_coin_history(coin_id, date)
+            
+            market_data = history.get('market_data', {})
+            return {
+                "date": date,
+                "price": market_data.get('current_price', {}).get('usd', 0),
+                "market_cap": market_data.get('market_cap', {}).get('usd', 0),
+                "total_volume": market_data.get('total_volume', {}).get('usd', 0),
+                "available": True
+            }
         except Exception as e:
             logger.error(f"Failed to get historical context for {date}: {str(e)}")
             return {"available": False, "error": str(e)}
@@ -253,60 +282,68 @@ Provide comprehensive technical analysis with specific price levels, considering
     
     async def _get_coingecko_data(self, symbol: str) -> Dict[str, Any]:
         """Get data from CoinGecko and calculate indicators with enhanced market data"""
-        async with CoinGeckoClient() as coingecko:
-            # Convert symbol to CoinGecko ID
-            coin_id = coingecko.normalize_symbol(symbol)
-            
-            # Get enhanced market data with multiple timeframes
-            markets_data = await coingecko.get_coins_markets(
+        coingecko = self.coingecko_client
+        # Convert symbol to CoinGecko ID
+        coin_id = coingecko.normalize_symbol(symbol)
+        
+        # The endpoints are independent, so issue them concurrently over the
+        # shared keep-alive connection pool instead of one round trip at a time
+        markets_data, simple_price, ohlc_data, coin_data, tickers_data = await asyncio.gather(
+            # Enhanced market data with multiple timeframes
+            coingecko.get_coins_markets(
                 coin_ids=[coin_id],
                 vs_currency="usd",
                 sparkline=True,
                 price_change_percentage=["1h", "24h", "7d", "14d", "30d"]
-            )
-            
-            # Get current price and 24h data
-            simple_price = await coingecko.get_simple_price(
+            ),
+            # Current price and 24h data
+            coingecko.get_simple_price(
                 coin_ids=[coin_id],
                 include_24h_change=True,
                 include_market_cap=True,
                 include_24h_volume=True
+            ),
+            # OHLC data for accurate technical indicators (up to 365 days)
+            coingecko.get_coin_ohlc(
+                coin_id=coin_id,
+                vs_currency="usd",
+                days= '7'
+            ),
+            # Comprehensive coin data
+            coingecko.get_coin_data(coin_id),
+            # Top tickers with orderbook depth for liquidity analysis
+            coingecko.get_coin_tickers(
+                coin_id=coin_id,
+                depth=True,
+                page=1
+            ),
+            return_exceptions=True
+        )
+        
+        # Market, price and coin data are required
+        for result in (markets_data, simple_price, coin_data):
+            if isinstance(result, Exception):
+                raise result
+        
+        if isinstance(ohlc_data, Exception):
+            logger.warning(f"OHLC data unavailable, falling back to market_chart: {str(ohlc_data)}")
+            use_ohlc = False
+            # Fallback to market_chart for closing prices
+            market_chart = await coingecko.get_market_chart(
+                coin_id=coin_id,
+                vs_currency="usd",
+                days=200
             )
-            
-            # Get OHLC data for accurate technical indicators (up to 365 days)
-            try:
-                ohlc_data = await coingecko.get_coin_ohlc(
-                    coin_id=coin_id,
-                    vs_currency="usd",
-                    days= '7'
-                )
-                use_ohlc = True
-                logger.info(f"Retrieved {len(ohlc_data)} OHLC candles for {symbol}")
-            except Exception as e:
-                logger.warning(f"OHLC data unavailable, falling back to market_chart: {str(e)}")
-                use_ohlc = False
-                # Fallback to market_chart for closing prices
-                market_chart = await coingecko.get_market_chart(
-                    coin_id=coin_id,
-                    vs_currency="usd",
-                    days=200
-                )
-            
-            # Get comprehensive coin data
-            coin_data = await coingecko.get_coin_data(coin_id)
-            
-            # Get top tickers with orderbook depth for liquidity analysis
-            try:
-                tickers_data = await coingecko.get_coin_tickers(
-                    coin_id=coin_id,
-                    depth=True,
-                    page=1
-                )
-                logger.info(f"Retrieved {len(tickers_data.get('tickers', []))} tickers for {symbol}")
-            except Exception as e:
-                logger.warning(f"Tickers data unavailable: {str(e)}")
-                tickers_data = {"tickers": []}
+        else:
+            use_ohlc = True
+            logger.info(f"Retrieved {len(ohlc_data)} OHLC candles for {symbol}")
         
+        if isinstance(tickers_data, Exception):
+            logger.warning(f"Tickers data unavailable: {str(tickers_data)}")
+            tickers_data = {"tickers": []}
+        else:
+            logger.info(f"Retrieved {len(tickers_data.get('tickers', []))} tickers for {symbol}")
+    
         # Convert to DataFrame based on data type
         if use_ohlc:
             # OHLC format: [timestamp, open, high, low, close]
@@ -448,12 +485,10 @@ async def main():
     print("=" * 60)
     print("ANALYSIS RESULTS")
     print("=" * 60)
-    print(json.dumps(result, indent=2))
+    print(json_io.dumps(result, indent=True))
     print("\n" + "=" * 60)
 
 
 if __name__ == "__main__":
-    import asyncio
-    
     # Run the example
     asyncio.run(main())
\ No newline at end of file
@@ -1,21 +1,151 @@
 """
 Analysis Service - Coordinates analysis workflow
 """
-from typing import Optional, Dict
+import asyncio
+import weakref
+from enum import Enum
+from typing import Optional, Dict, List, Set, Any
 from datetime import datetime, timedelta
+from src.adapters.external.response_cache import ResponseCache
 from src.application.agents.synthesis_agent import SynthesisAgent
-from src.domain.entities.analysis import Analysis
+from src.domain.entities.analysis import Analysis, AgentAnalysis
 from src.domain.value_objects.timeframe import TimeframeVO
 from src.config.constants import MarketOutlook, TradingAction, RiskLevel
 from src.infrastructure.cache import get_cache
-from src.infrastructure.database import get_db
-from src.config.constants import CACHE_ANALYSIS
+from src.infrastructure.database import DatabaseManager, get_db
+from src.infrastructure.orm import analysis_table
+from src.config.constants import CACHE_ANALYSIS, ANALYSIS_TTL_BY_TIMEFRAME, ANALYSIS_DEFAULT_TTL
 from src.utilities.logger import get_logger
 import json
 import hashlib
+from functools import partial
+from sqlalchemy import text
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
 
 logger = get_logger(__name__)
 
+# Analyses are inserted in batches of up to BATCH_MAX_ROWS, waiting at most
+# BATCH_MAX_DELAY seconds for a batch to fill
+BATCH_MAX_ROWS = 100
+BATCH_MAX_DELAY = 0.5
+# Built once rather than per batch
+_ASYNC_COMMIT_SQL = text("SET LOCAL synchronous_commit = OFF")
+
+
+def _analysis_row(analysis: Analysis) -> Dict[str, Any]:
+    """Snapshot an analysis into a plain analysis_table row"""
+    row = {}
+    for column in analysis_table.columns:
+        if column.primary_key:
+            continue
+        value = getattr(analysis, column.name, None)
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, AgentAnalysis):
+            value = value.to_dict()
+        elif isinstance(value, (list, dict)):
+            value = value.copy()
+        row[column.name] = value
+    return row
+
+
+class _AnalysisWriter:
+    """
+    Background writer that batches analysis INSERTs
+
+    Analyses queued within the batch window are inserted in one transaction,
+    so bursts pay for one commit (and one WAL sync) instead of one per
+    analysis.
+    """
+
+    def __init__(self, db: DatabaseManager):
+        self.db = db
+        self._queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def submit(self, analysis: Analysis) -> None:
+        """Queue an analysis, starting the flush task if it is idle"""
+        # The caller keeps using the entity, so the writer thread only ever
+        # sees a row snapshot taken here on the event loop
+        self._queue.put_nowait(_analysis_row(analysis))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def flush(self) -> None:
+        """Wait until every queued analysis has been written"""
+        if self._task is not None:
+            await self._task
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            deadline = loop.time() + BATCH_MAX_DELAY
+            while len(batch) < BATCH_MAX_ROWS:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # The ORM session is synchronous - keep the INSERT off the event loop
+            await asyncio.to_thread(self._insert_batch, batch)
+
+    def _insert_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Insert a batch of analysis rows in a single transaction"""
+        try:
+            with self.db.get_session() as session:
+                if session.get_bind().dialect.name == "postgresql":
+                    # Losing the last few analyses on a crash is acceptable;
+                    # don't wait for the WAL flush on commit
+                    session.execute(_ASYNC_COMMIT_SQL)
+                self.db.bulk_insert(analysis_table, batch, session=session)
+            logger.info(f"Stored {len(batch)} analyses")
+        except Exception as e:
+            logger.error(f"Error storing {len(batch)} analyses: {str(e)}")
+
+
+# One writer per event loop (its queue and task are bound to the loop)
+_writers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _AnalysisWriter]" = weakref.WeakKeyDictionary()
+
+
+def _get_writer(db: DatabaseManager) -> _AnalysisWriter:
+    """Get the analysis writer for the running event loop"""
+    loop = asyncio.get_running_loop()
+    writer = _writers.get(loop)
+    if writer is None:
+        writer = _writers[loop] = _AnalysisWriter(db)
+    return writer
+
+
+async def flush_pending_analyses() -> None:
+    """Write out queued analyses (call before shutting down)"""
+    writer = _writers.get(asyncio.get_running_loop())
+    if writer is not None:
+        await writer.flush()
+
+# Process-local tier in front of the shared (Redis) analysis cache. Entries
+# live briefly, which bounds staleness when another process invalidates
+LOCAL_CACHE_TTL = 60
+_local_cache = ResponseCache(maxsize=1024)
+_local_keys_by_asset: Dict[str, Set[str]] = {}
+
+# Cache keys and analysis ids are not security sensitive, so use a fast
+# non-cryptographic hash when available (blake2b is the stdlib fallback)
+if HAS_XXHASH:
+    _hash = xxhash.xxh64
+    _id_hash = xxhash.xxh128
+else:
+    _hash = partial(hashlib.blake2b, digest_size=8)
+    _id_hash = partial(hashlib.blake2b, digest_size=16)
+
 
 class AnalysisService:
     """Service for handling analysis requests"""
@@ -42,7 +172,7 @@ class AnalysisService:
         - First query about an asset: Run all agents, fetch fresh data
         - Follow-up questions: Use cached analysis from conversation
         - New asset: Run agents again
-        - Stale data (>30 min): Refresh by running agents
+        - Stale data (older than the timeframe's TTL): Refresh by running agents
         
         Conversation memory is handled by Gemini AI in the frontend.
         Backend only uses conversation_id to determine caching strategy.
@@ -98,10 +228,17 @@ class AnalysisService:
                 # Execute analysis with agents
                 analysis = await self.synthesis_agent.analyze(query, analysis_context)
                 
+                # A fresh analysis supersedes anything cached for this asset
+                try:
+                    self._invalidate_local(asset_symbol)
+                    self.cache.invalidate_index(self._analysis_index_key(asset_symbol))
+                except Exception as e:
+                    logger.error(f"Error invalidating cached analyses: {str(e)}")
+                
                 # Store analysis for future use in this conversation
                 if conversation_id:
                     await self._cache_analysis_for_conversation(
-                        conversation_id, asset_symbol, analysis
+                        conversation_id, asset_symbol, analysis, timeframe
                     )
                 
             else:
@@ -113,7 +250,7 @@ class AnalysisService:
                     query, asset_symbol, cached_analysis, timeframe
                 )
             
-            # Store in database
+            # Store in database (batched in the background)
             await self._store_analysis(analysis)
             
             return analysis
@@ -131,31 +268,23 @@ class AnalysisService:
                 None,
                 None
             )
-            self.cache.set(
+            analysis_dict = analysis.to_dict()
+            # Replace (not just add to) the cached analyses for this asset, so
+            # other phrasings of the same question can't serve a stale one
+            self._invalidate_local(analysis.asset_symbol)
+            self.cache.replace_indexed(
+                self._analysis_index_key(analysis.asset_symbol),
                 cache_key,
-                analysis.to_dict(),
-                ttl=1800  # Cache for 30 minutes
+                analysis_dict,
+                ttl=ANALYSIS_DEFAULT_TTL  # No timeframe known here
             )
+            self._set_local(analysis.asset_symbol, cache_key, analysis_dict)
         except Exception as e:
             logger.error(f"Error caching analysis: {str(e)}")
     
     async def _store_analysis(self, analysis: Analysis):
-        """Store analysis in the database"""
-        try:
-            # USE THE ASYNC VERSION
-            async with self.db.get_session_async() as session:
-                session.add(analysis)
-                # Commit breaks the link, but we can refresh to get fresh data
-                # However, with standard Session (not AsyncSession), commit is sync.
-                # get_session_async is yielding a *synchronous* Session wrapper in an async manager.
-                # So we use sync methods.
-                session.commit()
-                session.refresh(analysis)
-                # Expunge checks the object out of the session so it persists after session.close()
-                session.expunge(analysis)
-                logger.info("Analysis stored successfully.")
-        except Exception as e:
-            logger.error(f"Error storing analysis: {str(e)}")
+        """Queue analysis for the next batched database insert"""
+        _get_writer(self.db).submit(analysis)
     
     def _generate_cache_key(
         self,
@@ -165,27 +294,46 @@ class AnalysisService:
         context: Optional[Dict]
     ) -> str:
         """Generate cache key for analysis"""
-        key_parts = [query, asset_symbol]
+        # Feed the ":"-separated parts to the hasher directly instead of
+        # building and encoding a joined key string (same digest either way)
+        hasher = _hash()
+        hasher.update(query.encode())
+        hasher.update(b":")
+        hasher.update(asset_symbol.encode())
         
         if timeframe:
-            key_parts.append(timeframe.timeframe.value)
+            hasher.update(b":")
+            hasher.update(timeframe.timeframe.encode())
         
         # Include relevant context parts in cache key
         if context:
             # Include conversation_id if present (for conversation memory)
             if 'conversation_id' in context:
-                key_parts.append(f"conversation:{context['conversation_id']}")
+                hasher.update(f":conversation:{context['conversation_id']}".encode())
             # Include asset_symbol from context if different
             if 'asset_symbol' in context and context['asset_symbol'] != asset_symbol:
-                key_parts.append(f"ctx_asset:{context['asset_symbol']}")
+                hasher.update(f":ctx_asset:{context['asset_symbol']}".encode())
         
-        key_string = ":".join(key_parts)
-        return hashlib.md5(key_string.encode()).hexdigest()
+        return hasher.hexdigest()
+    
+    def _analysis_index_key(self, asset_symbol: str) -> str:
+        """Cache key of the set of cached analysis keys for an asset"""
+        return f"{CACHE_ANALYSIS}index:{asset_symbol}"
+    
+    def _set_local(self, asset_symbol: str, cache_key: str, value) -> None:
+        """Put a cached analysis in the process-local tier"""
+        _local_cache.set(cache_key, value, LOCAL_CACHE_TTL)
+        _local_keys_by_asset.setdefault(asset_symbol, set()).add(cache_key)
+    
+    def _invalidate_local(self, asset_symbol: str) -> None:
+        """Drop an asset's analyses from the process-local tier"""
+        for cache_key in _local_keys_by_asset.pop(asset_symbol, ()):
+            _local_cache.delete(cache_key)
     
     def _generate_analysis_id(self, analysis: Analysis) -> str:
         """Generate unique ID for analysis"""
         id_string = f"{analysis.query}:{analysis.asset_symbol}:{analysis.created_at}"
-        return hashlib.sha256(id_string.encode()).hexdigest()[:16]
+        return _id_hash(id_string.encode()).hexdigest()[:16]
     
     async def get_cached_analysis(
         self,
@@ -197,7 +345,14 @@ class AnalysisService:
         """Retrieve cached analysis if available"""
         try:
             cache_key = self._generate_cache_key(query, asset_symbol, timeframe, context)
-            cached = self.cache.get(cache_key)
+            
+            # Hot keys are served from the process-local tier without a
+            # round-trip to the shared cache
+            cached = _local_cache.get(cache_key)
+            if cached is None:
+                cached = self.cache.get(cache_key)
+                if cached:
+                    self._set_local(asset_symbol, cache_key, cached)
             
             if cached:
                 logger.info(f"Retrieved cached analysis for {asset_symbol}")
@@ -238,13 +393,13 @@ class AnalysisService:
             
             cached = self._analysis_cache[cache_key]
             
-            # Check if data is still fresh (within 30 minutes)
+            # Check if data is still fresh (within the TTL for its timeframe)
             timestamp = cached.get("timestamp")
             if timestamp:
                 analysis_time = datetime.fromisoformat(timestamp)
                 age = datetime.now() - analysis_time
                 
-                if age > timedelta(minutes=30):
+                if age > timedelta(seconds=cached.get("ttl", ANALYSIS_DEFAULT_TTL)):
                     logger.info(f"Cached analysis for {asset_symbol} is stale ({age.seconds//60} min old)")
                     del self._analysis_cache[cache_key]
                     return None
@@ -260,7 +415,8 @@ class AnalysisService:
         self,
         conversation_id: str,
         asset_symbol: str,
-        analysis: Analysis
+        analysis: Analysis,
+        timeframe: Optional[TimeframeVO] = None
     ):
         """Store analysis in simple cache for future use"""
         try:
@@ -269,9 +425,13 @@ class AnalysisService:
             # Store analysis data
             self._analysis_cache[cache_key] = {
                 "timestamp": datetime.now().isoformat(),
-                "outlook": analysis.outlook.value,
+                "ttl": (
+                    ANALYSIS_TTL_BY_TIMEFRAME[timeframe.timeframe] if timeframe else ANALYSIS_DEFAULT_TTL
+                ),
+                # str-enum members compare and hash as their values
+                "outlook": analysis.outlook,
                 "confidence": analysis.overall_confidence,
-                "trading_action": analysis.trading_action.value,
+                "trading_action": analysis.trading_action,
                 "technical_score": getattr(analysis.technical_analysis, 'confidence', 0.5) if analysis.technical_analysis else 0.5,
                 "sentiment_score": getattr(analysis.sentiment_analysis, 'confidence', 0.5) if analysis.sentiment_analysis else 0.5,
                 "fundamental_score": getattr(analysis.macro_analysis, 'confidence', 0.5) if analysis.macro_analysis else 0.5,
@@ -295,13 +455,15 @@ class AnalysisService:
             # Reconstruct analysis from cached data
             analysis_dict = cached_analysis.get("analysis_dict", {})
             
+            outlook = MarketOutlook(cached_analysis.get("outlook", "neutral"))
+            
             # Create a new analysis with the cached data but updated query
             analysis = Analysis(
                 query=query,
                 asset_symbol=asset_symbol,
-                executive_summary=cached_analysis.get("outlook", "neutral"),
+                executive_summary=outlook.value,
                 investment_thesis="Based on previous analysis",
-                outlook=MarketOutlook(cached_analysis.get("outlook", "neutral")),
+                outlook=outlook,
                 overall_confidence=cached_analysis.get("confidence", 0.5),
                 risk_level=RiskLevel.MEDIUM,
                 risk_score=0.5,
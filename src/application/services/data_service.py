@@ -48,7 +48,8 @@ class DataService:
             
             # Cache result
             if market_data:
-                self.cache.set(
+                # Best effort: a lost write only costs a refetch
+                self.cache.set_async(
                     cache_key,
                     market_data.to_dict(),
                     ttl=300,  # 5 minutes
@@ -169,11 +170,35 @@ class DataService:
         """
         import asyncio
         
-        tasks = [self.get_market_data(symbol) for symbol in symbols]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # One round trip for every cache lookup, then fetch only the misses
+        cache_keys = [f"market:{symbol}" for symbol in symbols]
+        try:
+            cached = self.cache.mget(cache_keys, prefix=CACHE_MARKET_DATA)
+        except Exception as e:
+            logger.error(f"Error reading cached market data: {str(e)}")
+            cached = [None] * len(symbols)
         
-        return {
-            symbol: result if not isinstance(result, Exception) else None
-            for symbol, result in zip(symbols, results)
+        data = {
+            symbol: MarketData.from_dict(hit) if hit else None
+            for symbol, hit in zip(symbols, cached)
         }
-
+        missing = [symbol for symbol in symbols if data[symbol] is None]
+        if not missing:
+            return data
+        
+        tasks = [self._get_crypto_data(symbol) for symbol in missing]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        fetched = {}
+        for symbol, result in zip(missing, results):
+            if isinstance(result, MarketData):
+                data[symbol] = result
+                fetched[f"market:{symbol}"] = result.to_dict()
+        
+        if fetched:
+            try:
+                self.cache.mset(fetched, ttl=300, prefix=CACHE_MARKET_DATA)
+            except Exception as e:
+                logger.error(f"Error caching market data: {str(e)}")
+        
+        return data
@@ -702,7 +702,7 @@ class RAGService:
                 return False
             
             document = RAGDocument(
-                text=f"Economic Indicators: {json.dumps(economic_data, indent=2)}",
+                text=f"Economic Indicators: {json.dumps(economic_data, separators=(',', ':'), ensure_ascii=False)}",
                 metadata={
                     "type": "economic_data",
                     "source": "FRED",
@@ -1,8 +1,27 @@
-import speech_recognition as sr
+import io
 import logging
+from functools import lru_cache
+
+import speech_recognition as sr
+
+try:
+    from faster_whisper import WhisperModel
+    HAS_FASTER_WHISPER = True
+except ImportError:
+    HAS_FASTER_WHISPER = False
 
 logger = logging.getLogger(__name__)
 
+# Local Whisper model size; int8 weights keep CPU inference fast
+WHISPER_MODEL_SIZE = "small"
+
+
+@lru_cache(maxsize=1)
+def _get_whisper_model():
+    """Load the local Whisper model once per process (slow, so on first use)"""
+    return WhisperModel(WHISPER_MODEL_SIZE, device="cpu", compute_type="int8")
+
+
 class SpeechService:
     """Service for Speech-to-Text operations"""
 
@@ -27,7 +46,7 @@ class SpeechService:
                 audio = self.recognizer.listen(source)
                 print("Processing speech...")
             
-            text = self.recognizer.recognize_google(audio, language=language)
+            text = self._transcribe(audio, language)
             logger.info(f"Speech recognized: {text}")
             return text
         except sr.UnknownValueError:
@@ -35,4 +54,28 @@ class SpeechService:
             return "Could not understand audio."
         except sr.RequestError as e:
             logger.error(f"Speech recognition service error: {e}")
-            return f"Speech recognition service error: {e}"
\ No newline at end of file
+            return f"Speech recognition service error: {e}"
+
+    def _transcribe(self, audio: sr.AudioData, language: str) -> str:
+        """
+        Transcribe captured audio, locally with faster-whisper when installed
+
+        Falls back to Google's web recognizer if the local model is missing,
+        fails to load, or doesn't support the language.
+        """
+        if HAS_FASTER_WHISPER:
+            try:
+                segments, _ = _get_whisper_model().transcribe(
+                    io.BytesIO(audio.get_wav_data()),
+                    language=language.split("-")[0].lower()
+                )
+                text = "".join(segment.text for segment in segments).strip()
+                if not text:
+                    raise sr.UnknownValueError()
+                return text
+            except sr.UnknownValueError:
+                raise
+            except Exception as e:
+                logger.warning(f"Local speech recognition failed, using Google: {e}")
+
+        return self.recognizer.recognize_google(audio, language=language)
@@ -1,13 +1,105 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup
 from deep_translator import GoogleTranslator
+from deep_translator.exceptions import RequestError, TooManyRequests, TranslationNotFound
+from deep_translator.validate import is_empty, is_input_valid
 import logging
 
 logger = logging.getLogger(__name__)
 
+# deep-translator issues every request through requests.get, which opens a
+# new connection (and TLS handshake) per call. Our translators send their
+# GETs through this one pooled session instead
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=100))
+
+
+class _PooledGoogleTranslator(GoogleTranslator):
+    """GoogleTranslator whose requests go through the shared pooled session"""
+
+    def translate(self, text: str, **kwargs) -> str:
+        """
+        Translate a text
+
+        Same steps as GoogleTranslator.translate in deep-translator 1.9.1
+        (pinned in requirements.txt - re-check this copy when upgrading),
+        except the GET is sent with _session rather than requests.get.
+        """
+        if is_input_valid(text):
+            text = text.strip()
+            if self._same_source_target() or is_empty(text):
+                return text
+            self._url_params["tl"] = self._target
+            self._url_params["sl"] = self._source
+
+            if self.payload_key:
+                self._url_params[self.payload_key] = text
+
+            response = _session.get(self._base_url, params=self._url_params, proxies=self.proxies)
+            if response.status_code == 429:
+                raise TooManyRequests()
+
+            if response.status_code != 200:
+                raise RequestError()
+
+            soup = BeautifulSoup(response.text, "html.parser")
+            element = soup.find(self._element_tag, self._element_query)
+            response.close()
+
+            if not element:
+                element = soup.find(self._element_tag, self._alt_element_query)
+                if not element:
+                    raise TranslationNotFound(text)
+            if element.get_text(strip=True) == text.strip():
+                to_translate_alpha = "".join(ch for ch in text.strip() if ch.isalnum())
+                translated_alpha = "".join(ch for ch in element.get_text(strip=True) if ch.isalnum())
+                if to_translate_alpha and translated_alpha and to_translate_alpha == translated_alpha:
+                    self._url_params["tl"] = self._target
+                    if "hl" not in self._url_params:
+                        return text.strip()
+                    del self._url_params["hl"]
+                    return self.translate(text)
+            else:
+                return element.get_text(strip=True)
+
+
+# Concurrent requests per translate_batch call (bounded by the session pool)
+BATCH_MAX_WORKERS = 8
+
+# GoogleTranslator keeps per-call state on the instance (_url_params), so
+# instances are reused per thread rather than shared across threads
+_thread_local = threading.local()
+
+
+def _get_translator(src: str, dest: str) -> _PooledGoogleTranslator:
+    """Get this thread's translator for a language pair"""
+    translators: Dict[Tuple[str, str], _PooledGoogleTranslator] = getattr(_thread_local, "translators", None)
+    if translators is None:
+        translators = _thread_local.translators = {}
+
+    translator = translators.get((src, dest))
+    if translator is None:
+        translator = translators[(src, dest)] = _PooledGoogleTranslator(source=src, target=dest)
+    return translator
+
+
+@lru_cache(maxsize=1024)
+def _cached_translate(text: str, src: str, dest: str) -> str:
+    """Translate via Google, memoized so repeated phrases skip the API call"""
+    return _get_translator(src, dest).translate(text)
+
+
 class TranslationService:
     """Service for text translation"""
 
     def __init__(self):
-        # deep-translator creates translator instances per request
+        # Translators and the HTTP session are shared at module level
         pass
 
     def translate_text(self, text: str, src: str, dest: str) -> str:
@@ -23,10 +115,42 @@ class TranslationService:
             Translated text.
         """
         try:
-            translator = GoogleTranslator(source=src, target=dest)
-            translated_text = translator.translate(text)
+            translated_text = _cached_translate(text, src, dest)
             logger.info(f"Translated text: {translated_text}")
             return translated_text
         except Exception as e:
             logger.error(f"Translation failed: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    def translate_batch(self, texts: List[str], src: str, dest: str) -> List[str]:
+        """
+        Translate several texts from one language to another.
+
+        Google's web endpoint takes one text per request (deep-translator's
+        translate_batch is a sequential loop), so duplicates are translated
+        once and the remaining requests run concurrently over the pooled
+        session: wall time is roughly one round-trip instead of one per text.
+
+        Args:
+            texts: Texts to translate.
+            src: Source language code.
+            dest: Destination language code.
+
+        Returns:
+            Translated texts, in input order.
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        if not unique_texts:
+            return []
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(unique_texts))) as executor:
+                translated = dict(zip(
+                    unique_texts,
+                    executor.map(lambda text: _cached_translate(text, src, dest), unique_texts)
+                ))
+            logger.info(f"Translated {len(texts)} texts ({len(unique_texts)} unique)")
+            return [translated[text] for text in texts]
+        except Exception as e:
+            logger.error(f"Batch translation failed: {e}")
+            raise
@@ -1,10 +1,31 @@
-from gtts import gTTS
+import asyncio
 import os
 import tempfile
+import hashlib
 import logging
 
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
 logger = logging.getLogger(__name__)
 
+# Synthesized clips are kept on disk, keyed by (language, text), so repeated
+# phrases skip the gTTS round-trip. The least recently used clips are
+# evicted once the cache holds more than TTS_CACHE_MAX_FILES.
+TTS_CACHE_DIR = os.path.join(tempfile.gettempdir(), "tts_cache")
+TTS_CACHE_MAX_FILES = 512
+
+
+def _content_hash(data: bytes) -> str:
+    """Non-cryptographic content hash used for cache file names"""
+    if HAS_XXHASH:
+        return xxhash.xxh64(data).hexdigest()
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
 class TTSService:
     """Service for Text-to-Speech operations"""
     
@@ -19,15 +40,60 @@ class TTSService:
         Returns:
             Path to the generated audio file.
         """
-        temp_dir = tempfile.gettempdir()
-        filename = f"tts_{os.urandom(8).hex()}.mp3"
-        file_path = os.path.join(temp_dir, filename)
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        key = _content_hash(f"{language}|{text}".encode("utf-8"))
+        file_path = os.path.join(TTS_CACHE_DIR, f"tts_{key}.mp3")
+        
+        if os.path.exists(file_path):
+            # Refresh the timestamp so eviction sees it as recently used
+            os.utime(file_path)
+            logger.info(f"Text-to-speech cache hit: {file_path}")
+            return file_path
         
         try:
+            # Imported on first synthesis: workers that never produce audio
+            # don't pay for gTTS (and its HTTP stack) at import time
+            from gtts import gTTS
+            
             tts = gTTS(text=text, lang=language)
-            tts.save(file_path)
+            # Write under a unique name and rename, so a concurrent request
+            # never picks up a half-written file
+            partial_path = f"{file_path}.{os.urandom(4).hex()}.part"
+            tts.save(partial_path)
+            os.replace(partial_path, file_path)
             logger.info(f"Text-to-speech file saved: {file_path}")
-            return file_path
         except Exception as e:
             logger.error(f"Text-to-speech failed: {e}")
-            raise
\ No newline at end of file
+            raise
+        
+        self._evict_old_files()
+        return file_path
+    
+    async def text_to_speech_async(self, text: str, language="en") -> str:
+        """
+        Convert text to speech without blocking the event loop
+        
+        gTTS does a blocking HTTP request and file write, so the work runs
+        in the default thread pool.
+        
+        Args:
+            text: Text to convert to speech.
+            language: Language code (e.g., 'en', 'yo', 'ha', 'sw', 'zu').
+        
+        Returns:
+            Path to the generated audio file.
+        """
+        return await asyncio.to_thread(self.text_to_speech, text, language)
+    
+    def _evict_old_files(self) -> None:
+        """Delete the least recently used clips beyond TTS_CACHE_MAX_FILES"""
+        try:
+            entries = [entry for entry in os.scandir(TTS_CACHE_DIR) if entry.name.endswith(".mp3")]
+            if len(entries) <= TTS_CACHE_MAX_FILES:
+                return
+            
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in entries[:len(entries) - TTS_CACHE_MAX_FILES]:
+                os.remove(entry.path)
+        except OSError as e:
+            logger.warning(f"Text-to-speech cache eviction failed: {e}")
@@ -66,6 +66,21 @@ CACHE_MARKET_DATA = f"{CACHE_PREFIX}market:"
 CACHE_ANALYSIS = f"{CACHE_PREFIX}analysis:"
 CACHE_NEWS = f"{CACHE_PREFIX}news:"
 
+# Lookback window (days) per timeframe
+TIMEFRAME_DAYS = {
+    Timeframe.SHORT: 30,
+    Timeframe.MEDIUM: 90,
+    Timeframe.LONG: 365
+}
+
+# Analysis cache TTLs (seconds) - short-horizon calls go stale fastest
+ANALYSIS_TTL_BY_TIMEFRAME = {
+    Timeframe.SHORT: 300,
+    Timeframe.MEDIUM: 1800,
+    Timeframe.LONG: 7200
+}
+ANALYSIS_DEFAULT_TTL = 900
+
 # Rate Limits
 RATE_LIMIT_REQUESTS = 100
 RATE_LIMIT_WINDOW = 3600  # 
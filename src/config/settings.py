@@ -1,4 +1,5 @@
 # src/config/settings.py
+from dataclasses import make_dataclass
 from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
@@ -23,8 +24,12 @@ class Settings(BaseSettings):
     
     # Database
     database_url: str = Field(default="sqlite:///./multiasset.db", env="DATABASE_URL")
+    db_pool_size: int = Field(default=10, env="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=20, env="DB_MAX_OVERFLOW")
+    db_pool_recycle: int = Field(default=1800, env="DB_POOL_RECYCLE")  # seconds
     redis_url: str = Field(default="memory://", env="REDIS_URL")
     use_redis: bool = Field(default=False)
+    redis_pool_size: int = Field(default=50, env="REDIS_POOL_SIZE")
 
     # ChromaDB
     chroma_persist_directory: str = Field(default="./chroma_db", env="CHROMA_PERSIST_DIRECTORY")
@@ -39,6 +44,8 @@ class Settings(BaseSettings):
     max_agent_iterations: int = Field(default=5, env="MAX_AGENT_ITERATIONS")
     agent_temperature: float = Field(default=0.7, env="AGENT_TEMPERATURE")
     llm_model: Optional[str] = Field(default=None, env="LLM_MODEL")
+    llm_max_concurrency: int = Field(default=8, env="LLM_MAX_CONCURRENCY")
+    news_scrape_max_concurrency: int = Field(default=2, env="NEWS_SCRAPE_MAX_CONCURRENCY")
     
     # Data Collection Settings
     data_update_interval: int = Field(default=3600, env="DATA_UPDATE_INTERVAL")
@@ -53,7 +60,18 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
+# Read-only snapshot of Settings with the same attribute surface. Pydantic
+# parses and validates the environment once; afterwards reads are plain slot
+# lookups on a frozen object instead of going through the model.
+RuntimeConfig = make_dataclass(
+    "RuntimeConfig",
+    [(name, field_info.annotation) for name, field_info in Settings.model_fields.items()],
+    frozen=True,
+    slots=True
+)
+
+
 @lru_cache()
-def get_settings() -> Settings:
+def get_settings() -> RuntimeConfig:
     """Get cached settings instance"""
-    return Settings()
\ No newline at end of file
+    return RuntimeConfig(**Settings().model_dump())
\ No newline at end of file
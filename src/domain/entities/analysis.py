@@ -77,11 +77,11 @@ class Analysis:
             "asset_symbol": self.asset_symbol,
             "executive_summary": self.executive_summary,
             "investment_thesis": self.investment_thesis,
-            "outlook": self.outlook.value if hasattr(self.outlook, 'value') else self.outlook,
+            "outlook": getattr(self.outlook, "value", self.outlook),
             "overall_confidence": self.overall_confidence,
-            "risk_level": self.risk_level.value if hasattr(self.risk_level, 'value') else self.risk_level,
+            "risk_level": getattr(self.risk_level, "value", self.risk_level),
             "risk_score": self.risk_score,
-            "trading_action": self.trading_action.value if hasattr(self.trading_action, 'value') else self.trading_action,
+            "trading_action": getattr(self.trading_action, "value", self.trading_action),
             "position_sizing": self.position_sizing,
             "entry_points": self.entry_points,
             "stop_loss": self.stop_loss,
@@ -1,9 +1,11 @@
 """
 Conversation Entity - Stores user conversations and context for memory
 """
+import os
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 
 
@@ -56,7 +58,6 @@ class ConversationContext:
     
     def add_message(self, role: MessageRole, content: str, metadata: Optional[Dict] = None) -> ConversationMessage:
         """Add a message to conversation"""
-        import uuid
         msg = ConversationMessage(
             id=str(uuid.uuid4()),
             role=role,
@@ -67,6 +68,39 @@ class ConversationContext:
         self.last_updated = datetime.now()
         return msg
     
+    def add_messages(
+        self,
+        messages: List[Tuple[Any, ...]]
+    ) -> List[ConversationMessage]:
+        """
+        Add several messages at once (e.g. when importing or replaying history)
+        
+        Random bytes for all message ids are read in a single call rather
+        than one entropy read per message.
+        
+        Args:
+            messages: (role, content, metadata[, timestamp]) tuples, in order;
+                messages without a timestamp are stamped with the current time
+            
+        Returns:
+            The created messages
+        """
+        raw = os.urandom(16 * len(messages))
+        now = datetime.now()
+        new_messages = [
+            ConversationMessage(
+                id=str(uuid.UUID(bytes=raw[i * 16:(i + 1) * 16], version=4)),
+                role=role,
+                content=content,
+                timestamp=(rest[0] if rest else None) or now,
+                metadata=metadata or {}
+            )
+            for i, (role, content, metadata, *rest) in enumerate(messages)
+        ]
+        self.messages.extend(new_messages)
+        self.last_updated = now
+        return new_messages
+    
     def get_recent_messages(self, limit: int = 10) -> List[ConversationMessage]:
         """Get most recent messages"""
         return self.messages[-limit:]
@@ -3,7 +3,58 @@ Market Data Entity - Represents market data for an asset
 """
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Sequence, Tuple
+
+import numpy as np
+
+# Numeric fields extracted by MarketData.to_columns
+NUMERIC_FIELDS = (
+    "price", "open_price", "high_price", "low_price", "close_price",
+    "volume", "volume_quote", "market_cap", "circulating_supply",
+    "change_24h", "change_7d", "change_30d", "rsi", "macd", "sma_50", "sma_200",
+    "active_addresses", "transaction_count", "whale_holdings", "exchange_netflow"
+)
+
+# Fields restored by MarketData.from_dict besides the timestamp
+_FROM_DICT_FIELDS = ("asset_symbol", "data_source", "metadata") + NUMERIC_FIELDS
+
+# Label order for the codes returned by MarketData.classify_many
+VOLATILITY_LABELS = ("unknown", "low", "moderate", "high")
+TREND_LABELS = ("neutral", "bullish", "bearish")
+
+
+def classify_arrays(
+    change_24h: np.ndarray,
+    sma_50: np.ndarray,
+    sma_200: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized is_bullish / volatility_indicator / trend_signal
+
+    Missing values are NaN and classify exactly like None does in the
+    per-instance properties.
+
+    Args:
+        change_24h: 24h change percentages (float64)
+        sma_50: 50-period simple moving averages (float64)
+        sma_200: 200-period simple moving averages (float64)
+
+    Returns:
+        Tuple of (volatility codes into VOLATILITY_LABELS as int8,
+        trend codes into TREND_LABELS as int8, bullish flags as bool)
+    """
+    abs_change = np.abs(change_24h)
+    volatility = np.select(
+        [np.isnan(abs_change), abs_change < 2, abs_change < 5],
+        [0, 1, 2],
+        default=3
+    ).astype(np.int8)
+
+    # NaN comparisons are False, so missing averages stay neutral
+    trend = np.select([sma_50 > sma_200, sma_50 < sma_200], [1, 2], default=0).astype(np.int8)
+
+    bullish = change_24h > 0
+    return volatility, trend, bullish
 
 
 @dataclass
@@ -73,6 +124,75 @@ class MarketData:
             return "bearish"
         return "neutral"
     
+    @classmethod
+    def classify_many(
+        cls,
+        rows: Sequence["MarketData"]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Classify many rows at once (screeners, backtests)
+
+        Gathers the inputs into columns once (see to_columns) and classifies
+        them without a Python-level property call per row.
+
+        Args:
+            rows: Market data rows
+
+        Returns:
+            Same as classify_arrays, one element per row
+        """
+        columns = cls.to_columns(rows, fields=("change_24h", "sma_50", "sma_200"))
+        return classify_arrays(columns["change_24h"], columns["sma_50"], columns["sma_200"])
+    
+    @classmethod
+    def to_columns(
+        cls,
+        rows: Sequence["MarketData"],
+        fields: Sequence[str] = NUMERIC_FIELDS
+    ) -> Dict[str, np.ndarray]:
+        """
+        Convert rows to a columnar (struct-of-arrays) layout
+        
+        Aggregations over many assets (mean RSI, correlating change_24h, ...)
+        can then run as NumPy reductions on contiguous float64 arrays instead
+        of reading one attribute per object.
+        
+        Args:
+            rows: Market data rows
+            fields: Numeric fields to extract (all numeric fields by default)
+            
+        Returns:
+            Dict of field name -> float64 array (NaN where None), plus
+            "asset_symbol" as an object array
+        """
+        count = len(rows)
+        columns = {
+            name: np.fromiter(
+                (np.nan if (value := getattr(row, name)) is None else value for row in rows),
+                dtype=np.float64,
+                count=count
+            )
+            for name in fields
+        }
+        columns["asset_symbol"] = np.array([row.asset_symbol for row in rows], dtype=object)
+        return columns
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MarketData":
+        """
+        Rebuild market data from a to_dict() payload (e.g. a cache hit)
+        
+        Every stored field is passed to the constructor, so no default
+        factory runs for it; derived keys (is_bullish, volatility, trend)
+        are ignored since they are recomputed from the fields.
+        """
+        timestamp = data["timestamp"]
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+        
+        kwargs = {name: data[name] for name in _FROM_DICT_FIELDS if name in data}
+        return cls(timestamp=timestamp, **kwargs)
+    
     def to_dict(self) -> dict:
         """Convert to dictionary"""
         return {
@@ -2,7 +2,13 @@
 Timeframe Value Object
 """
 from dataclasses import dataclass
-from src.config.constants import Timeframe
+from src.config.constants import Timeframe, TIMEFRAME_DAYS
+
+_DESCRIPTIONS = {
+    Timeframe.SHORT: "Short-term (days to weeks)",
+    Timeframe.MEDIUM: "Medium-term (weeks to months)",
+    Timeframe.LONG: "Long-term (months to years)"
+}
 
 
 @dataclass(frozen=True)
@@ -19,44 +25,46 @@ class TimeframeVO:
     @property
     def days(self) -> int:
         """Get number of days for timeframe"""
-        mapping = {
-            Timeframe.SHORT: 30,
-            Timeframe.MEDIUM: 90,
-            Timeframe.LONG: 365
-        }
-        return mapping[self.timeframe]
+        return TIMEFRAME_DAYS[self.timeframe]
     
     @property
     def description(self) -> str:
         """Get human-readable description"""
-        descriptions = {
-            Timeframe.SHORT: "Short-term (days to weeks)",
-            Timeframe.MEDIUM: "Medium-term (weeks to months)",
-            Timeframe.LONG: "Long-term (months to years)"
-        }
-        return descriptions[self.timeframe]
+        return _DESCRIPTIONS[self.timeframe]
+    
+    @classmethod
+    def get(cls, timeframe: Timeframe) -> "TimeframeVO":
+        """Get the shared instance for a timeframe"""
+        try:
+            return _INSTANCES[timeframe]
+        except KeyError:
+            raise ValueError("Invalid timeframe type")
     
     @classmethod
     def from_string(cls, timeframe_str: str) -> "TimeframeVO":
         """Create from string"""
-        try:
-            tf = Timeframe(timeframe_str.lower())
-            return cls(timeframe=tf)
-        except ValueError:
+        # Timeframe is a str enum, so the lowered string finds its member's entry
+        instance = _INSTANCES.get(timeframe_str.lower())
+        if instance is None:
             raise ValueError(f"Invalid timeframe: {timeframe_str}")
+        return instance
     
     @classmethod
     def short(cls) -> "TimeframeVO":
         """Create short-term timeframe"""
-        return cls(timeframe=Timeframe.SHORT)
+        return _INSTANCES[Timeframe.SHORT]
     
     @classmethod
     def medium(cls) -> "TimeframeVO":
         """Create medium-term timeframe"""
-        return cls(timeframe=Timeframe.MEDIUM)
+        return _INSTANCES[Timeframe.MEDIUM]
     
     @classmethod
     def long(cls) -> "TimeframeVO":
         """Create long-term timeframe"""
-        return cls(timeframe=Timeframe.LONG)
+        return _INSTANCES[Timeframe.LONG]
+
 
+# There are only three valid states and instances are immutable, so each is
+# built (and validated) once and shared
+_INSTANCES = {tf: TimeframeVO(timeframe=tf) for tf in Timeframe}
@@ -17,9 +17,9 @@ def main():
     logger.info("=" * 60)
     logger.info("MULTI-ASSET AI - API SERVER")
     logger.info("=" * 60)
-    logger.info(f"Environment: {settings.environment}")
-    logger.info(f"Debug Mode: {settings.debug}")
-    logger.info(f"Starting server on {settings.api_host}:{settings.api_port}")
+    logger.info("Environment: %s", settings.environment)
+    logger.info("Debug Mode: %s", settings.debug)
+    logger.info("Starting server on %s:%s", settings.api_host, settings.api_port)
     logger.info("=" * 60)
     
     try:
@@ -29,12 +29,16 @@ def main():
             port=settings.api_port,
             reload=settings.debug,
             log_level=settings.log_level.lower(),
+            # Use uvloop/httptools when installed (uvicorn[standard]); "auto"
+            # falls back to asyncio/h11 where they are not, e.g. on Windows
+            loop="auto",
+            http="auto",
             access_log=True
         )
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
     except Exception as e:
-        logger.error(f"Server error: {str(e)}", exc_info=True)
+        logger.error("Server error: %s", e, exc_info=True)
     finally:
         logger.info("API server stopped")
 
@@ -2,10 +2,16 @@
 Entry point for starting background worker
 """
 import asyncio
-from src.services.data_collector import DataCollector
 from src.config.settings import get_settings
 from src.utilities.logger import get_logger, setup_logging
 
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    # uvloop is unavailable on Windows; the stock loop works everywhere
+    HAS_UVLOOP = False
+
 logger = get_logger(__name__)
 settings = get_settings()
 
@@ -15,10 +21,14 @@ async def main_async():
     logger.info("=" * 60)
     logger.info("MULTI-ASSET AI - BACKGROUND WORKER")
     logger.info("=" * 60)
-    logger.info(f"Environment: {settings.environment}")
-    logger.info(f"Collection Interval: {settings.data_update_interval}s")
+    logger.info("Environment: %s", settings.environment)
+    logger.info("Collection Interval: %ss", settings.data_update_interval)
     logger.info("=" * 60)
     
+    # Imported here: the collector pulls in the API clients (aiohttp, numpy,
+    # requests), the cache (redis) and the RAG service, which dominate startup
+    from src.services.data_collector import DataCollector
+    
     collector = DataCollector()
     
     try:
@@ -27,7 +37,7 @@ async def main_async():
         logger.info("Worker shutdown requested")
         collector.stop()
     except Exception as e:
-        logger.error(f"Worker error: {str(e)}", exc_info=True)
+        logger.error("Worker error: %s", e, exc_info=True)
         collector.stop()
     finally:
         logger.info("Background worker stopped")
@@ -39,7 +49,10 @@ def main():
     setup_logging()
     
     try:
-        asyncio.run(main_async())
+        if HAS_UVLOOP:
+            uvloop.run(main_async())
+        else:
+            asyncio.run(main_async())
     except KeyboardInterrupt:
         logger.info("Received shutdown signal")
 
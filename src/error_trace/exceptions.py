@@ -1,6 +1,7 @@
 """
 Custom Exception Classes
 """
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
 
@@ -43,6 +44,12 @@ class ConfigurationError(MultiAssetAIException):
     pass
 
 
+@lru_cache(maxsize=None)
+def _api_error_code(api_name: str) -> str:
+    """Error code for an API, built once and shared by every error it raises"""
+    return f"{api_name.upper()}_API_ERROR"
+
+
 class ExternalAPIError(MultiAssetAIException):
     """Exception raised when external API call fails"""
     
@@ -55,7 +62,7 @@ class ExternalAPIError(MultiAssetAIException):
     ):
         super().__init__(
             message=message,
-            error_code=f"{api_name.upper()}_API_ERROR",
+            error_code=_api_error_code(api_name),
             details={
                 "api_name": api_name,
                 "status_code": status_code,
@@ -186,6 +186,12 @@ Be objective and critical. High scores (90+) should be rare and reserved for exc
     ) -> str:
         """Create evaluation prompt"""
         
+        # Plain bullet lines cost far fewer tokens than indented JSON arrays
+        risks_text = "\n".join(f"- {risk}" for risk in analysis.get('key_risks', [])) or "- None listed"
+        mitigations_text = "\n".join(
+            f"- {mitigation}" for mitigation in analysis.get('risk_mitigations', [])
+        ) or "- None listed"
+        
         prompt = f"""Evaluate this cryptocurrency market analysis:
 
 **User Query**: {query}
@@ -204,14 +210,14 @@ Be objective and critical. High scores (90+) should be rare and reserved for exc
 {analysis.get('investment_thesis', 'N/A')}
 
 **Risk Factors**:
-{json.dumps(analysis.get('key_risks', []), indent=2)}
+{risks_text}
 
 **Risk Mitigations**:
-{json.dumps(analysis.get('risk_mitigations', []), indent=2)}
+{mitigations_text}
 """
         
         if market_data:
-            prompt += f"\n**Actual Market Data** (for fact-checking):\n{json.dumps(market_data, indent=2)}\n"
+            prompt += f"\n**Actual Market Data** (for fact-checking):\n{json.dumps(market_data, separators=(',', ':'), ensure_ascii=False)}\n"
         
         prompt += "\nProvide your evaluation scores and feedback in JSON format."
         
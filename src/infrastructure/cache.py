@@ -1,18 +1,78 @@
+import atexit
+import queue
+import threading
 from functools import lru_cache
+
+import redis
+
 from src.config.settings import get_settings
+from src.utilities import json_io
 from src.utilities.logger import get_logger
 
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
 logger = get_logger(__name__)
 settings = get_settings()
 
 # Define CACHE_MARKET_DATA constant
 CACHE_MARKET_DATA = "market_data"
 
+# Fire-and-forget writes (set_async): queue bound, and how many writes / how
+# long the background writer gathers before sending one pipeline
+ASYNC_SET_QUEUE_SIZE = 10000
+ASYNC_SET_BATCH = 100
+ASYNC_SET_DELAY = 0.01
+# How long flush_pending waits at exit for queued writes to reach Redis
+ASYNC_SET_FLUSH_TIMEOUT = 5.0
+
+# Keys fetched per SCAN call (and deleted per pipeline) by clear_prefix
+SCAN_CHUNK = 1000
+
+# Redis values carry a one-byte format tag so reads dispatch on it directly
+_TAG_STR = b"S"
+_TAG_JSON = b"J"
+_TAG_ZSTD_JSON = b"Z"
+
+# JSON payloads larger than this are zstd-compressed (when available)
+COMPRESS_MIN_BYTES = 4096
+COMPRESS_LEVEL = 3
+
+
+def _encode(value) -> bytes:
+    """Serialize a cache value with its format tag"""
+    if isinstance(value, str):
+        return _TAG_STR + value.encode('utf-8')
+    payload = json_io.dumps_bytes(value)
+    if HAS_ZSTD and len(payload) > COMPRESS_MIN_BYTES:
+        return _TAG_ZSTD_JSON + zstandard.compress(payload, COMPRESS_LEVEL)
+    return _TAG_JSON + payload
+
+
+def _decode(data: bytes):
+    """Deserialize a tagged cache value (None for a missing key)"""
+    if not data:
+        return None
+    tag, payload = data[:1], data[1:]
+    if tag == _TAG_JSON:
+        return json_io.loads(payload)
+    if tag == _TAG_ZSTD_JSON:
+        return json_io.loads(zstandard.decompress(payload))
+    if tag == _TAG_STR:
+        return payload.decode('utf-8')
+    # Untagged value written before tagging was introduced
+    return data.decode('utf-8')
+
 
 class InMemoryCacheManager:
     """In-memory cache manager for fallback"""
     def __init__(self):
         self.cache = {}
+        # index key -> keys written under it (see replace_indexed)
+        self.indexes = {}
 
     def get(self, key: str, prefix: str = None):
         """Get value from cache, optionally with prefix"""
@@ -33,53 +93,210 @@ class InMemoryCacheManager:
         if key in self.cache:
             del self.cache[key]
 
+    def mget(self, keys: list, prefix: str = None):
+        """Get several values at once (None for missing keys)"""
+        return [self.get(key, prefix) for key in keys]
+
+    def mset(self, items: dict, ttl: int = None, prefix: str = None):
+        """Set several values at once"""
+        for key, value in items.items():
+            self.set(key, value, ttl, prefix)
+
+    def set_async(self, key: str, value, ttl: int = None, prefix: str = None):
+        """Best-effort set (no round trip to wait for in memory)"""
+        self.set(key, value, ttl, prefix)
+
+    def flush_pending(self, timeout: float = None) -> bool:
+        """Nothing is ever queued in memory"""
+        return True
+
+    def replace_indexed(self, index_key: str, key: str, value: str, ttl: int = None):
+        """Delete every key recorded under index_key, then set key and record it"""
+        self.invalidate_index(index_key)
+        self.cache[key] = value
+        self.indexes[index_key] = {key}
+
+    def invalidate_index(self, index_key: str):
+        """Delete every key recorded under index_key, and the index itself"""
+        for key in self.indexes.pop(index_key, ()):
+            self.cache.pop(key, None)
+
+    def clear_prefix(self, prefix: str) -> int:
+        """Delete every key starting with prefix, returning how many were deleted"""
+        keys = [key for key in self.cache if key.startswith(prefix)]
+        for key in keys:
+            del self.cache[key]
+        return len(keys)
+
     def clear(self):
         """Clear all cache"""
         self.cache.clear()
+        self.indexes.clear()
 
     def health_check(self):
         return True
 
 
-if settings.redis_url.startswith("memory://"):
-    # Use in-memory cache
-    _cache_manager = InMemoryCacheManager()
-else:
-    import redis
+class RedisCacheManager:
+    """Manages Redis cache operations"""
+    def __init__(self, redis_url: str, client: redis.Redis = None):
+        if client is None:
+            # One explicitly sized pool shared by every request in the process
+            pool = redis.ConnectionPool.from_url(
+                redis_url,
+                max_connections=settings.redis_pool_size,
+                socket_keepalive=True,
+                socket_timeout=5
+            )
+            client = redis.Redis(connection_pool=pool)
+        self.client = client
+        self.client.ping()
+        # set_async queue and its writer thread (started on first use)
+        self._pending = queue.Queue(maxsize=ASYNC_SET_QUEUE_SIZE)
+        self._writer = None
+        self._writer_lock = threading.Lock()
+        logger.info("Redis cache initialized")
 
-    class RedisCacheManager:
-        """Manages Redis cache operations"""
-        def __init__(self, redis_url: str):
-            self.client = redis.from_url(redis_url)
-            self.client.ping()
-            logger.info("Redis cache initialized")
+    def get(self, key: str, prefix: str = None):
+        """Get value from Redis, optionally with prefix"""
+        if prefix:
+            key = f"{prefix}:{key}"
+        return _decode(self.client.get(key))
 
-        def get(self, key: str, prefix: str = None):
-            """Get value from Redis, optionally with prefix"""
-            if prefix:
-                key = f"{prefix}:{key}"
-            value = self.client.get(key)
-            return value.decode('utf-8') if value else None
+    def set(self, key: str, value, ttl: int = 3600, prefix: str = None):
+        """Set value in Redis, optionally with prefix (str or JSON-serializable)"""
+        if prefix:
+            key = f"{prefix}:{key}"
+        self.client.setex(key, ttl, _encode(value))
 
-        def set(self, key: str, value: str, ttl: int = 3600, prefix: str = None):
-            """Set value in Redis, optionally with prefix"""
-            if prefix:
-                key = f"{prefix}:{key}"
-            self.client.setex(key, ttl, value)
+    def set_async(self, key: str, value, ttl: int = 3600, prefix: str = None):
+        """
+        Queue a best-effort set for the background writer and return at once
+
+        Writes are pipelined in batches off the request path. If the queue
+        is full the write is dropped, so use this only for values that can
+        be recomputed.
+        """
+        if prefix:
+            key = f"{prefix}:{key}"
+        if self._writer is None:
+            self._start_writer()
+        try:
+            self._pending.put_nowait((key, _encode(value), ttl))
+        except queue.Full:
+            logger.warning("Cache write queue full, dropping set for %s", key)
 
-        def delete(self, key: str, prefix: str = None):
-            """Delete a key from Redis"""
+    def flush_pending(self, timeout: float = ASYNC_SET_FLUSH_TIMEOUT) -> bool:
+        """
+        Wait until every queued set_async write has been sent
+
+        Runs at interpreter exit so the daemon writer is not killed with
+        writes still queued. Returns False if the queue did not drain
+        within timeout seconds.
+        """
+        with self._pending.all_tasks_done:
+            return self._pending.all_tasks_done.wait_for(
+                lambda: not self._pending.unfinished_tasks, timeout
+            )
+
+    def _start_writer(self):
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._drain_pending, name="cache-writer", daemon=True
+                )
+                self._writer.start()
+                atexit.register(self.flush_pending)
+
+    def _drain_pending(self):
+        """Background thread: pipeline queued sets to Redis in batches"""
+        while True:
+            batch = [self._pending.get()]
+            try:
+                while len(batch) < ASYNC_SET_BATCH:
+                    batch.append(self._pending.get(timeout=ASYNC_SET_DELAY))
+            except queue.Empty:
+                pass
+
+            try:
+                pipe = self.client.pipeline(transaction=False)
+                for key, data, ttl in batch:
+                    pipe.setex(key, ttl, data)
+                pipe.execute()
+            except Exception as e:
+                logger.error("Error writing %s queued cache sets: %s", len(batch), e)
+            finally:
+                for _ in batch:
+                    self._pending.task_done()
+
+    def delete(self, key: str, prefix: str = None):
+        """Delete a key from Redis"""
+        if prefix:
+            key = f"{prefix}:{key}"
+        self.client.delete(key)
+
+    def mget(self, keys: list, prefix: str = None):
+        """Get several values in one round trip (None for missing keys)"""
+        if not keys:
+            return []
+        if prefix:
+            keys = [f"{prefix}:{key}" for key in keys]
+        return [_decode(value) for value in self.client.mget(keys)]
+
+    def mset(self, items: dict, ttl: int = 3600, prefix: str = None):
+        """Set several values in one round trip"""
+        if not items:
+            return
+        pipe = self.client.pipeline(transaction=False)
+        for key, value in items.items():
             if prefix:
                 key = f"{prefix}:{key}"
-            self.client.delete(key)
+            pipe.setex(key, ttl, _encode(value))
+        pipe.execute()
+
+    def replace_indexed(self, index_key: str, key: str, value, ttl: int = 3600):
+        """Delete every key recorded under index_key, then set key and record it"""
+        stale_keys = self.client.smembers(index_key)
+        # MULTI/EXEC so readers never see the new key next to stale ones
+        pipe = self.client.pipeline(transaction=True)
+        if stale_keys:
+            pipe.delete(*stale_keys)
+        pipe.delete(index_key)
+        pipe.setex(key, ttl, _encode(value))
+        pipe.sadd(index_key, key)
+        pipe.expire(index_key, ttl)
+        pipe.execute()
+
+    def invalidate_index(self, index_key: str):
+        """Delete every key recorded under index_key, and the index itself"""
+        stale_keys = self.client.smembers(index_key)
+        self.client.delete(index_key, *stale_keys)
+
+    def clear_prefix(self, prefix: str) -> int:
+        """Delete every key starting with prefix, returning how many were deleted"""
+        # SCAN walks the keyspace incrementally instead of blocking the
+        # server like KEYS; deletes go out one pipeline per SCAN_CHUNK keys
+        deleted = 0
+        pipe = self.client.pipeline(transaction=False)
+        for i, key in enumerate(self.client.scan_iter(match=f"{prefix}*", count=SCAN_CHUNK), 1):
+            pipe.delete(key)
+            if i % SCAN_CHUNK == 0:
+                deleted += sum(pipe.execute())
+        deleted += sum(pipe.execute())
+        return deleted
 
-        def clear(self):
-            """Clear all cache (use with caution)"""
-            self.client.flushdb()
+    def clear(self):
+        """Clear all cache (use with caution)"""
+        self.client.flushdb()
+
+    def health_check(self):
+        return self.client.ping()
 
-        def health_check(self):
-            return self.client.ping()
 
+if settings.redis_url.startswith("memory://"):
+    # Use in-memory cache
+    _cache_manager = InMemoryCacheManager()
+else:
     _cache_manager = RedisCacheManager(settings.redis_url)
 
 
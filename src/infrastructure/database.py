@@ -1,8 +1,8 @@
 from sqlalchemy import create_engine, MetaData
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.sql import text
-from contextlib import contextmanager, asynccontextmanager
-from typing import Generator, AsyncGenerator
+from contextlib import contextmanager, asynccontextmanager, nullcontext
+from typing import Generator, AsyncGenerator, Any, Dict, List, Optional
 from src.config.settings import get_settings
 from src.utilities.logger import get_logger
 
@@ -10,11 +10,26 @@ logger = get_logger(__name__)
 settings = get_settings()
 
 # Create database engine
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
-    pool_pre_ping=True
-)
+if "sqlite" in settings.database_url:
+    engine = create_engine(
+        settings.database_url,
+        connect_args={"check_same_thread": False},
+        pool_pre_ping=True
+    )
+else:
+    engine = create_engine(
+        settings.database_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        # Recycle before server/proxy idle timeouts close connections under us
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=True
+    )
+
+# Rows per INSERT statement in DatabaseManager.bulk_insert
+BULK_INSERT_CHUNK = 1000
+
+_HEALTH_CHECK_SQL = text("SELECT 1")
 
 # Create session
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -32,7 +47,7 @@ def get_db_session() -> Generator[Session, None, None]:
         db.commit()
     except Exception as e:
         db.rollback()
-        logger.error(f"Database session error: {str(e)}")
+        logger.error("Database session error: %s", e)
         raise
     finally:
         db.close()
@@ -47,7 +62,7 @@ async def get_db_session_async() -> AsyncGenerator[Session, None]:
         db.commit()  # Note: SQLAlchemy ORM is synchronous
     except Exception as e:
         db.rollback()
-        logger.error(f"Database session error: {str(e)}")
+        logger.error("Database session error: %s", e)
         raise
     finally:
         db.close()
@@ -59,7 +74,7 @@ def get_db_dependency() -> Generator[Session, None, None]:
         yield db
     except Exception as e:
         db.rollback()
-        logger.error(f"Database session error: {str(e)}")
+        logger.error("Database session error: %s", e)
         raise
     finally:
         db.close()
@@ -80,7 +95,7 @@ class DatabaseManager:
             session.commit()
         except Exception as e:
             session.rollback()
-            logger.error(f"Error during database session: {str(e)}")
+            logger.error("Error during database session: %s", e)
             raise
         finally:
             session.close()
@@ -95,18 +110,49 @@ class DatabaseManager:
             session.commit()
         except Exception as e:
             session.rollback()
-            logger.error(f"Error during database session: {str(e)}")
+            logger.error("Error during database session: %s", e)
             raise
         finally:
             session.close()
 
+    def bulk_insert(
+        self,
+        table,
+        rows: List[Dict[str, Any]],
+        chunk: int = BULK_INSERT_CHUNK,
+        session: Optional[Session] = None
+    ) -> int:
+        """
+        Insert many rows into a table in one transaction
+
+        Each chunk is a single executemany of a Core INSERT, so N rows cost
+        N / chunk round trips instead of N ORM flushes.
+
+        Args:
+            table: SQLAlchemy Table to insert into
+            rows: Row dicts keyed by column name
+            chunk: Rows per statement
+            session: Session to insert in (committed by its owner); a new
+                one is opened and committed when omitted
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        stmt = table.insert()
+        with (nullcontext(session) if session is not None else self.get_session()) as session:
+            for start in range(0, len(rows), chunk):
+                session.execute(stmt, rows[start:start + chunk])
+        return len(rows)
+
     def create_tables(self):
         """Create all tables"""
         try:
             self.metadata.create_all(bind=self.engine)
             logger.info("Database tables created successfully")
         except Exception as e:
-            logger.error(f"Failed to create tables: {str(e)}")
+            logger.error("Failed to create tables: %s", e)
             raise
 
     def drop_tables(self):
@@ -115,18 +161,18 @@ class DatabaseManager:
             self.metadata.drop_all(bind=self.engine)
             logger.info("Database tables dropped successfully")
         except Exception as e:
-            logger.error(f"Failed to drop tables: {str(e)}")
+            logger.error("Failed to drop tables: %s", e)
             raise
 
     def health_check(self) -> bool:
         """Check database connectivity"""
         try:
             with self.engine.connect() as connection:
-                connection.scalar(text("SELECT 1"))
+                connection.scalar(_HEALTH_CHECK_SQL)
             logger.info("Database health check passed")
             return True
         except Exception as e:
-            logger.error(f"Database health check failed: {str(e)}")
+            logger.error("Database health check failed: %s", e)
             return False
 
 # Global database manager instance
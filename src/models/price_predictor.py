@@ -1,6 +1,7 @@
 """
 Price Prediction Model (pretrained)
 """
+from functools import lru_cache
 from typing import Optional, List
 import numpy as np
 import torch
@@ -10,17 +11,24 @@ from src.utilities.logger import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _load_price_model():
+    """Load (once per process) the pretrained LSTM model from HuggingFace"""
+    model = AutoModelForSequenceClassification.from_pretrained(
+        "borisbanushev/stock-prediction-lstm"
+    )
+    model.eval()  # inference mode
+    logger.info("Loaded pretrained LSTM price prediction model.")
+    return model
+
+
 class PricePredictor:
     """ML model using a pretrained financial LSTM"""
 
     def __init__(self):
         try:
-            # Load pretrained LSTM model from HuggingFace
-            self.model = AutoModelForSequenceClassification.from_pretrained(
-                "borisbanushev/stock-prediction-lstm"
-            )
-            self.model.eval()  # inference mode
-            logger.info("Loaded pretrained LSTM price prediction model.")
+            # Shared across instances; a failed load is retried next time
+            self.model = _load_price_model()
         except Exception as e:
             logger.error(f"Failed to load pretrained model: {e}")
             self.model = None
@@ -44,7 +52,8 @@ class PricePredictor:
             seq = torch.tensor(historical_prices[-50:], dtype=torch.float32)
             seq = seq.unsqueeze(0).unsqueeze(-1)  # shape: (1, seq_len, 1)
 
-            with torch.no_grad():
+            # inference_mode also skips autograd's version-counter bookkeeping
+            with torch.inference_mode():
                 output = self.model(seq)
                 pred = output.logits.squeeze().item()
 
@@ -60,8 +69,14 @@ class PricePredictor:
         if len(historical_prices) < 2:
             return "neutral"
 
-        recent_avg = np.mean(historical_prices[-5:])
-        older_avg = np.mean(historical_prices[-10:-5])
+        # At most ten values - plain sums beat converting to arrays
+        window = historical_prices[-10:]
+        recent, older = window[-5:], window[:-5]
+        if not older:
+            return "neutral"
+
+        recent_avg = sum(recent) / len(recent)
+        older_avg = sum(older) / len(older)
 
         if recent_avg > older_avg * 1.02:
             return "bullish"
@@ -0,0 +1,32 @@
+"""
+Shared concurrency limits for outbound calls
+"""
+import asyncio
+import weakref
+from typing import Dict
+
+# Semaphores are bound to the event loop they first wait on, so keep one set
+# per running loop (scripts and tests may run several loops in one process)
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_semaphore(name: str, limit: int) -> asyncio.Semaphore:
+    """
+    Get a named semaphore shared by all callers on the running event loop
+
+    Args:
+        name: Resource name (e.g. "llm")
+        limit: Maximum concurrent holders, used when the semaphore is created
+
+    Returns:
+        Shared semaphore for the resource
+    """
+    loop = asyncio.get_running_loop()
+    semaphores = _semaphores.setdefault(loop, {})
+
+    semaphore = semaphores.get(name)
+    if semaphore is None:
+        semaphore = semaphores[name] = asyncio.Semaphore(max(1, limit))
+    return semaphore
@@ -3,8 +3,26 @@ Helper Utility Functions
 """
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
+from bisect import bisect_right
 import re
-from src.config.constants import Timeframe, RiskLevel
+from src.config.constants import RiskLevel, TIMEFRAME_DAYS
+
+# Risk score upper bounds (exclusive) for each level, lowest first
+_RISK_THRESHOLDS = (0.2, 0.4, 0.6, 0.8)
+_RISK_LEVELS = (RiskLevel.VERY_LOW, RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.VERY_HIGH)
+
+_SYMBOL_RE = re.compile(r'^[A-Z0-9]+[/-]?[A-Z0-9]*$')
+
+# Common coin names -> ticker
+_CRYPTO_MAP = {
+    "BITCOIN": "BTC",
+    "ETHEREUM": "ETH",
+    "RIPPLE": "XRP",
+    "BINANCE COIN": "BNB",
+    "CARDANO": "ADA",
+    "SOLANA": "SOL",
+    "DOGECOIN": "DOGE"
+}
 
 
 def parse_timeframe_to_days(timeframe: str) -> int:
@@ -17,17 +35,8 @@ def parse_timeframe_to_days(timeframe: str) -> int:
     Returns:
         Number of days
     """
-    mapping = {
-        Timeframe.SHORT: 30,
-        Timeframe.MEDIUM: 90,
-        Timeframe.LONG: 365
-    }
-    
-    try:
-        tf = Timeframe(timeframe.lower())
-        return mapping[tf]
-    except (ValueError, KeyError):
-        return 90  
+    # Timeframe is a str enum, so its members hash and compare as their values
+    return TIMEFRAME_DAYS.get(timeframe.lower(), 90)
 
 
 def format_percentage(value: float, decimals: int = 2) -> str:
@@ -74,18 +83,7 @@ def normalize_asset_symbol(symbol: str) -> str:
         Normalized symbol (uppercase, no spaces)
     """
     normalized = symbol.upper().strip()
-    
-    crypto_map = {
-        "BITCOIN": "BTC",
-        "ETHEREUM": "ETH",
-        "RIPPLE": "XRP",
-        "BINANCE COIN": "BNB",
-        "CARDANO": "ADA",
-        "SOLANA": "SOL",
-        "DOGECOIN": "DOGE"
-    }
-    
-    return crypto_map.get(normalized, normalized)
+    return _CRYPTO_MAP.get(normalized, normalized)
 
 
 def calculate_risk_score(
@@ -127,16 +125,7 @@ def get_risk_level(risk_score: float) -> RiskLevel:
     Returns:
         Risk level enum
     """
-    if risk_score < 0.2:
-        return RiskLevel.VERY_LOW
-    elif risk_score < 0.4:
-        return RiskLevel.LOW
-    elif risk_score < 0.6:
-        return RiskLevel.MEDIUM
-    elif risk_score < 0.8:
-        return RiskLevel.HIGH
-    else:
-        return RiskLevel.VERY_HIGH
+    return _RISK_LEVELS[bisect_right(_RISK_THRESHOLDS, risk_score)]
 
 
 def validate_asset_symbol(symbol: str) -> bool:
@@ -152,8 +141,7 @@ def validate_asset_symbol(symbol: str) -> bool:
     if not symbol or len(symbol) < 2 or len(symbol) > 10:
         return False
     
-    pattern = r'^[A-Z0-9]+[/-]?[A-Z0-9]*$'
-    return bool(re.match(pattern, symbol.upper()))
+    return bool(_SYMBOL_RE.match(symbol.upper()))
 
 
 def get_date_range(days: int) -> tuple:
@@ -0,0 +1,94 @@
+"""
+Fast JSON helpers backed by orjson (falls back to stdlib json)
+"""
+import json
+import re
+from typing import Any, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Raised by loads() on malformed input; orjson's error subclasses ValueError
+JSONDecodeError = orjson.JSONDecodeError if HAS_ORJSON else json.JSONDecodeError
+
+# Markdown code fences LLMs like to wrap JSON answers in
+_FENCE_RE = re.compile(r"```(?:json)?\s*|\s*```", re.IGNORECASE)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document
+
+    Args:
+        data: JSON text or bytes
+
+    Returns:
+        Decoded Python object
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to a JSON string
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON string
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes
+
+    orjson produces bytes natively, so this skips the decode/encode round
+    trip of ``dumps(obj).encode()``.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def extract_object(text: str) -> Any:
+    """
+    Parse the JSON object embedded in an LLM response
+
+    Strips markdown code fences and any prose around the outermost
+    ``{...}`` before parsing.
+
+    Args:
+        text: Raw LLM response text
+
+    Returns:
+        Decoded JSON object
+
+    Raises:
+        JSONDecodeError: If no valid JSON object is found
+    """
+    text = _FENCE_RE.sub("", text)
+    start = text.find("{")
+    end = text.rfind("}")
+    if start != -1 and end > start:
+        text = text[start:end + 1]
+    return loads(text)
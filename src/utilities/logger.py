@@ -1,12 +1,18 @@
 """
 Logging Configuration
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
 from src.config.settings import get_settings
 
+# Writes queued log records to the log file on a background thread
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(
     log_level: Optional[str] = None,
@@ -24,22 +30,45 @@ def setup_logging(
     level = log_level or settings.log_level
     file_path = log_file or settings.log_file
     
+    # The format never shows thread/process details, so skip collecting
+    # them for every LogRecord
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
     # Create logs directory if it doesn't exist
     log_dir = Path(file_path).parent
     log_dir.mkdir(parents=True, exist_ok=True)
     
-    # Configure root logger
+    # Configure root logger (basicConfig is a no-op once handlers exist;
+    # only start the file writer when it will actually be attached)
+    global _queue_listener
+    handlers = [logging.StreamHandler(sys.stdout)]  # Console handler
+    if _queue_listener is None and not logging.getLogger().handlers:
+        # File handler: records are queued and written by a listener thread,
+        # so disk I/O never blocks the event loop
+        file_handler = logging.FileHandler(file_path)
+        file_handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        ))
+        log_queue = queue.Queue(-1)
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
+        atexit.register(_queue_listener.stop)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        # Only merge args/traceback into the message; the file handler
+        # applies the full format on the listener thread
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        handlers.append(queue_handler)
+    
     logging.basicConfig(
         level=getattr(logging, level.upper()),
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S',
-        handlers=[
-            # Console handler
-            logging.StreamHandler(sys.stdout),
-            
-            # File handler
-            logging.FileHandler(file_path)
-        ]
+        handlers=handlers
     )
     
     # Set specific loggers
@@ -0,0 +1,29 @@
+"""
+Shared canned LLM responses for agent tests
+
+Payloads are kept as dicts (the schema) and serialized once at import.
+"""
+import json
+
+# Default reply of the mock_openai_response fixture
+DEFAULT_LLM_RESPONSE = {"summary": "ok", "confidence": 0.75, "key_factors": []}
+MACRO_LLM_RESPONSE = {"summary": "Test", "confidence": 0.8, "key_factors": []}
+TECHNICAL_LLM_RESPONSE = {"summary": "Bullish", "confidence": 0.75, "key_factors": []}
+SENTIMENT_LLM_RESPONSE = {
+    "summary": "Positive",
+    "sentiment_score": 65,
+    "confidence": 0.7,
+    "key_factors": []
+}
+SYNTHESIS_LLM_RESPONSE = {
+    "executive_summary": "Test",
+    "outlook": "bullish",
+    "trading_action": "buy",
+    "confidence": 0.75
+}
+
+DEFAULT_LLM_JSON = json.dumps(DEFAULT_LLM_RESPONSE)
+MACRO_LLM_JSON = json.dumps(MACRO_LLM_RESPONSE)
+TECHNICAL_LLM_JSON = json.dumps(TECHNICAL_LLM_RESPONSE)
+SENTIMENT_LLM_JSON = json.dumps(SENTIMENT_LLM_RESPONSE)
+SYNTHESIS_LLM_JSON = json.dumps(SYNTHESIS_LLM_RESPONSE)
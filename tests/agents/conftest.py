@@ -0,0 +1,34 @@
+"""
+Fixtures shared by the agent test modules
+"""
+import pytest
+from types import MappingProxyType
+
+
+@pytest.fixture(scope="session")
+def mock_response():
+    """Mock API response (read-only, shared by the whole session)"""
+    return MappingProxyType({
+        "summary": "Test analysis summary",
+        "confidence": 0.75,
+        "key_factors": ["factor1", "factor2"],
+        "risks": ["risk1"]
+    })
+
+
+async def _no_async_sleep(*args, **kwargs):
+    return None
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Make retry backoff and rate-limit pauses in the agents' clients instant"""
+    monkeypatch.setattr("asyncio.sleep", _no_async_sleep)
+    monkeypatch.setattr("time.sleep", lambda *args, **kwargs: None)
+
+
+@pytest.fixture(autouse=True)
+def _reset_llm_mock(mock_openai_response):
+    """Clear call history on the shared LLM mock (the return value is kept)"""
+    yield
+    mock_openai_response.reset_mock()
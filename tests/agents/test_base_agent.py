@@ -0,0 +1,104 @@
+"""
+Tests for the Base Agent's LLM response cache
+"""
+import pytest
+from collections import OrderedDict
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from src.application.agents import base_agent
+from src.application.agents.base_agent import BaseAgent
+from tests._fixtures_data import DEFAULT_LLM_JSON
+
+
+class _EchoAgent(BaseAgent):
+    """Minimal concrete agent"""
+    
+    def get_system_prompt(self) -> str:
+        return "system"
+    
+    async def analyze(self, query, context=None):
+        return {}
+
+
+def _completion(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock for base_agent (advance with clock.now += s)"""
+    fake = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(base_agent, "time", SimpleNamespace(monotonic=lambda: fake.now))
+    return fake
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    """Agent with an empty LLM cache and a mocked Groq client"""
+    monkeypatch.setattr(BaseAgent, "_llm_cache", OrderedDict())
+    agent = _EchoAgent(name="Echo", description="test")
+    agent.client = MagicMock()
+    agent.client.chat.completions.create = AsyncMock(return_value=_completion(DEFAULT_LLM_JSON))
+    return agent
+
+
+class TestLLMCache:
+    """Tests for the LLM response cache in execute_llm_call"""
+    
+    async def test_identical_prompts_are_served_from_cache(self, agent, clock):
+        """Test a repeated prompt doesn't call the LLM again"""
+        first = await agent.execute_llm_call("system", "prompt")
+        second = await agent.execute_llm_call("system", "prompt")
+        
+        assert first == second == DEFAULT_LLM_JSON
+        agent.client.chat.completions.create.assert_awaited_once()
+    
+    async def test_use_cache_false_bypasses_cache(self, agent, clock):
+        """Test use_cache=False always calls the LLM"""
+        await agent.execute_llm_call("system", "prompt", use_cache=False)
+        await agent.execute_llm_call("system", "prompt", use_cache=False)
+        
+        assert agent.client.chat.completions.create.await_count == 2
+        assert len(BaseAgent._llm_cache) == 0
+    
+    async def test_unparseable_response_is_not_cached(self, agent, clock):
+        """Test a response without a JSON object is not replayed"""
+        agent.client.chat.completions.create.return_value = _completion("Sorry, I can't help")
+        
+        await agent.execute_llm_call("system", "prompt")
+        await agent.execute_llm_call("system", "prompt")
+        
+        assert agent.client.chat.completions.create.await_count == 2
+    
+    async def test_temperature_is_part_of_the_key(self, agent, clock):
+        """Test a different temperature is a cache miss"""
+        await agent.execute_llm_call("system", "prompt", temperature=0.1)
+        await agent.execute_llm_call("system", "prompt", temperature=0.9)
+        
+        assert agent.client.chat.completions.create.await_count == 2
+    
+    async def test_entries_expire_after_ttl(self, agent, clock):
+        """Test an entry older than LLM_CACHE_TTL is a miss"""
+        await agent.execute_llm_call("system", "prompt")
+        
+        clock.now += base_agent.LLM_CACHE_TTL - 1
+        await agent.execute_llm_call("system", "prompt")
+        assert agent.client.chat.completions.create.await_count == 1
+        
+        clock.now += 2
+        await agent.execute_llm_call("system", "prompt")
+        assert agent.client.chat.completions.create.await_count == 2
+    
+    async def test_least_recently_used_entry_is_evicted(self, agent, clock, monkeypatch):
+        """Test the cache keeps at most LLM_CACHE_SIZE entries, dropping the LRU one"""
+        monkeypatch.setattr(base_agent, "LLM_CACHE_SIZE", 2)
+        
+        await agent.execute_llm_call("system", "a")
+        await agent.execute_llm_call("system", "b")
+        await agent.execute_llm_call("system", "a")  # hit: "b" is now least recent
+        await agent.execute_llm_call("system", "c")  # evicts "b"
+        
+        assert len(BaseAgent._llm_cache) == 2
+        assert agent.get_cached_llm_response("system", "a") is not None
+        assert agent.get_cached_llm_response("system", "b") is None
+        assert agent.get_cached_llm_response("system", "c") is not None
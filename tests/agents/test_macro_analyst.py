@@ -0,0 +1,52 @@
+"""
+Tests for the Macro Analyst Agent
+"""
+import pytest
+from unittest.mock import MagicMock
+from tests._fixtures_data import MACRO_LLM_JSON
+
+
+# Built once per module; mocker undoes patches on the shared instance when
+# each test finishes. The agent module (and the SDKs behind it) is imported
+# here rather than at the top, so collection does not pay for it
+
+@pytest.fixture(scope="module")
+def macro_analyst():
+    from src.application.agents.macro_analyst import MacroAnalyst
+    return MacroAnalyst()
+
+
+class TestMacroAnalyst:
+    """Tests for Macro Analyst Agent"""
+    
+    def test_macro_analyst_initialization(self, macro_analyst):
+        """Test agent initialization"""
+        agent = macro_analyst
+        assert agent.name == "Crypto Macro Analyst"
+        assert agent.model == "llama-3.3-70b-versatile"
+    
+    @pytest.mark.parametrize("mock_openai_response", [MACRO_LLM_JSON], indirect=True)
+    async def test_macro_analyst_analyze(self, mocker, fred_mock, macro_analyst, mock_openai_response):
+        """Test macro analysis"""
+        from src.adapters.external.newsapi_client import CryptoNewsScraper
+        
+        agent = macro_analyst
+        fred_mock.get_economic_indicators.return_value = {
+            "fed_funds_rate": 5.33,
+            "inflation_cpi": 3.2
+        }
+        scraper_mock = MagicMock(spec=CryptoNewsScraper, serper_api_key="", serpapi_key="")
+        scraper_mock.scrape_all.return_value = {"sources": {"reddit": [
+            {"title": "Fed rate decision moves Bitcoin"}
+        ]}}
+        mocker.patch.object(agent, 'fred_client', new=fred_mock)
+        mocker.patch.object(agent, 'crypto_scraper', new=scraper_mock)
+        mocker.patch.object(agent, 'execute_llm_call', new=mock_openai_response)
+        
+        result = await agent.analyze("Analyze USD outlook")
+        
+        fred_mock.get_economic_indicators.assert_awaited_once()
+        scraper_mock.scrape_all.assert_called_once()
+        assert "agent_name" in result
+        assert result["agent_name"] == "Crypto Macro Analyst"
+        assert "confidence" in result
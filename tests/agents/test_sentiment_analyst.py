@@ -0,0 +1,37 @@
+"""
+Tests for the Sentiment Analyst Agent
+"""
+import pytest
+from unittest.mock import MagicMock
+from tests._fixtures_data import SENTIMENT_LLM_JSON
+
+
+@pytest.fixture(scope="module")
+def sentiment_analyst():
+    from src.application.agents.sentiment_analyst import SentimentAnalyst
+    return SentimentAnalyst()
+
+
+class TestSentimentAnalyst:
+    """Tests for Sentiment Analyst Agent"""
+    
+    @pytest.mark.parametrize("mock_openai_response", [SENTIMENT_LLM_JSON], indirect=True)
+    async def test_sentiment_analyst_analyze(self, mocker, sentiment_analyst, mock_openai_response):
+        """Test sentiment analysis"""
+        from src.adapters.external.newsapi_client import CryptoNewsScraper
+        
+        agent = sentiment_analyst
+        scraper_mock = MagicMock(spec=CryptoNewsScraper, serper_api_key="", serpapi_key="")
+        scraper_mock.scrape_all.return_value = {"sources": {"coindesk": [
+            {"title": "Bitcoin rises", "source": {"name": "CoinDesk"}}
+        ]}}
+        mocker.patch.object(agent, 'crypto_scraper', new=scraper_mock)
+        mocker.patch.object(agent, 'execute_llm_call', new=mock_openai_response)
+        
+        result = await agent.analyze("Market sentiment", {"asset_symbol": "BTC", "cache": False})
+        
+        scraper_mock.scrape_all.assert_called_once()
+        assert result["asset_symbol"] == "BTC"
+        assert result["sentiment_score"] == 65
+        assert len(result["data_sources"]["fresh_news"]) == 1
+        assert "confidence" in result
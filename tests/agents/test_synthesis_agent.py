@@ -0,0 +1,90 @@
+"""
+Tests for the Synthesis Agent
+"""
+import pytest
+from unittest.mock import AsyncMock
+from tests._fixtures_data import SYNTHESIS_LLM_JSON
+
+
+@pytest.fixture(scope="module")
+def synthesis_agent():
+    from src.application.agents.synthesis_agent import SynthesisAgent
+    return SynthesisAgent()
+
+
+@pytest.fixture(scope="module")
+def specialist_mock():
+    """Stand-in for a specialist agent's analyze()"""
+    return AsyncMock(return_value={
+        "agent_name": "Test Agent",
+        "summary": "Test summary",
+        "confidence": 0.75,
+        "key_factors": ["factor1"],
+        "data_sources": ["source1"],
+        "detailed_analysis": {}
+    })
+
+
+@pytest.fixture(autouse=True)
+def _reset_specialist_mock(specialist_mock):
+    """Clear call history on the shared specialist mock"""
+    yield
+    specialist_mock.reset_mock()
+
+
+class TestSynthesisAgent:
+    """Tests for Synthesis Agent"""
+    
+    def test_synthesis_agent_initialization(self, synthesis_agent):
+        """Test synthesis agent initialization"""
+        agent = synthesis_agent
+        assert agent.name == "Synthesis Agent"
+        assert agent.macro_analyst is not None
+        assert agent.technical_analyst is not None
+        assert agent.sentiment_analyst is not None
+    
+    @pytest.mark.parametrize("mock_openai_response", [SYNTHESIS_LLM_JSON], indirect=True)
+    async def test_synthesis_agent_coordination(self, mocker, synthesis_agent, specialist_mock, mock_openai_response):
+        """Test agent coordination"""
+        agent = synthesis_agent
+        
+        # Mock specialist agents
+        mocker.patch.object(agent.macro_analyst, 'analyze', new=specialist_mock)
+        mocker.patch.object(agent.technical_analyst, 'analyze', new=specialist_mock)
+        mocker.patch.object(agent.sentiment_analyst, 'analyze', new=specialist_mock)
+        mocker.patch.object(agent, 'execute_llm_call', new=mock_openai_response)
+        
+        result = await agent.analyze("Test query", {"asset_symbol": "BTC"})
+        
+        assert result is not None
+        assert result.asset_symbol == "BTC"
+        assert result.macro_analysis is not None
+        assert result.technical_analysis is not None
+        assert result.sentiment_analysis is not None
+    
+    async def test_only_requested_specialists_count(self, mocker, synthesis_agent):
+        """Test specialists left out of context["agents"] are not run or averaged in"""
+        agent = synthesis_agent
+        technical = AsyncMock(return_value={
+            "summary": "Strong uptrend",
+            "trend": "bullish",
+            "confidence": 0.9
+        })
+        macro = AsyncMock()
+        sentiment = AsyncMock()
+        mocker.patch.object(agent.macro_analyst, 'analyze', new=macro)
+        mocker.patch.object(agent.technical_analyst, 'analyze', new=technical)
+        mocker.patch.object(agent.sentiment_analyst, 'analyze', new=sentiment)
+        
+        result = await agent.analyze("Test query", {"asset_symbol": "BTC", "agents": ["technical"]})
+        
+        technical.assert_awaited_once()
+        macro.assert_not_called()
+        sentiment.assert_not_called()
+        assert result.overall_confidence == 0.9
+        assert result.outlook.value == "bullish"
+        assert result.macro_analysis is None
+        assert result.sentiment_analysis is None
+        assert result.technical_analysis.confidence == 0.9
+        assert "Macro analyst" not in result.executive_summary
+        assert "Sentiment analyst" not in result.executive_summary
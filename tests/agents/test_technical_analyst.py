@@ -0,0 +1,73 @@
+"""
+Tests for the Technical Analyst Agent
+"""
+import pytest
+from tests._fixtures_data import TECHNICAL_LLM_JSON
+
+
+@pytest.fixture(scope="module")
+def technical_analyst():
+    from src.application.agents.technical_analyst import TechnicalAnalyst
+    return TechnicalAnalyst()
+
+
+@pytest.fixture
+def coingecko_data(coingecko_mock, sample_ohlc):
+    """CoinGeckoClient mock answering with canned BTC market data"""
+    coingecko_mock.normalize_symbol.return_value = "bitcoin"
+    coingecko_mock.get_coins_markets.return_value = [{
+        "price_change_percentage_24h_in_currency": 2.5,
+        "sparkline_in_7d": {"price": [45000.0, 45200.0]}
+    }]
+    coingecko_mock.get_simple_price.return_value = {"bitcoin": {
+        "usd": 45000.0,
+        "usd_24h_change": 2.5,
+        "usd_24h_vol": 1000000.0,
+        "usd_market_cap": 880000000000.0
+    }}
+    coingecko_mock.get_coin_ohlc.return_value = list(sample_ohlc)
+    coingecko_mock.get_coin_data.return_value = {"market_data": {
+        "high_24h": {"usd": 46000.0},
+        "low_24h": {"usd": 44000.0}
+    }}
+    coingecko_mock.get_coin_tickers.return_value = {"tickers": []}
+    return coingecko_mock
+
+
+class TestTechnicalAnalyst:
+    """Tests for Technical Analyst Agent"""
+    
+    def test_technical_analyst_initialization(self, technical_analyst):
+        """Test agent initialization"""
+        agent = technical_analyst
+        assert agent.name == "Technical Analyst"
+    
+    @pytest.mark.parametrize("mock_openai_response", [TECHNICAL_LLM_JSON], indirect=True)
+    async def test_technical_analyst_analyze(self, mocker, coingecko_data, technical_analyst, mock_openai_response):
+        """Test technical analysis"""
+        agent = technical_analyst
+        mocker.patch.object(agent, 'coingecko_client', new=coingecko_data)
+        mocker.patch.object(agent, 'execute_llm_call', new=mock_openai_response)
+        
+        result = await agent.analyze("Analyze BTC", {"asset_symbol": "BTC"})
+        
+        coingecko_data.get_coin_ohlc.assert_awaited_once()
+        assert "agent_name" in result
+        assert result["agent_name"] == "Technical Analyst"
+        assert "confidence" in result
+    
+    @pytest.mark.parametrize("mock_openai_response", [TECHNICAL_LLM_JSON], indirect=True)
+    async def test_skip_translation(self, mocker, coingecko_data, technical_analyst, mock_openai_response):
+        """Test skip_translation leaves the query and the summary untranslated"""
+        agent = technical_analyst
+        mocker.patch.object(agent, 'coingecko_client', new=coingecko_data)
+        mocker.patch.object(agent, 'execute_llm_call', new=mock_openai_response)
+        translate = mocker.patch.object(agent.translation_service, 'translate_text')
+        
+        result = await agent.analyze(
+            "Analyse du BTC", {"asset_symbol": "BTC", "language": "fr", "skip_translation": True}
+        )
+        
+        translate.assert_not_called()
+        assert "Analyse du BTC" in mock_openai_response.await_args.kwargs["user_prompt"]
+        assert result["summary"] == "Bullish"
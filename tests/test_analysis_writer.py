@@ -0,0 +1,165 @@
+"""
+Tests for the batched analysis writer
+"""
+import asyncio
+import logging
+import weakref
+import pytest
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+from src.application.services import analysis_service
+from src.application.services.analysis_service import _AnalysisWriter
+from src.config.constants import MarketOutlook, RiskLevel, TradingAction
+from src.domain.entities.analysis import Analysis, AgentAnalysis
+from src.infrastructure.orm import analysis_table
+
+
+def _analysis(query: str) -> Analysis:
+    return Analysis(
+        query=query,
+        asset_symbol="BTC",
+        executive_summary="summary",
+        investment_thesis="thesis",
+        outlook=MarketOutlook.BULLISH,
+        overall_confidence=0.8,
+        risk_level=RiskLevel.MEDIUM,
+        risk_score=0.2,
+        trading_action=TradingAction.BUY,
+        position_sizing="medium",
+        entry_points=[42000.0],
+        technical_analysis=AgentAnalysis(agent_name="Technical Analyst", summary="uptrend", confidence=0.8)
+    )
+
+
+class _FakeDatabase:
+    """DatabaseManager stand-in recording the queries of each inserted batch"""
+    
+    def __init__(self, failing_batches=0, dialect="sqlite"):
+        self.batches = []
+        self.sessions = []
+        self.failing_batches = failing_batches
+        self.dialect = dialect
+    
+    @contextmanager
+    def get_session(self):
+        session = MagicMock()
+        session.get_bind.return_value.dialect.name = self.dialect
+        self.sessions.append(session)
+        yield session
+    
+    def bulk_insert(self, table, rows, session=None):
+        assert table is analysis_table
+        assert session is self.sessions[-1]
+        if self.failing_batches:
+            self.failing_batches -= 1
+            raise RuntimeError("database is locked")
+        self.batches.append([row["query"] for row in rows])
+        return len(rows)
+
+
+@pytest.fixture(autouse=True)
+def _small_batches(monkeypatch):
+    monkeypatch.setattr(analysis_service, "BATCH_MAX_ROWS", 3)
+    monkeypatch.setattr(analysis_service, "BATCH_MAX_DELAY", 0.05)
+
+
+class TestAnalysisWriter:
+    """Tests for _AnalysisWriter"""
+    
+    async def test_flushes_when_batch_is_full(self):
+        """Test a burst is split into batches of BATCH_MAX_ROWS"""
+        db = _FakeDatabase()
+        writer = _AnalysisWriter(db)
+        
+        for i in range(7):
+            writer.submit(_analysis(f"analysis-{i}"))
+        await writer.flush()
+        
+        assert [len(batch) for batch in db.batches] == [3, 3, 1]
+        assert [a for batch in db.batches for a in batch] == [f"analysis-{i}" for i in range(7)]
+    
+    async def test_flushes_after_batch_window(self):
+        """Test a partial batch is written once BATCH_MAX_DELAY has passed"""
+        db = _FakeDatabase()
+        writer = _AnalysisWriter(db)
+        
+        writer.submit(_analysis("first"))
+        writer.submit(_analysis("second"))
+        await asyncio.sleep(analysis_service.BATCH_MAX_DELAY * 4)
+        
+        assert db.batches == [["first", "second"]]
+        
+        writer.submit(_analysis("third"))
+        await writer.flush()
+        
+        assert db.batches == [["first", "second"], ["third"]]
+    
+    async def test_shutdown_drains_queue(self, monkeypatch):
+        """Test flush_pending_analyses writes everything still queued"""
+        monkeypatch.setattr(analysis_service, "_writers", weakref.WeakKeyDictionary())
+        db = _FakeDatabase()
+        writer = analysis_service._get_writer(db)
+        
+        for i in range(5):
+            writer.submit(_analysis(f"analysis-{i}"))
+        await analysis_service.flush_pending_analyses()
+        
+        assert sum(len(batch) for batch in db.batches) == 5
+    
+    async def test_failed_batch_is_logged_and_writer_continues(self, caplog):
+        """Test a failing INSERT is reported and later batches are still written"""
+        db = _FakeDatabase(failing_batches=1)
+        writer = _AnalysisWriter(db)
+        
+        with caplog.at_level(logging.ERROR):
+            for i in range(4):
+                writer.submit(_analysis(f"analysis-{i}"))
+            await writer.flush()
+        
+        assert "Error storing 3 analyses" in caplog.text
+        assert db.batches == [["analysis-3"]]
+    
+    async def test_submit_snapshots_plain_rows(self):
+        """Test the writer thread gets plain rows and never touches the entity"""
+        db = _FakeDatabase()
+        writer = _AnalysisWriter(db)
+        analysis = _analysis("snapshot")
+        
+        writer.submit(analysis)
+        row = writer._queue.get_nowait()
+        
+        assert "id" not in row
+        assert row["outlook"] == "bullish"
+        assert row["trading_action"] == "buy"
+        assert row["technical_analysis"]["summary"] == "uptrend"
+        assert row["macro_analysis"] is None
+        assert row["entry_points"] == [42000.0] and row["entry_points"] is not analysis.entry_points
+        assert not hasattr(analysis, "_sa_instance_state")
+        await writer.flush()
+    
+    async def test_postgres_batch_uses_async_commit_session(self):
+        """Test SET LOCAL runs in the same session the rows are inserted in"""
+        db = _FakeDatabase(dialect="postgresql")
+        writer = _AnalysisWriter(db)
+        
+        writer.submit(_analysis("pg"))
+        await writer.flush()
+        
+        db.sessions[0].execute.assert_called_once_with(analysis_service._ASYNC_COMMIT_SQL)
+        assert db.batches == [["pg"]]
+    
+    async def test_rows_insert_into_analysis_table(self, sqlite_db):
+        """Test snapshot rows are accepted by the real table"""
+        writer = _AnalysisWriter(sqlite_db)
+        
+        for i in range(4):
+            writer.submit(_analysis(f"analysis-{i}"))
+        await writer.flush()
+        
+        with sqlite_db.engine.connect() as connection:
+            rows = connection.execute(
+                analysis_table.select().order_by(analysis_table.c.id)
+            ).mappings().all()
+        assert [row["query"] for row in rows] == [f"analysis-{i}" for i in range(4)]
+        assert rows[0]["outlook"] == "bullish"
+        assert rows[0]["technical_analysis"].confidence == 0.8
@@ -0,0 +1,54 @@
+"""
+Tests for API Routes
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.adapters.web import api_routes
+
+
+@pytest.fixture(scope="module")
+def client():
+    app = FastAPI()
+    app.include_router(api_routes.router)
+    return TestClient(app)
+
+
+class TestTranslateBatch:
+    """Tests for the batch translation route"""
+    
+    def test_translate_batch(self, client, mocker):
+        """Test texts are translated in order"""
+        translate_batch = mocker.patch.object(
+            api_routes.translation_service, 'translate_batch', return_value=["Bonjour", "Merci"]
+        )
+        
+        response = client.post("/api/v1/translate-batch", json={
+            "texts": ["Hello", "Thanks"], "src": "en", "dest": "fr"
+        })
+        
+        assert response.status_code == 200
+        assert response.json() == {"translated_texts": ["Bonjour", "Merci"]}
+        translate_batch.assert_called_once_with(["Hello", "Thanks"], "en", "fr")
+    
+    def test_rejects_too_many_texts(self, client, mocker):
+        """Test a batch over TRANSLATE_BATCH_MAX_TEXTS is rejected before translating"""
+        translate_batch = mocker.patch.object(api_routes.translation_service, 'translate_batch')
+        
+        response = client.post("/api/v1/translate-batch", json={
+            "texts": ["Hello"] * (api_routes.TRANSLATE_BATCH_MAX_TEXTS + 1), "src": "en", "dest": "fr"
+        })
+        
+        assert response.status_code == 422
+        translate_batch.assert_not_called()
+    
+    def test_rejects_too_long_text(self, client, mocker):
+        """Test a text over TRANSLATE_TEXT_MAX_CHARS is rejected before translating"""
+        translate_batch = mocker.patch.object(api_routes.translation_service, 'translate_batch')
+        
+        response = client.post("/api/v1/translate-batch", json={
+            "texts": ["a" * (api_routes.TRANSLATE_TEXT_MAX_CHARS + 1)], "src": "en", "dest": "fr"
+        })
+        
+        assert response.status_code == 422
+        translate_batch.assert_not_called()
@@ -0,0 +1,52 @@
+"""
+Tests for the Binance client's array conversion
+"""
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock
+from src.adapters.external.binance_client import BinanceClient, KLINE_VALUE_COLUMNS
+
+
+# Two 12-field kline rows as Binance returns them (prices and volumes as strings)
+KLINES = [
+    [1700000000000, "42000.10", "42500.00", "41800.50", "42300.25", "1234.5",
+     1700086399999, "52000000.75", 1500, "600.25", "25000000.5", "0"],
+    [1700086400000, "42300.25", "43000.00", "42100.00", "42900.00", "987.25",
+     1700172799999, "42000000.00", 1200, "450.00", "19000000.0", "0"],
+]
+
+
+@pytest.fixture
+def client():
+    return BinanceClient(api_key="", api_secret="")
+
+
+class TestKlinesNdarray:
+    """Tests for BinanceClient.get_klines_ndarray"""
+    
+    @pytest.mark.parametrize("rows", [KLINES, [tuple(row) for row in KLINES]], ids=["json", "msgspec"])
+    async def test_converts_rows(self, client, monkeypatch, rows):
+        """Test open times and values come back typed, shaped and in column order"""
+        monkeypatch.setattr(client, "get_klines", AsyncMock(return_value=rows))
+        
+        open_times, values = await client.get_klines_ndarray("BTC/USDT", interval="1d", limit=2)
+        
+        client.get_klines.assert_awaited_once_with("BTC/USDT", interval="1d", limit=2)
+        assert open_times.dtype == np.int64
+        assert open_times.tolist() == [1700000000000, 1700086400000]
+        assert values.dtype == np.float64
+        assert values.shape == (2, len(KLINE_VALUE_COLUMNS))
+        assert KLINE_VALUE_COLUMNS == ("open", "high", "low", "close", "volume", "quote_volume")
+        np.testing.assert_array_equal(values, [
+            [42000.10, 42500.00, 41800.50, 42300.25, 1234.5, 52000000.75],
+            [42300.25, 43000.00, 42100.00, 42900.00, 987.25, 42000000.00],
+        ])
+    
+    async def test_empty_payload(self, client, monkeypatch):
+        """Test no candles gives empty arrays with the same dtypes and column count"""
+        monkeypatch.setattr(client, "get_klines", AsyncMock(return_value=[]))
+        
+        open_times, values = await client.get_klines_ndarray("BTCUSDT")
+        
+        assert open_times.dtype == np.int64 and open_times.shape == (0,)
+        assert values.dtype == np.float64 and values.shape == (0, len(KLINE_VALUE_COLUMNS))
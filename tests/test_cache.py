@@ -0,0 +1,267 @@
+"""
+Tests for the cache value codec, key invalidation and background writer
+"""
+import logging
+import threading
+import fakeredis
+import pytest
+from unittest.mock import MagicMock
+from src.infrastructure import cache
+from src.infrastructure.cache import (
+    InMemoryCacheManager,
+    RedisCacheManager,
+    _decode,
+    _encode,
+)
+
+
+LARGE_VALUE = {"prices": [[1700000000 + i, 42000.5 + i] for i in range(500)]}
+
+
+@pytest.fixture(autouse=True)
+def exit_hooks(monkeypatch):
+    """Collect atexit registrations instead of running them at interpreter exit"""
+    hooks = []
+    monkeypatch.setattr(cache.atexit, "register", hooks.append)
+    return hooks
+
+
+@pytest.fixture
+def redis_cache():
+    """RedisCacheManager on an in-process fake server"""
+    return RedisCacheManager("redis://fake", client=fakeredis.FakeRedis())
+
+
+@pytest.fixture(params=["memory", "redis"])
+def any_cache(request, redis_cache):
+    """Each cache backend in turn"""
+    if request.param == "memory":
+        return InMemoryCacheManager()
+    return redis_cache
+
+
+class TestCodec:
+    """Tests for _encode / _decode"""
+    
+    @pytest.mark.parametrize("value", [
+        "plain text",
+        "",
+        {"symbol": "BTC", "price": 42000.5, "signals": ["buy", None]},
+        [1, 2.5, "three"],
+        0,
+    ])
+    def test_round_trip(self, value):
+        """Test small values come back unchanged"""
+        assert _decode(_encode(value)) == value
+    
+    def test_small_json_is_not_compressed(self):
+        """Test payloads under COMPRESS_MIN_BYTES are stored as plain JSON"""
+        assert _encode({"a": 1})[:1] == cache._TAG_JSON
+    
+    @pytest.mark.skipif(not cache.HAS_ZSTD, reason="zstandard not installed")
+    def test_large_json_is_compressed(self):
+        """Test payloads over COMPRESS_MIN_BYTES are zstd-compressed and round-trip"""
+        data = _encode(LARGE_VALUE)
+        
+        assert data[:1] == cache._TAG_ZSTD_JSON
+        assert len(data) < len(cache.json_io.dumps_bytes(LARGE_VALUE))
+        assert _decode(data) == LARGE_VALUE
+    
+    def test_large_json_without_zstd(self, monkeypatch):
+        """Test large payloads fall back to plain JSON when zstandard is missing"""
+        monkeypatch.setattr(cache, "HAS_ZSTD", False)
+        data = _encode(LARGE_VALUE)
+        
+        assert data[:1] == cache._TAG_JSON
+        assert _decode(data) == LARGE_VALUE
+    
+    def test_untagged_legacy_value(self):
+        """Test values written before tagging decode as strings"""
+        assert _decode(b"legacy-value") == "legacy-value"
+    
+    @pytest.mark.parametrize("data", [None, b""])
+    def test_missing_key(self, data):
+        """Test a missing key decodes to None"""
+        assert _decode(data) is None
+    
+    @pytest.mark.skipif(not cache.HAS_ZSTD, reason="zstandard not installed")
+    def test_redis_stores_compressed_bytes(self, redis_cache):
+        """Test large values go to Redis compressed and read back intact"""
+        redis_cache.set("history", LARGE_VALUE, prefix="market_data")
+        
+        assert redis_cache.client.get("market_data:history")[:1] == cache._TAG_ZSTD_JSON
+        assert redis_cache.get("history", prefix="market_data") == LARGE_VALUE
+
+
+class TestBulk:
+    """Tests for mget / mset"""
+    
+    def test_mset_then_mget(self, any_cache):
+        """Test several values round-trip in order, with None for missing keys"""
+        any_cache.mset({"btc": {"price": 1.0}, "eth": "text"}, ttl=60, prefix="market_data")
+        
+        assert any_cache.mget(["btc", "missing", "eth"], prefix="market_data") == [
+            {"price": 1.0}, None, "text"
+        ]
+    
+    def test_empty_batches(self, any_cache):
+        """Test empty mget / mset are no-ops"""
+        any_cache.mset({})
+        
+        assert any_cache.mget([]) == []
+
+
+class TestInvalidation:
+    """Tests for replace_indexed, invalidate_index and clear_prefix"""
+    
+    def test_replace_indexed_drops_stale_keys(self, any_cache):
+        """Test each replace deletes the keys recorded under the index"""
+        any_cache.replace_indexed("idx:BTC", "analysis:BTC:v1", {"v": 1})
+        any_cache.replace_indexed("idx:BTC", "analysis:BTC:v2", {"v": 2})
+        
+        assert any_cache.get("analysis:BTC:v1") is None
+        assert any_cache.get("analysis:BTC:v2") == {"v": 2}
+    
+    def test_replace_indexed_leaves_other_indexes(self, any_cache):
+        """Test replacing one index does not touch keys under another"""
+        any_cache.replace_indexed("idx:BTC", "analysis:BTC:v1", "btc")
+        any_cache.replace_indexed("idx:ETH", "analysis:ETH:v1", "eth")
+        any_cache.replace_indexed("idx:BTC", "analysis:BTC:v2", "btc2")
+        
+        assert any_cache.get("analysis:ETH:v1") == "eth"
+    
+    def test_invalidate_index(self, any_cache):
+        """Test invalidate_index deletes the recorded keys and the index"""
+        any_cache.replace_indexed("idx:BTC", "analysis:BTC:v1", "btc")
+        any_cache.invalidate_index("idx:BTC")
+        
+        assert any_cache.get("analysis:BTC:v1") is None
+        # A later replace has nothing stale left to delete
+        any_cache.replace_indexed("idx:BTC", "analysis:BTC:v2", "btc2")
+        assert any_cache.get("analysis:BTC:v2") == "btc2"
+    
+    def test_invalidate_unknown_index(self, any_cache):
+        """Test invalidating an index that was never written is a no-op"""
+        any_cache.set("analysis:BTC", "keep")
+        any_cache.invalidate_index("idx:missing")
+        
+        assert any_cache.get("analysis:BTC") == "keep"
+    
+    def test_clear_prefix(self, any_cache):
+        """Test clear_prefix deletes only keys under the prefix and counts them"""
+        for i in range(3):
+            any_cache.set(f"btc_{i}", i, prefix="market_data")
+        any_cache.set("btc", "keep", prefix="sentiment")
+        
+        assert any_cache.clear_prefix("market_data:") == 3
+        assert any_cache.mget(["btc_0", "btc_1", "btc_2"], prefix="market_data") == [None] * 3
+        assert any_cache.get("btc", prefix="sentiment") == "keep"
+    
+    def test_clear_prefix_across_chunks(self, redis_cache, monkeypatch):
+        """Test clear_prefix deletes keys spanning several SCAN_CHUNK pipelines"""
+        monkeypatch.setattr(cache, "SCAN_CHUNK", 4)
+        for i in range(10):
+            redis_cache.set(f"k{i}", i, prefix="market_data")
+        
+        assert redis_cache.clear_prefix("market_data:") == 10
+        assert redis_cache.client.dbsize() == 0
+
+
+class TestAsyncWriter:
+    """Tests for set_async and its background writer"""
+    
+    def test_writes_reach_redis(self, redis_cache):
+        """Test queued sets are written with their TTL once flushed"""
+        for i in range(5):
+            redis_cache.set_async(f"btc_{i}", {"i": i}, ttl=60, prefix="market_data")
+        
+        assert redis_cache.flush_pending(timeout=2)
+        assert redis_cache.mget([f"btc_{i}" for i in range(5)], prefix="market_data") == [
+            {"i": i} for i in range(5)
+        ]
+        assert 0 < redis_cache.client.ttl("market_data:btc_0") <= 60
+    
+    def test_writes_are_pipelined_in_batches(self, redis_cache, monkeypatch):
+        """Test a burst goes out as pipelines of at most ASYNC_SET_BATCH sets"""
+        monkeypatch.setattr(cache, "ASYNC_SET_BATCH", 4)
+        pipelines = []
+        pipeline = redis_cache.client.pipeline
+        
+        def recording_pipeline(**kwargs):
+            pipe = pipeline(**kwargs)
+            pipelines.append(pipe)
+            return pipe
+        
+        monkeypatch.setattr(redis_cache.client, "pipeline", recording_pipeline)
+        for i in range(10):
+            redis_cache.set_async(f"k{i}", i)
+        
+        assert redis_cache.flush_pending(timeout=2)
+        assert redis_cache.client.dbsize() == 10
+        assert all(len(pipe) <= 4 for pipe in pipelines)
+        assert len(pipelines) >= 3
+    
+    def test_writer_starts_once_and_registers_exit_flush(self, redis_cache, exit_hooks):
+        """Test the writer thread is started lazily, once, with an exit flush"""
+        assert redis_cache._writer is None
+        
+        redis_cache.set_async("a", 1)
+        writer = redis_cache._writer
+        redis_cache.set_async("b", 2)
+        
+        assert writer.daemon and writer.is_alive()
+        assert redis_cache._writer is writer
+        assert exit_hooks == [redis_cache.flush_pending]
+    
+    def test_flush_times_out_while_writer_is_blocked(self, exit_hooks):
+        """Test flush_pending reports writes still in flight after timeout"""
+        release = threading.Event()
+        client = MagicMock()
+        client.pipeline.return_value.execute.side_effect = lambda: release.wait(2)
+        redis_cache = RedisCacheManager("redis://fake", client=client)
+        
+        redis_cache.set_async("btc", "value")
+        
+        assert not redis_cache.flush_pending(timeout=0.05)
+        release.set()
+        assert redis_cache.flush_pending(timeout=2)
+    
+    def test_failed_batch_is_logged_and_writer_continues(self, redis_cache, monkeypatch, caplog):
+        """Test a failing pipeline is reported, flushed past, and later writes still land"""
+        pipeline = redis_cache.client.pipeline
+        failing = MagicMock()
+        failing.execute.side_effect = ConnectionError("connection reset")
+        pipelines = iter([failing])
+        monkeypatch.setattr(
+            redis_cache.client, "pipeline", lambda **kwargs: next(pipelines, None) or pipeline(**kwargs)
+        )
+        
+        with caplog.at_level(logging.ERROR):
+            redis_cache.set_async("lost", 1)
+            assert redis_cache.flush_pending(timeout=2)
+        redis_cache.set_async("kept", 2)
+        
+        assert redis_cache.flush_pending(timeout=2)
+        assert "Error writing 1 queued cache sets" in caplog.text
+        assert redis_cache.get("lost") is None
+        assert redis_cache.get("kept") == 2
+    
+    def test_full_queue_drops_write(self, redis_cache, monkeypatch, caplog):
+        """Test set_async drops the write with a warning when the queue is full"""
+        monkeypatch.setattr(redis_cache, "_pending", cache.queue.Queue(maxsize=1))
+        monkeypatch.setattr(redis_cache, "_writer", MagicMock())
+        
+        with caplog.at_level(logging.WARNING):
+            redis_cache.set_async("first", 1)
+            redis_cache.set_async("second", 2)
+        
+        assert redis_cache._pending.qsize() == 1
+        assert "dropping set for second" in caplog.text
+    
+    def test_in_memory_flush_is_immediate(self):
+        """Test the in-memory fallback writes synchronously"""
+        memory = InMemoryCacheManager()
+        memory.set_async("btc", 1)
+        
+        assert memory.flush_pending()
+        assert memory.get("btc") == 1
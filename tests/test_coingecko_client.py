@@ -0,0 +1,54 @@
+"""
+Tests for the CoinGecko client's request coalescing
+"""
+import asyncio
+from src.adapters.external.coingecko_client import CoinGeckoClient
+
+
+class TestRequestCoalescing:
+    """Concurrent identical requests share one fetch"""
+    
+    async def test_concurrent_requests_share_one_fetch(self):
+        """Test two callers get the result of a single upstream call"""
+        client = CoinGeckoClient(api_key="test")
+        release = asyncio.Event()
+        calls = []
+        
+        async def fake_fetch(url, params=None):
+            calls.append(url)
+            await release.wait()
+            return {"ok": True}
+        
+        client._fetch = fake_fetch
+        first = asyncio.create_task(client._request("/coins/bitcoin/tickers"))
+        second = asyncio.create_task(client._request("/coins/bitcoin/tickers"))
+        await asyncio.sleep(0)
+        release.set()
+        
+        assert await first == {"ok": True}
+        assert await second == {"ok": True}
+        assert len(calls) == 1
+        await asyncio.sleep(0)
+        assert client._inflight == {}
+    
+    async def test_cancelling_first_caller_keeps_fetch_for_others(self):
+        """Test the second caller still gets the result when the first is cancelled"""
+        client = CoinGeckoClient(api_key="test")
+        release = asyncio.Event()
+        
+        async def fake_fetch(url, params=None):
+            await release.wait()
+            return {"ok": True}
+        
+        client._fetch = fake_fetch
+        first = asyncio.create_task(client._request("/coins/bitcoin/tickers"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(client._request("/coins/bitcoin/tickers"))
+        await asyncio.sleep(0)
+        
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        
+        assert await second == {"ok": True}
+        assert first.cancelled()
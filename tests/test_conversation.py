@@ -0,0 +1,79 @@
+"""
+Tests for the Conversation entity
+"""
+import uuid
+from datetime import datetime
+from src.domain.entities.conversation import ConversationContext, MessageRole
+
+
+def _conversation():
+    return ConversationContext(conversation_id="conv-1", user_id="user-1", asset_symbol="BTC")
+
+
+class TestAddMessages:
+    """Tests for ConversationContext.add_messages"""
+    
+    def test_ids_are_unique_uuid4(self):
+        """Test every message gets a distinct, valid UUIDv4"""
+        conversation = _conversation()
+        
+        added = conversation.add_messages([(MessageRole.USER, f"message {i}", None) for i in range(50)])
+        
+        ids = [message.id for message in added]
+        assert len(set(ids)) == 50
+        for message_id in ids:
+            parsed = uuid.UUID(message_id)
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+            assert str(parsed) == message_id
+    
+    def test_messages_keep_order_and_fields(self):
+        """Test messages are appended in order after existing ones"""
+        conversation = _conversation()
+        first = conversation.add_message(MessageRole.USER, "hello")
+        
+        added = conversation.add_messages([
+            (MessageRole.USER, "Should I buy BTC?", {"asset_symbol": "BTC"}),
+            (MessageRole.ASSISTANT, "Hold for now.", None),
+        ])
+        
+        assert conversation.messages == [first] + added
+        assert [(m.role, m.content, m.metadata) for m in added] == [
+            (MessageRole.USER, "Should I buy BTC?", {"asset_symbol": "BTC"}),
+            (MessageRole.ASSISTANT, "Hold for now.", {}),
+        ]
+    
+    def test_replayed_timestamps_are_kept(self):
+        """Test given timestamps are kept and missing ones default to now"""
+        conversation = _conversation()
+        asked = datetime(2024, 1, 2, 9, 30)
+        answered = datetime(2024, 1, 2, 9, 31)
+        before = datetime.now()
+        
+        added = conversation.add_messages([
+            (MessageRole.USER, "Should I buy BTC?", None, asked),
+            (MessageRole.ASSISTANT, "Hold for now.", None, answered),
+            (MessageRole.USER, "Thanks", None),
+            (MessageRole.USER, "And ETH?", None, None),
+        ])
+        
+        assert [m.timestamp for m in added[:2]] == [asked, answered]
+        assert added[2].timestamp >= before
+        assert added[3].timestamp == added[2].timestamp
+    
+    def test_last_updated_is_import_time(self):
+        """Test last_updated moves to now, not to the replayed timestamps"""
+        conversation = _conversation()
+        conversation.last_updated = datetime(2000, 1, 1)
+        before = datetime.now()
+        
+        conversation.add_messages([(MessageRole.USER, "old", None, datetime(2024, 1, 1))])
+        
+        assert conversation.last_updated >= before
+    
+    def test_empty_batch(self):
+        """Test adding no messages changes nothing but last_updated"""
+        conversation = _conversation()
+        
+        assert conversation.add_messages([]) == []
+        assert conversation.messages == []
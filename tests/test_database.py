@@ -0,0 +1,79 @@
+"""
+Tests for DatabaseManager.bulk_insert
+"""
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, event, func, select
+
+
+@pytest.fixture
+def prices_table(sqlite_db):
+    """A throwaway table on the in-memory database"""
+    table = Table(
+        "prices",
+        MetaData(),
+        Column("id", Integer, primary_key=True, autoincrement=True),
+        Column("symbol", String(20), nullable=False),
+        Column("price", Integer, nullable=False),
+    )
+    table.create(sqlite_db.engine)
+    return table
+
+
+@pytest.fixture
+def insert_statements(sqlite_db):
+    """INSERT statements sent to the database (one per executemany)"""
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT"):
+            statements.append(len(parameters) if executemany else 1)
+    
+    event.listen(sqlite_db.engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(sqlite_db.engine, "before_cursor_execute", record)
+
+
+def _count(db, table):
+    with db.engine.connect() as connection:
+        return connection.scalar(select(func.count()).select_from(table))
+
+
+class TestBulkInsert:
+    """Tests for DatabaseManager.bulk_insert"""
+    
+    def test_chunks_rows_in_one_session(self, sqlite_db, prices_table, insert_statements, mocker):
+        """Test 5 rows go out as 2+2+1 executemany calls in one committed session"""
+        get_session = mocker.spy(sqlite_db, "get_session")
+        rows = [{"symbol": f"SYM{i}", "price": i} for i in range(5)]
+        
+        assert sqlite_db.bulk_insert(prices_table, rows, chunk=2) == 5
+        
+        assert get_session.call_count == 1
+        assert insert_statements == [2, 2, 1]
+        assert _count(sqlite_db, prices_table) == 5
+    
+    def test_failed_chunk_rolls_back_everything(self, sqlite_db, prices_table):
+        """Test a bad row in a later chunk leaves no rows behind"""
+        rows = [{"symbol": "BTC", "price": 1}, {"symbol": "ETH", "price": 2}, {"symbol": None, "price": 3}]
+        
+        with pytest.raises(Exception):
+            sqlite_db.bulk_insert(prices_table, rows, chunk=2)
+        
+        assert _count(sqlite_db, prices_table) == 0
+    
+    def test_uses_the_given_session(self, sqlite_db, prices_table, mocker):
+        """Test rows go into the caller's session and commit with it"""
+        get_session = mocker.spy(sqlite_db, "get_session")
+        
+        with sqlite_db.get_session() as session:
+            assert sqlite_db.bulk_insert(prices_table, [{"symbol": "BTC", "price": 1}], session=session) == 1
+        
+        assert get_session.call_count == 1
+        assert _count(sqlite_db, prices_table) == 1
+    
+    def test_empty_rows(self, sqlite_db, prices_table, mocker):
+        """Test no rows returns 0 without opening a session"""
+        get_session = mocker.spy(sqlite_db, "get_session")
+        
+        assert sqlite_db.bulk_insert(prices_table, []) == 0
+        get_session.assert_not_called()
@@ -0,0 +1,95 @@
+"""
+Tests for the MarketData entity's vectorized helpers
+"""
+import numpy as np
+import pytest
+from datetime import datetime
+from src.domain.entities.market_data import MarketData, NUMERIC_FIELDS, TREND_LABELS, VOLATILITY_LABELS
+
+
+def _row(change_24h=None, sma_50=None, sma_200=None, symbol="BTC"):
+    return MarketData(
+        asset_symbol=symbol,
+        timestamp=datetime(2024, 1, 1),
+        price=100.0,
+        change_24h=change_24h,
+        sma_50=sma_50,
+        sma_200=sma_200
+    )
+
+
+# change_24h around the 2 / 5 volatility boundaries (both signs), plus None
+CHANGES = [None, 0.0, 1.999, 2.0, -2.0, 4.999, 5.0, -5.0, 12.5, -0.01]
+# (sma_50, sma_200) pairs covering each trend, ties and missing averages
+AVERAGES = [(None, None), (None, 100.0), (100.0, None), (110.0, 100.0), (90.0, 100.0), (100.0, 100.0)]
+
+
+class TestClassifyMany:
+    """classify_many must agree with the per-instance properties"""
+    
+    @pytest.mark.parametrize("change_24h", CHANGES)
+    @pytest.mark.parametrize("sma_50, sma_200", AVERAGES)
+    def test_matches_properties(self, change_24h, sma_50, sma_200):
+        """Test each row's codes decode to the property values"""
+        row = _row(change_24h, sma_50, sma_200)
+        
+        volatility, trend, bullish = MarketData.classify_many([row])
+        
+        assert VOLATILITY_LABELS[volatility[0]] == row.volatility_indicator
+        assert TREND_LABELS[trend[0]] == row.trend_signal
+        assert bool(bullish[0]) is row.is_bullish
+    
+    def test_matches_properties_in_one_batch(self):
+        """Test a mixed batch classifies every row like its properties"""
+        rows = [_row(change, *averages) for change in CHANGES for averages in AVERAGES]
+        
+        volatility, trend, bullish = MarketData.classify_many(rows)
+        
+        assert [VOLATILITY_LABELS[code] for code in volatility] == [r.volatility_indicator for r in rows]
+        assert [TREND_LABELS[code] for code in trend] == [r.trend_signal for r in rows]
+        assert bullish.tolist() == [r.is_bullish for r in rows]
+    
+    def test_empty(self):
+        """Test no rows gives empty code arrays"""
+        volatility, trend, bullish = MarketData.classify_many([])
+        
+        assert len(volatility) == len(trend) == len(bullish) == 0
+
+
+class TestToColumns:
+    """Tests for MarketData.to_columns"""
+    
+    def test_all_numeric_fields(self):
+        """Test every numeric field becomes a float64 column with NaN for None"""
+        rows = [_row(2.5, 110.0, 100.0, symbol="BTC"), _row(None, None, 100.0, symbol="ETH")]
+        
+        columns = MarketData.to_columns(rows)
+        
+        assert set(columns) == set(NUMERIC_FIELDS) | {"asset_symbol"}
+        for name in NUMERIC_FIELDS:
+            assert columns[name].dtype == np.float64
+            assert columns[name].shape == (2,)
+        assert columns["price"].tolist() == [100.0, 100.0]
+        assert columns["change_24h"][0] == 2.5 and np.isnan(columns["change_24h"][1])
+        assert np.isnan(columns["sma_50"][1]) and columns["sma_200"].tolist() == [100.0, 100.0]
+        assert np.isnan(columns["rsi"]).all()
+    
+    def test_fields_subset(self):
+        """Test fields= limits the numeric columns, keeping asset_symbol"""
+        columns = MarketData.to_columns([_row(1.0)], fields=("change_24h", "price"))
+        
+        assert set(columns) == {"change_24h", "price", "asset_symbol"}
+    
+    def test_asset_symbol_column(self):
+        """Test asset_symbol is an object array in row order"""
+        columns = MarketData.to_columns([_row(symbol="BTC"), _row(symbol="ETH")], fields=())
+        
+        assert columns["asset_symbol"].dtype == object
+        assert columns["asset_symbol"].tolist() == ["BTC", "ETH"]
+    
+    def test_empty(self):
+        """Test no rows gives empty, correctly typed columns"""
+        columns = MarketData.to_columns([])
+        
+        assert columns["price"].dtype == np.float64 and columns["price"].shape == (0,)
+        assert columns["asset_symbol"].dtype == object and columns["asset_symbol"].shape == (0,)
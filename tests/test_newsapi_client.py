@@ -0,0 +1,81 @@
+"""
+Tests for the crypto news scraper's batched Google Finance search
+"""
+import logging
+import pytest
+from unittest.mock import MagicMock
+from src.adapters.external.newsapi_client import CryptoNewsScraper, FINANCE_BATCH_NUM
+
+
+def _news(title, snippet=""):
+    return {"title": title, "snippet": snippet, "link": "https://example.com", "source": "Example"}
+
+
+SERPAPI_PAYLOAD = {
+    "news": [
+        _news("Bitcoin climbs past $70k"),
+        _news("BTC miners sell into the rally"),
+        _news("Bitcoin ETF inflows hit a record"),
+        _news("Bitcoin and Ethereum lead the market higher"),
+        _news("Market wrap: majors higher", "Solana outperformed as SOL broke resistance"),
+        _news("Fed holds rates steady", "Equities drift lower"),
+        _news("Dogecoin slides 5%"),
+    ]
+}
+
+
+@pytest.fixture
+def scraper():
+    """Scraper whose SerpAPI call answers with SERPAPI_PAYLOAD"""
+    scraper = CryptoNewsScraper(serpapi_key="test-key")
+    scraper.session.get = MagicMock(return_value=MagicMock(json=MagicMock(return_value=SERPAPI_PAYLOAD)))
+    return scraper
+
+
+def _titles(items):
+    return [item["title"] for item in items]
+
+
+class TestSearchFinanceBatch:
+    """Tests for CryptoNewsScraper.search_finance_batch"""
+    
+    def test_buckets_by_title_and_snippet(self, scraper):
+        """Test items are filed under every asset their title or snippet names"""
+        buckets = scraper.search_finance_batch(["Bitcoin", "Ethereum", "Solana", "Cardano"])
+        
+        assert _titles(buckets["Bitcoin"]) == [
+            "Bitcoin climbs past $70k",
+            "BTC miners sell into the rally",
+            "Bitcoin ETF inflows hit a record",
+            "Bitcoin and Ethereum lead the market higher",
+        ]
+        assert _titles(buckets["Ethereum"]) == ["Bitcoin and Ethereum lead the market higher"]
+        assert _titles(buckets["Solana"]) == ["Market wrap: majors higher"]
+        assert buckets["Cardano"] == []
+        assert {item["asset"] for item in buckets["Ethereum"]} == {"Ethereum"}
+        scraper.session.get.assert_called_once()
+        assert scraper.session.get.call_args.kwargs["params"]["num"] == FINANCE_BATCH_NUM
+    
+    def test_per_asset_cap(self, scraper):
+        """Test each asset keeps at most per_asset items without starving the others"""
+        buckets = scraper.search_finance_batch(["Bitcoin", "Ethereum"], per_asset=2)
+        
+        assert _titles(buckets["Bitcoin"]) == ["Bitcoin climbs past $70k", "BTC miners sell into the rally"]
+        assert _titles(buckets["Ethereum"]) == ["Bitcoin and Ethereum lead the market higher"]
+    
+    def test_unmatched_items_are_logged(self, scraper, caplog):
+        """Test items naming no requested asset are dropped and counted"""
+        with caplog.at_level(logging.INFO):
+            buckets = scraper.search_finance_batch(["Bitcoin", "Dogecoin"], per_asset=3)
+        
+        assert sum(len(items) for items in buckets.values()) == 4
+        # The Fed and Solana items name neither asset; the fourth Bitcoin item is over the cap
+        assert "dropped 2 items naming no tracked asset and 1 over the 3-per-asset cap" in caplog.text
+    
+    def test_without_key_skips_request(self):
+        """Test no SerpAPI key means empty buckets and no request"""
+        scraper = CryptoNewsScraper()
+        scraper.session.get = MagicMock()
+        
+        assert scraper.search_finance_batch(["Bitcoin"]) == {"Bitcoin": []}
+        scraper.session.get.assert_not_called()
@@ -0,0 +1,214 @@
+"""
+Tests for retry with backoff and circuit breaking
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from src.adapters.external import retry
+from src.adapters.external.retry import CircuitBreaker, call_with_retry
+from src.error_trace.exceptions import ExternalAPIError
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock for the retry module (advance with clock.now += s)"""
+    fake = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(retry, "time", SimpleNamespace(monotonic=lambda: fake.now))
+    return fake
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping"""
+    delays = []
+    
+    async def fake_sleep(delay):
+        delays.append(delay)
+    
+    monkeypatch.setattr(retry, "asyncio", SimpleNamespace(sleep=fake_sleep))
+    monkeypatch.setattr(retry.random, "random", lambda: 0.0)
+    return delays
+
+
+@pytest.fixture(autouse=True)
+def _fresh_breakers(monkeypatch):
+    monkeypatch.setattr(retry, "_breakers", {})
+
+
+def _error(status_code=None):
+    return ExternalAPIError(message="boom", api_name="test", status_code=status_code)
+
+
+class TestCallWithRetry:
+    """Tests for call_with_retry"""
+    
+    async def test_retries_transient_errors_with_backoff(self, sleeps):
+        """Test transient failures are retried with doubling delays"""
+        call = AsyncMock(side_effect=[_error(503), _error(), {"ok": True}])
+        
+        result = await call_with_retry("test", call, base_delay=0.2)
+        
+        assert result == {"ok": True}
+        assert call.await_count == 3
+        assert sleeps == [0.2, 0.4]
+    
+    async def test_raises_after_last_attempt(self, sleeps):
+        """Test the last transient error is raised once attempts run out"""
+        call = AsyncMock(side_effect=_error(502))
+        
+        with pytest.raises(ExternalAPIError):
+            await call_with_retry("test", call, attempts=3)
+        
+        assert call.await_count == 3
+    
+    async def test_does_not_retry_client_errors(self, sleeps):
+        """Test a non-transient error is raised at once"""
+        call = AsyncMock(side_effect=_error(404))
+        
+        with pytest.raises(ExternalAPIError):
+            await call_with_retry("test", call)
+        
+        assert call.await_count == 1
+        assert sleeps == []
+    
+    async def test_client_errors_do_not_reset_failure_count(self, sleeps):
+        """Test a 4xx between transient failures doesn't hide an outage"""
+        breaker = retry.get_breaker("test")
+        breaker.failure_threshold = 2
+        
+        with pytest.raises(ExternalAPIError):
+            await call_with_retry("test", AsyncMock(side_effect=_error(503)), attempts=1)
+        with pytest.raises(ExternalAPIError):
+            await call_with_retry("test", AsyncMock(side_effect=_error(400)), attempts=1)
+        with pytest.raises(ExternalAPIError):
+            await call_with_retry("test", AsyncMock(side_effect=_error(503)), attempts=1)
+        
+        assert breaker.is_open
+    
+    async def test_open_circuit_rejects_without_calling(self, sleeps, clock):
+        """Test calls are rejected while the circuit is open"""
+        breaker = retry.get_breaker("test")
+        breaker.failure_threshold = 1
+        breaker.record_failure()
+        call = AsyncMock(return_value={"ok": True})
+        
+        with pytest.raises(ExternalAPIError) as exc_info:
+            await call_with_retry("test", call)
+        
+        assert "circuit open" in exc_info.value.message
+        call.assert_not_awaited()
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions"""
+    
+    def test_opens_at_threshold(self, clock):
+        """Test the circuit opens after failure_threshold failures"""
+        breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=30)
+        
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        
+        assert breaker.is_open
+        assert not breaker.allow_request()
+    
+    def test_success_resets_failures(self, clock):
+        """Test a success clears the consecutive failure count"""
+        breaker = CircuitBreaker("test", failure_threshold=2)
+        
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        
+        assert not breaker.is_open
+    
+    def test_half_open_admits_a_single_trial(self, clock):
+        """Test only one call gets through after the cooldown"""
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+        
+        clock.now += 30
+        
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        assert not breaker.allow_request()
+    
+    def test_trial_success_closes(self, clock):
+        """Test a successful trial closes the circuit"""
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+        clock.now += 30
+        
+        assert breaker.allow_request()
+        breaker.record_success()
+        
+        assert not breaker.is_open
+        assert breaker.allow_request()
+        assert breaker.allow_request()
+    
+    def test_trial_failure_reopens(self, clock):
+        """Test a failed trial re-opens the circuit for a full cooldown"""
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+        clock.now += 30
+        
+        assert breaker.allow_request()
+        breaker.record_failure()
+        
+        assert not breaker.allow_request()
+        clock.now += 29
+        assert not breaker.allow_request()
+        clock.now += 1
+        assert breaker.allow_request()
+    
+    def test_released_trial_frees_the_slot(self, clock):
+        """Test a trial that ends without a verdict lets the next caller probe"""
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+        clock.now += 30
+        
+        assert breaker.allow_request()
+        breaker.release()
+        
+        assert breaker.allow_request()
+
+
+class _FakeResponse:
+    def __init__(self, status, body):
+        self.status = status
+        self._body = body
+    
+    async def read(self):
+        return self._body
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class TestBinanceErrors:
+    """Tests for how Binance error responses reach the retry policy"""
+    
+    @pytest.mark.parametrize("status, body, message", [
+        (418, b"<html><body>IP banned until 1700000000000</body></html>", "IP banned"),
+        (403, b"<html><head><title>403 Forbidden</title></head></html>", "403 Forbidden"),
+        (400, b'{"code": -1121, "msg": "Invalid symbol."}', "Invalid symbol."),
+    ])
+    async def test_error_bodies_keep_status_and_are_not_retried(self, monkeypatch, sleeps, status, body, message):
+        """Test a non-JSON ban page raises with its status and never trips the breaker"""
+        from src.adapters.external import binance_client
+        session = SimpleNamespace(request=MagicMock(return_value=_FakeResponse(status, body)))
+        monkeypatch.setattr(binance_client, "get_session", AsyncMock(return_value=session))
+        
+        with pytest.raises(ExternalAPIError) as exc_info:
+            await binance_client.BinanceClient(api_key="", api_secret="").get_ticker_price("BTCUSDT")
+        
+        assert exc_info.value.details["status_code"] == status
+        assert message in exc_info.value.message
+        assert session.request.call_count == 1
+        assert sleeps == []
+        assert retry.get_breaker("binance").allow_request()
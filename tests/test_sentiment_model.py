@@ -0,0 +1,52 @@
+"""
+Tests for the sentiment model's batched prediction
+"""
+import pytest
+from unittest.mock import MagicMock
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from src.models import sentiment_model
+from src.models.sentiment_model import NEUTRAL_PREDICTION, SentimentModel
+
+
+@pytest.fixture
+def pipeline_stub(monkeypatch):
+    """Stand-in for the Hugging Face pipeline (no model download)"""
+    stub = MagicMock(side_effect=lambda texts, **kwargs: [
+        {"label": "POSITIVE" if "up" in text else "NEGATIVE", "score": 0.9} for text in texts
+    ])
+    monkeypatch.setattr(sentiment_model, "_load_pipeline", lambda: stub)
+    return stub
+
+
+class TestBatchPredict:
+    """Tests for SentimentModel.batch_predict"""
+    
+    def test_single_batched_pipeline_call(self, pipeline_stub):
+        """Test all texts go through one pipeline call with batching and truncation"""
+        texts = ["BTC is up", "ETH is down", "SOL is up"]
+        
+        predictions = SentimentModel().batch_predict(texts)
+        
+        pipeline_stub.assert_called_once_with(texts, batch_size=32, truncation=True)
+        assert [p["sentiment"] for p in predictions] == ["positive", "negative", "positive"]
+        assert predictions[0] == {"sentiment": "positive", "score": 0.9, "confidence": 0.9}
+    
+    def test_neutral_fallback_without_model(self, monkeypatch):
+        """Test a failed model load gives one independent neutral prediction per text"""
+        def failing_load():
+            raise OSError("model download failed")
+        
+        monkeypatch.setattr(sentiment_model, "_load_pipeline", failing_load)
+        
+        predictions = SentimentModel().batch_predict(["a", "b"])
+        
+        assert predictions == [NEUTRAL_PREDICTION, NEUTRAL_PREDICTION]
+        assert predictions[0] is not predictions[1]
+    
+    def test_empty_input(self, pipeline_stub):
+        """Test no texts returns no predictions without calling the model"""
+        assert SentimentModel().batch_predict([]) == []
+        pipeline_stub.assert_not_called()
@@ -1,17 +1,18 @@
 """
 Tests for Application Services
 """
-import pytest
+from datetime import datetime
 from unittest.mock import AsyncMock, patch, MagicMock
 from src.application.services.data_service import DataService
 from src.application.services.analysis_service import AnalysisService
+from src.domain.entities.market_data import MarketData
 from src.domain.value_objects.timeframe import TimeframeVO
+from src.infrastructure.cache import InMemoryCacheManager, CACHE_MARKET_DATA
 
 
 class TestDataService:
     """Tests for Data Service"""
     
-    @pytest.mark.asyncio
     @patch('src.application.services.data_service.BinanceClient')
     async def test_get_market_data(self, mock_binance):
         """Test getting market data"""
@@ -39,7 +40,6 @@ class TestDataService:
                 assert result.price == 45000.0
                 assert result.change_24h == 2.27
     
-    @pytest.mark.asyncio
     @patch('src.application.services.data_service.CoinGeckoClient')
     async def test_get_trending_assets(self, mock_coingecko):
         """Test getting trending assets"""
@@ -60,17 +60,57 @@ class TestDataService:
         assert "global_data" in result
 
 
+    async def test_get_multiple_assets_batches_cache(self):
+        """Test cached symbols come from one mget and only misses are fetched and mset"""
+        cache = InMemoryCacheManager()
+        btc = MarketData(asset_symbol="BTC", timestamp=datetime.now(), price=45000.0)
+        cache.set("market:BTC", btc.to_dict(), prefix=CACHE_MARKET_DATA)
+        service = DataService()
+        service.cache = MagicMock(wraps=cache)
+        eth = MarketData(asset_symbol="ETH", timestamp=datetime.now(), price=2500.0)
+        fetch = AsyncMock(side_effect=lambda symbol: eth if symbol == "ETH" else None)
+        
+        with patch.object(service, "_get_crypto_data", fetch):
+            result = await service.get_multiple_assets(["BTC", "ETH", "DOGE"])
+        
+        assert result["BTC"].price == 45000.0
+        assert result["ETH"] is eth
+        assert result["DOGE"] is None
+        service.cache.mget.assert_called_once_with(
+            ["market:BTC", "market:ETH", "market:DOGE"], prefix=CACHE_MARKET_DATA
+        )
+        service.cache.get.assert_not_called()
+        assert [c.args[0] for c in fetch.call_args_list] == ["ETH", "DOGE"]
+        service.cache.mset.assert_called_once_with(
+            {"market:ETH": eth.to_dict()}, ttl=300, prefix=CACHE_MARKET_DATA
+        )
+    
+    async def test_get_multiple_assets_all_cached(self):
+        """Test a fully cached request makes no API calls and no writes"""
+        cache = InMemoryCacheManager()
+        for symbol in ("BTC", "ETH"):
+            data = MarketData(asset_symbol=symbol, timestamp=datetime.now(), price=1.0)
+            cache.set(f"market:{symbol}", data.to_dict(), prefix=CACHE_MARKET_DATA)
+        service = DataService()
+        service.cache = MagicMock(wraps=cache)
+        
+        with patch.object(service, "_get_crypto_data", AsyncMock()) as fetch:
+            result = await service.get_multiple_assets(["BTC", "ETH"])
+        
+        assert [data.asset_symbol for data in result.values()] == ["BTC", "ETH"]
+        fetch.assert_not_called()
+        service.cache.mset.assert_not_called()
+
+
 class TestAnalysisService:
     """Tests for Analysis Service"""
     
-    @pytest.mark.asyncio
     async def test_analysis_service_initialization(self):
         """Test service initialization"""
         service = AnalysisService()
         assert service.synthesis_agent is not None
         assert service.cache is not None
     
-    @pytest.mark.asyncio
     async def test_analyze_with_cache(self):
         """Test analysis with cached result"""
         service = AnalysisService()
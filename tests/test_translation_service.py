@@ -0,0 +1,76 @@
+"""
+Tests for the Translation Service
+"""
+import importlib.metadata
+import pytest
+import requests
+import deep_translator.google
+from deep_translator.exceptions import RequestError
+from unittest.mock import MagicMock
+from src.application.services import translation_service
+from src.application.services.translation_service import TranslationService
+
+
+@pytest.fixture
+def google_response(mocker):
+    """Answer every GET on the pooled session with a canned Google page"""
+    translation_service._cached_translate.cache_clear()
+    response = MagicMock(status_code=200, text='<div class="result-container">Bonjour</div>')
+    yield mocker.patch.object(translation_service._session, 'get', return_value=response)
+    translation_service._cached_translate.cache_clear()
+
+
+class TestTranslationService:
+    """Tests for TranslationService"""
+    
+    def test_requests_go_through_the_pooled_session(self, google_response, mocker):
+        """Test translations reuse the one pooled session, not requests.get"""
+        direct_get = mocker.patch.object(requests, 'get')
+        service = TranslationService()
+        
+        assert service.translate_text("Hello", src="en", dest="fr") == "Bonjour"
+        assert service.translate_batch(["Good day", "Hi", "Good day"], src="en", dest="fr") == [
+            "Bonjour", "Bonjour", "Bonjour"
+        ]
+        
+        # One GET per unique text, all on the shared session
+        assert google_response.call_count == 3
+        direct_get.assert_not_called()
+    
+    def test_deep_translator_is_not_patched(self):
+        """Test importing the service leaves deep-translator's module untouched"""
+        assert deep_translator.google.requests is requests
+    
+    def test_repeated_text_is_memoized(self, google_response):
+        """Test the same text is only sent once"""
+        service = TranslationService()
+        
+        service.translate_text("Hello", src="en", dest="fr")
+        service.translate_text("Hello", src="en", dest="fr")
+        
+        assert google_response.call_count == 1
+    
+    def test_translator_sends_google_request_on_session(self, google_response):
+        """Test the override builds deep-translator's request and reads its page"""
+        translator = translation_service._PooledGoogleTranslator(source="en", target="fr")
+        
+        assert translator.translate("  Hello  ") == "Bonjour"
+        
+        google_response.assert_called_once()
+        (url,), kwargs = google_response.call_args
+        assert url == translator._base_url
+        assert kwargs["params"]["sl"] == "en"
+        assert kwargs["params"]["tl"] == "fr"
+        assert kwargs["params"][translator.payload_key] == "Hello"
+    
+    def test_failed_request_raises(self, google_response):
+        """Test a non-200 page raises deep-translator's RequestError"""
+        google_response.return_value.status_code = 500
+        translator = translation_service._PooledGoogleTranslator(source="en", target="fr")
+        
+        with pytest.raises(RequestError):
+            translator.translate("Hello")
+    
+    def test_deep_translator_version_matches_override(self):
+        """Test the installed deep-translator is the version the override copies"""
+        assert importlib.metadata.version("deep-translator") == "1.9.1"
@@ -0,0 +1,101 @@
+"""
+Tests for the Text-to-Speech clip cache
+"""
+import os
+import pytest
+from src.application.services import tts_service
+from src.application.services.tts_service import TTSService
+
+
+class _FakeGTTS:
+    """gTTS stand-in that writes the text as the "audio" and records each save"""
+    
+    saves = []
+    fail = False
+    
+    def __init__(self, text, lang):
+        self.text = text
+        self.lang = lang
+    
+    def save(self, path):
+        # The final cache file must not exist while the clip is being written
+        _FakeGTTS.saves.append((path, os.path.exists(path.split(".mp3.")[0] + ".mp3")))
+        if _FakeGTTS.fail:
+            raise ConnectionError("gTTS unreachable")
+        with open(path, "w") as f:
+            f.write(f"{self.lang}:{self.text}")
+
+
+@pytest.fixture(autouse=True)
+def tts_cache(tmp_path, monkeypatch):
+    """Cache in a temp dir holding at most two clips, synthesized by _FakeGTTS"""
+    monkeypatch.setattr(tts_service, "TTS_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(tts_service, "TTS_CACHE_MAX_FILES", 2)
+    monkeypatch.setattr("gtts.gTTS", _FakeGTTS)
+    monkeypatch.setattr(_FakeGTTS, "saves", [])
+    monkeypatch.setattr(_FakeGTTS, "fail", False)
+    return tmp_path
+
+
+def _age(path, seconds):
+    """Push a file's mtime into the past"""
+    mtime = os.stat(path).st_mtime - seconds
+    os.utime(path, (mtime, mtime))
+
+
+class TestTTSCache:
+    """Tests for TTSService.text_to_speech caching"""
+    
+    def test_cache_hit_skips_synthesis(self, tts_cache):
+        """Test repeated text returns the cached file and refreshes its mtime"""
+        service = TTSService()
+        path = service.text_to_speech("Bitcoin is up", language="en")
+        _age(path, 100)
+        aged = os.stat(path).st_mtime
+        
+        assert service.text_to_speech("Bitcoin is up", language="en") == path
+        
+        assert len(_FakeGTTS.saves) == 1
+        assert os.stat(path).st_mtime > aged
+    
+    def test_language_is_part_of_the_key(self):
+        """Test the same text in another language is a separate clip"""
+        service = TTSService()
+        
+        assert service.text_to_speech("Bitcoin", language="en") != service.text_to_speech("Bitcoin", language="fr")
+        assert len(_FakeGTTS.saves) == 2
+    
+    def test_writes_part_file_then_renames(self, tts_cache):
+        """Test the clip is written to a .part file and renamed into place"""
+        path = TTSService().text_to_speech("Hello", language="en")
+        
+        (partial_path, final_existed), = _FakeGTTS.saves
+        assert partial_path.startswith(path + ".") and partial_path.endswith(".part")
+        assert not final_existed
+        assert os.listdir(tts_cache) == [os.path.basename(path)]
+        with open(path) as f:
+            assert f.read() == "en:Hello"
+    
+    def test_failed_synthesis_is_not_cached(self, tts_cache):
+        """Test a gTTS failure raises and leaves no clip behind to serve later"""
+        _FakeGTTS.fail = True
+        
+        with pytest.raises(ConnectionError):
+            TTSService().text_to_speech("Hello")
+        
+        assert not any(name.endswith(".mp3") for name in os.listdir(tts_cache))
+    
+    def test_evicts_least_recently_used(self, tts_cache):
+        """Test clips beyond TTS_CACHE_MAX_FILES are evicted oldest-use first"""
+        service = TTSService()
+        first = service.text_to_speech("first")
+        _age(first, 300)
+        second = service.text_to_speech("second")
+        _age(second, 200)
+        # A hit makes "first" the most recently used clip
+        service.text_to_speech("first")
+        
+        third = service.text_to_speech("third")
+        
+        assert sorted(os.listdir(tts_cache)) == sorted(map(os.path.basename, [first, third]))
+        assert not os.path.exists(second)